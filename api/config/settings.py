@@ -15,6 +15,8 @@ from pathlib import Path
 
 import dj_database_url
 
+from core.cache_url import parse_cache_url
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -101,6 +103,25 @@ DATABASES = {
     )
 }
 
+# Cache
+# Shared across workers once CACHE_URL points at db://, file:// or redis://
+# (see core/cache_url.py); the locmem:// default is per process.
+CACHE_URL = os.getenv("CACHE_URL", "locmem://")
+
+CACHES = {
+    'default': parse_cache_url(CACHE_URL),
+    # Per-process LRU in front of 'default' for read-mostly entries.
+    'tiered': {
+        'BACKEND': 'core.cache_backends.TieredCache',
+        'LOCATION': 'default',
+        'OPTIONS': {
+            'L1_MAX_ENTRIES': int(os.getenv("CACHE_L1_MAX_ENTRIES", "1000")),
+            'L1_TIMEOUT': float(os.getenv("CACHE_L1_SECONDS", "5")),
+            'NEGATIVE_TIMEOUT': float(os.getenv("CACHE_NEGATIVE_SECONDS", "2")),
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
@@ -108,6 +129,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'core.negotiation.PayloadFormatNegotiation',
 }
 
 CORS_ALLOWED_ORIGINS = [
@@ -214,6 +240,71 @@ IMPORT_MATCHES_WEEKEND_MINUTES = int(
 )
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 REQUEST_SLOW_LOG_SECONDS = float(os.getenv("REQUEST_SLOW_LOG_SECONDS", "8"))
+SOCIAL_GRAPH_CACHE_SECONDS = int(os.getenv("SOCIAL_GRAPH_CACHE_SECONDS", "300"))
+PROFILE_STATS_CACHE_SECONDS = int(os.getenv("PROFILE_STATS_CACHE_SECONDS", "300"))
+
+# Content-addressed image store for rating photos (/api/v1/blobs/*).
+BLOB_STORAGE_ROOT = Path(os.getenv("BLOB_STORAGE_ROOT", str(BASE_DIR / "blobs")))
+# Origin prepended to stored blob URLs (e.g. https://api.example.com); empty
+# keeps them relative to the API host.
+BLOB_PUBLIC_BASE_URL = os.getenv("BLOB_PUBLIC_BASE_URL", "")
+BLOB_MAX_BYTES = int(os.getenv("BLOB_MAX_BYTES", str(5 * 1024 * 1024)))
+BLOB_THUMBNAIL_SIZE = int(os.getenv("BLOB_THUMBNAIL_SIZE", "256"))
+# Rows fetched per cursor round-trip for ?stream=json|ndjson list responses.
+STREAMING_CHUNK_SIZE = int(os.getenv("STREAMING_CHUNK_SIZE", "500"))
+# Maximum ids accepted by the matches/teams batch endpoints.
+BATCH_MAX_IDS = int(os.getenv("BATCH_MAX_IDS", "100"))
+# Lifetime of ETag version counters when the cache is process-local
+# (LocMemCache); shared caches keep them until bumped.
+VERSION_LOCAL_TIMEOUT_SECONDS = int(os.getenv("VERSION_LOCAL_TIMEOUT_SECONDS", "30"))
+# Anonymous response cache lifetime (0 disables it) and the per-process
+# L1 entry budget in front of the shared cache.
+RESPONSE_CACHE_SECONDS = int(os.getenv("RESPONSE_CACHE_SECONDS", "60"))
+RESPONSE_CACHE_L1_SIZE = int(os.getenv("RESPONSE_CACHE_L1_SIZE", "256"))
+# Team/league/user search: "memory" (per-process trigram index) or
+# "database" (SQLite FTS5 / Postgres pg_trgm, picked by vendor). Run
+# sync_search_structures after switching so its tables and indexes follow.
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "memory")
+# Seconds between each process's reads of the SearchChange feed, i.e. how
+# long another worker's rename can take to reach this worker's indexes.
+# Feed rows older than the retention are pruned by compute_search_popularity;
+# an index idle for longer is rebuilt instead of synced.
+SEARCH_SYNC_SECONDS = float(os.getenv("SEARCH_SYNC_SECONDS", "5"))
+SEARCH_CHANGE_RETENTION_HOURS = int(os.getenv("SEARCH_CHANGE_RETENTION_HOURS", "48"))
+# Seconds before the autocomplete index reloads popularity counts; name
+# changes rebuild it (in a background thread) once the SearchChange feed
+# shows them.
+SUGGEST_REFRESH_SECONDS = int(os.getenv("SUGGEST_REFRESH_SECONDS", "300"))
+# Seconds a search type keeps its result ids for a normalized query, so
+# paging and repeated keystrokes skip the lookup (0 disables).
+SEARCH_RESULT_CACHE_SECONDS = int(os.getenv("SEARCH_RESULT_CACHE_SECONDS", "30"))
+# Threads shared by views that run independent queries side by side
+# (SearchView types); 1 runs them inline. Each pool thread keeps its own
+# persistent connection (conn_max_age above), so every worker process may
+# hold up to its request threads + PARALLEL_QUERY_WORKERS connections; size
+# the database's max_connections (or pgbouncer pool) for that.
+PARALLEL_QUERY_WORKERS = int(os.getenv("PARALLEL_QUERY_WORKERS", "4"))
+# Seconds a user's rated-matches selector index stays cached; rating writes
+# invalidate it sooner through the version counters.
+RATED_INDEX_CACHE_SECONDS = int(os.getenv("RATED_INDEX_CACHE_SECONDS", "3600"))
+# How strongly precomputed popularity (followers, recent ratings, upcoming
+# fixtures) shifts search ranking; 0 ranks by text only.
+SEARCH_POPULARITY_WEIGHT = float(os.getenv("SEARCH_POPULARITY_WEIGHT", "0.25"))
+# Days of ratings and upcoming fixtures counted by compute_search_popularity.
+SEARCH_POPULARITY_WINDOW_DAYS = int(os.getenv("SEARCH_POPULARITY_WINDOW_DAYS", "30"))
+# Executed searches each process buffers for SearchQueryLog (oldest dropped
+# past this; 0 disables analytics), written in bulk once FLUSH_SIZE are
+# pending or the oldest is FLUSH_SECONDS old.
+SEARCH_ANALYTICS_BUFFER_SIZE = int(os.getenv("SEARCH_ANALYTICS_BUFFER_SIZE", "5000"))
+SEARCH_ANALYTICS_FLUSH_SIZE = int(os.getenv("SEARCH_ANALYTICS_FLUSH_SIZE", "200"))
+SEARCH_ANALYTICS_FLUSH_SECONDS = int(os.getenv("SEARCH_ANALYTICS_FLUSH_SECONDS", "60"))
+# Searches slower than this (milliseconds) are also logged as warnings.
+SEARCH_SLOW_QUERY_MS = int(os.getenv("SEARCH_SLOW_QUERY_MS", "500"))
+# warm_caches (and the optional gunicorn warmup hook): how many top
+# searches, teams and profiles to replay, and the most database connections
+# the replay may hold at once.
+WARMUP_TOP_N = int(os.getenv("WARMUP_TOP_N", "50"))
+WARMUP_DB_CONNECTIONS = int(os.getenv("WARMUP_DB_CONNECTIONS", "2"))
 
 # Shared secret for protected internal cron endpoints (/internal/*).
 CRON_SECRET = os.getenv("CRON_SECRET", "") or os.getenv("CRON-SECRET", "")
@@ -24,6 +24,7 @@ urlpatterns = [
     path('health/', health_view, name='health'),
     path('internal/', include('matches.internal_urls')),
     path('api/v1/auth/', include('core.urls')),
+    path('api/v1/blobs/', include('core.blob_urls')),
     path('api/v1/matches/', include('matches.urls')),
     path('api/v1/', include('social.urls')),
 ]
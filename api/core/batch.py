@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+
+
+def parse_batch_ids(request, param: str = "ids") -> list[int]:
+    # Parses ?ids=1,2,3 preserving first-seen order and dropping duplicates.
+    raw = (request.query_params.get(param) or "").strip()
+    if not raw:
+        raise ParseError(f"{param} is required.")
+    ids = []
+    seen = set()
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if not item.isdigit():
+            raise ParseError(
+                f"{param} must be a comma-separated list of integers."
+            )
+        value = int(item)
+        if value not in seen:
+            seen.add(value)
+            ids.append(value)
+    if not ids:
+        raise ParseError(f"{param} is required.")
+    max_ids = settings.BATCH_MAX_IDS
+    if len(ids) > max_ids:
+        raise ParseError(f"At most {max_ids} {param} per request.")
+    return ids
+
+
+def keyed_batch_payload(ids, found: dict) -> dict:
+    # Requested ids map to their payload or None; misses are listed as well.
+    return {
+        "results": {str(item_id): found.get(item_id) for item_id in ids},
+        "not_found": [item_id for item_id in ids if item_id not in found],
+    }
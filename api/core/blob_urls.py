@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import BlobUploadView, blob_thumbnail_view, blob_view
+
+urlpatterns = [
+    path("", BlobUploadView.as_view(), name="blob-upload"),
+    path("thumbs/<str:name>", blob_thumbnail_view, name="blob-thumbnail"),
+    path("<str:name>", blob_view, name="blob-detail"),
+]
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+
+class LocalLRU:
+    """Small thread-safe LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: float) -> None:
+        if self.max_entries <= 0 or timeout <= 0:
+            self.delete(key)
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_MISSING = object()
+_ABSENT = object()
+
+
+class TieredCache(BaseCache):
+    """Per-process LRU (L1) in front of another configured cache (L2).
+
+    ``LOCATION`` names the shared cache alias. L1 keeps values for
+    ``L1_TIMEOUT`` seconds and remembers misses for ``NEGATIVE_TIMEOUT``, so
+    other workers' writes become visible within those windows. Writes go
+    through to L2; ``add``/``incr``/``decr`` always run on L2 so they stay
+    atomic across workers.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location or "default"
+        self._l1_timeout = float(options.get("L1_TIMEOUT", 5))
+        self._negative_timeout = float(options.get("NEGATIVE_TIMEOUT", 2))
+        self._local = LocalLRU(int(options.get("L1_MAX_ENTRIES", 1000)))
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    def _local_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    def _local_timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self._l1_timeout
+        return min(self._l1_timeout, timeout)
+
+    def get(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        value = self._local.get(local_key, _MISSING)
+        if value is _ABSENT:
+            return default
+        if value is not _MISSING:
+            return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._local.set(local_key, _ABSENT, self._negative_timeout)
+            return default
+        self._local.set(local_key, value, self._l1_timeout)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        pending = []
+        for key in keys:
+            value = self._local.get(self._local_key(key, version), _MISSING)
+            if value is _MISSING:
+                pending.append(key)
+            elif value is not _ABSENT:
+                found[key] = value
+        if pending:
+            fetched = self.shared.get_many(pending, version=version)
+            for key in pending:
+                local_key = self._local_key(key, version)
+                if key in fetched:
+                    found[key] = fetched[key]
+                    self._local.set(local_key, fetched[key], self._l1_timeout)
+                else:
+                    self._local.set(local_key, _ABSENT, self._negative_timeout)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._local.set(
+            self._local_key(key, version), value, self._local_timeout(timeout)
+        )
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout=timeout, version=version)
+        local_timeout = self._local_timeout(timeout)
+        for key, value in data.items():
+            local_key = self._local_key(key, version)
+            if key in failed:
+                self._local.delete(local_key)
+            else:
+                self._local.set(local_key, value, local_timeout)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self._local_key(key, version)
+        self._local.delete(local_key)
+        added = self.shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._local.set(local_key, value, self._local_timeout(timeout))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.decr(key, delta, version=version)
+
+    def has_key(self, key, version=None):
+        value = self._local.get(self._local_key(key, version), _MISSING)
+        if value is _ABSENT:
+            return False
+        if value is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def delete(self, key, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._local.delete(self._local_key(key, version))
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        self._local.clear()
+        self.shared.clear()
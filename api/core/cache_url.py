@@ -0,0 +1,53 @@
+"""
+CACHE_URL parsing for settings, in the spirit of dj-database-url.
+
+    locmem://[name]             per-process memory (default)
+    db://table_name             DatabaseCache (run ``createcachetable``)
+    file:///abs/path            FileBasedCache
+    redis://host:port/db        RedisCache (also rediss://)
+    dummy://                    no-op cache
+
+Query params ``timeout``, ``key_prefix`` and ``max_entries`` are mapped to
+the matching cache settings.
+"""
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "db": "django.core.cache.backends.db.DatabaseCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def parse_cache_url(url: str) -> dict:
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in BACKENDS:
+        raise ValueError(f"Unsupported CACHE_URL scheme: {scheme or url!r}")
+
+    config = {"BACKEND": BACKENDS[scheme]}
+    if scheme in {"redis", "rediss"}:
+        config["LOCATION"] = urlunsplit(
+            (scheme, parts.netloc, parts.path, "", "")
+        )
+    elif scheme == "file":
+        config["LOCATION"] = parts.path
+    elif scheme in {"locmem", "db"}:
+        location = (parts.netloc + parts.path).strip("/")
+        if scheme == "db" and not location:
+            raise ValueError("db:// CACHE_URL needs a table name.")
+        if location:
+            config["LOCATION"] = location
+
+    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    if "timeout" in query:
+        value = query["timeout"]
+        config["TIMEOUT"] = None if value.lower() == "none" else int(value)
+    if "key_prefix" in query:
+        config["KEY_PREFIX"] = query["key_prefix"]
+    if "max_entries" in query:
+        config["OPTIONS"] = {"MAX_ENTRIES": int(query["max_entries"])}
+    return config
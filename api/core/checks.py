@@ -0,0 +1,21 @@
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+
+@register(deploy=True)
+def shared_cache_check(app_configs, **kwargs):
+    # Job locks, rate limits and version counters need a cache that every
+    # worker sees; LocMem is private to one process.
+    if not isinstance(caches["default"], LocMemCache):
+        return []
+    return [
+        Warning(
+            "The default cache is per-process LocMem.",
+            hint=(
+                "Set CACHE_URL to a db://, file:// or redis:// cache so job "
+                "locks, rate limits and ETag versions are shared by all workers."
+            ),
+            id="core.W001",
+        )
+    ]
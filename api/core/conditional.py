@@ -0,0 +1,58 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .services.versions import get_versions, version_datetime
+
+
+def conditional_get(version_keys):
+    """Answers If-None-Match / If-Modified-Since with 304 from version
+    counters, before the view runs its queries.
+
+    ``version_keys(request, *args, **kwargs)`` returns the ``(scope, ident)``
+    pairs the response depends on. The ETag also covers the viewer, path
+    and query string, and Accept header.
+    """
+
+    def _versions(request, *args, **kwargs):
+        cached = getattr(request, "_conditional_versions", None)
+        if cached is None:
+            cached = get_versions(version_keys(request, *args, **kwargs))
+            request._conditional_versions = cached
+        return cached
+
+    def etag_func(request, *args, **kwargs):
+        versions = _versions(request, *args, **kwargs)
+        user = getattr(request, "user", None)
+        viewer = user.pk if user is not None and user.is_authenticated else 0
+        parts = [
+            str(viewer),
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+            *(str(version) for version in versions),
+        ]
+        return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+    def last_modified_func(request, *args, **kwargs):
+        versions = _versions(request, *args, **kwargs)
+        return version_datetime(max(versions)) if versions else None
+
+    def decorator(view_func):
+        conditioned = condition(
+            etag_func=etag_func, last_modified_func=last_modified_func
+        )(view_func)
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            response = conditioned(request, *args, **kwargs)
+            # Responses are per viewer: browsers may store them but must
+            # revalidate, and shared caches must not reuse them.
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ["Authorization"])
+            return response
+
+        return inner
+
+    return decorator
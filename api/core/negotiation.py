@@ -0,0 +1,35 @@
+from rest_framework.negotiation import DefaultContentNegotiation
+
+# ``?format=`` values that select a payload shape rather than a renderer.
+PAYLOAD_FORMATS = frozenset({"normalized"})
+
+
+def get_payload_format(request):
+    value = request.query_params.get("format")
+    return value if value in PAYLOAD_FORMATS else None
+
+
+class _RendererQueryParams:
+    def __init__(self, request, format_param):
+        query_params = request.query_params.copy()
+        query_params.pop(format_param, None)
+        self.query_params = query_params
+        self._request = request
+
+    def __getattr__(self, name):
+        return getattr(self._request, name)
+
+
+class PayloadFormatNegotiation(DefaultContentNegotiation):
+    """Lets ``?format=normalized`` through to the view instead of being
+    treated as an unknown renderer format (which DRF answers with 404)."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        format_param = self.settings.URL_FORMAT_OVERRIDE
+        if (
+            not format_suffix
+            and format_param
+            and request.query_params.get(format_param) in PAYLOAD_FORMATS
+        ):
+            request = _RendererQueryParams(request, format_param)
+        return super().select_renderer(request, renderers, format_suffix)
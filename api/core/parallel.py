@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PARALLEL_QUERY_WORKERS,
+                thread_name_prefix="bbx-query",
+            )
+        return _executor
+
+
+def _timed(func):
+    started = time.perf_counter()
+    return func(), time.perf_counter() - started
+
+
+def _timed_in_worker(func):
+    # Pool threads hold their own connections; recycle them like a request
+    # would so CONN_MAX_AGE and broken connections are honoured.
+    close_old_connections()
+    try:
+        return _timed(func)
+    finally:
+        close_old_connections()
+
+
+def run_concurrently(tasks: dict) -> dict:
+    """Runs ``{name: callable}`` and returns ``{name: (result, seconds)}``.
+
+    Tasks share a process-wide thread pool. They run inline when the pool is
+    disabled or the caller is inside a transaction, whose uncommitted rows
+    other connections could not see.
+    """
+    if (
+        settings.PARALLEL_QUERY_WORKERS <= 1
+        or len(tasks) <= 1
+        or transaction.get_connection().in_atomic_block
+    ):
+        return {name: _timed(func) for name, func in tasks.items()}
+    executor = _get_executor()
+    futures = {name: executor.submit(_timed_in_worker, func) for name, func in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def run_bounded(tasks: dict, workers: int) -> dict:
+    """Runs ``{name: callable}`` on at most ``workers`` short-lived threads.
+
+    For batch jobs such as cache warming: each thread drains the shared
+    queue on one database connection and closes it when done, so the job
+    never holds more than ``workers`` connections. Returns the same shape as
+    run_concurrently and re-raises the first task error once all finished.
+    """
+    if workers <= 1 or len(tasks) <= 1 or transaction.get_connection().in_atomic_block:
+        return {name: _timed(func) for name, func in tasks.items()}
+    pending = queue.SimpleQueue()
+    for item in tasks.items():
+        pending.put(item)
+    results, errors = {}, []
+
+    def drain():
+        try:
+            while True:
+                try:
+                    name, func = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[name] = _timed(func)
+                except Exception as exc:
+                    errors.append(exc)
+        finally:
+            connections.close_all()
+
+    threads = [
+        threading.Thread(target=drain, name=f"bbx-bounded-{index}", daemon=True)
+        for index in range(min(workers, len(tasks)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return {name: results[name] for name in tasks}
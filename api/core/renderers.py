@@ -0,0 +1,63 @@
+import json
+
+from rest_framework.utils import encoders
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional at runtime.
+    orjson = None
+
+
+_LINE_SEPARATORS = (
+    (b"\xe2\x80\xa8", b"\\u2028"),
+    (b"\xe2\x80\xa9", b"\\u2029"),
+)
+_fallback_encoder = encoders.JSONEncoder()
+# Datetimes go through DRF's encoder (ISO 8601 with "Z" for UTC offsets)
+# and non-string keys are stringified, as json.dumps does.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _escape_line_separators(payload: bytes) -> bytes:
+    # Matches JSONRenderer, which escapes U+2028/U+2029 for JSONP safety.
+    if b"\xe2\x80" not in payload:
+        return payload
+    for raw, escaped in _LINE_SEPARATORS:
+        payload = payload.replace(raw, escaped)
+    return payload
+
+
+def json_dumps(data) -> bytes:
+    """Compact UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, default=_fallback_encoder.default, option=_ORJSON_OPTIONS
+        )
+    else:
+        payload = json.dumps(
+            data,
+            cls=encoders.JSONEncoder,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    return _escape_line_separators(payload)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when available.
+
+    Indented output (``Accept: application/json; indent=4``) and the stdlib
+    fallback go through the default DRF implementation.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return json_dumps(data)
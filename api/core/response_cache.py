@@ -0,0 +1,150 @@
+import hashlib
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .cache_backends import LocalLRU
+from .services.versions import get_versions
+
+RESPONSE_CACHE_PREFIX = "respcache"
+
+
+class ResponseCacheMetrics:
+    """Hit/miss counters for this worker process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.l1_hits = 0
+            self.l2_hits = 0
+            self.misses = 0
+            self.stale = 0
+            self.stores = 0
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            hits = self.l1_hits + self.l2_hits
+            lookups = hits + self.misses
+            return {
+                "l1_hits": self.l1_hits,
+                "l2_hits": self.l2_hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "stores": self.stores,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+metrics = ResponseCacheMetrics()
+local_cache = LocalLRU(int(getattr(settings, "RESPONSE_CACHE_L1_SIZE", 256)))
+
+
+def _cache_seconds() -> int:
+    return int(getattr(settings, "RESPONSE_CACHE_SECONDS", 60))
+
+
+def response_cache_params(request) -> list[tuple[str, str]]:
+    # Query params are sorted and blanks dropped so equivalent URLs share
+    # an entry.
+    return sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+        if value != ""
+    )
+
+
+def response_cache_key(request) -> str:
+    # Accept is included because it picks the renderer.
+    params = response_cache_params(request)
+    raw = "|".join(
+        [
+            request.path,
+            "&".join(f"{key}={value}" for key, value in params),
+            request.META.get("HTTP_ACCEPT", ""),
+        ]
+    )
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}:anon:{digest}"
+
+
+def _build_response(entry) -> HttpResponse:
+    _, content, content_type = entry
+    return HttpResponse(content, content_type=content_type)
+
+
+def cached_anonymous_response(tags, on_hit=None):
+    """Caches successful JSON responses for anonymous callers.
+
+    ``tags(request, *args, **kwargs)`` returns the ``(scope, ident)`` version
+    keys the payload depends on; an entry is served only while every tag
+    still has the version it was stored with, so the signal-driven bumps
+    used for ETags invalidate it too. Authenticated requests bypass it.
+    ``on_hit(request, response, seconds)`` runs for responses served from
+    the cache, since the view itself does not.
+    """
+
+    def decorator(view_func):
+        def hit(request, entry, label, started):
+            response = _build_response(entry)
+            response["X-Cache"] = label
+            if on_hit is not None:
+                on_hit(request, response, time.perf_counter() - started)
+            return response
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            timeout = _cache_seconds()
+            if timeout <= 0 or request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+
+            started = time.perf_counter()
+            key = response_cache_key(request)
+            versions = tuple(get_versions(tags(request, *args, **kwargs)))
+
+            entry = local_cache.get(key)
+            if entry is not None and entry[0] == versions:
+                metrics.record("l1_hits")
+                return hit(request, entry, "HIT-L1", started)
+            # L1 may lag a refresh that another worker stored in L2.
+            entry = cache.get(key)
+            if entry is not None and entry[0] == versions:
+                local_cache.set(key, entry, timeout)
+                metrics.record("l2_hits")
+                return hit(request, entry, "HIT-L2", started)
+            metrics.record("stale" if entry is not None else "misses")
+
+            response = view_func(request, *args, **kwargs)
+
+            def store(rendered):
+                content_type = rendered.get("Content-Type", "")
+                if rendered.status_code != 200 or not content_type.startswith(
+                    "application/json"
+                ):
+                    return
+                stored = (versions, rendered.content, content_type)
+                cache.set(key, stored, timeout=timeout)
+                local_cache.set(key, stored, timeout)
+                metrics.record("stores")
+
+            if response.status_code == 200 and hasattr(
+                response, "add_post_render_callback"
+            ):
+                response.add_post_render_callback(store)
+            response["X-Cache"] = "MISS"
+            return response
+
+        return inner
+
+    return decorator
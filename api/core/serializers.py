@@ -4,6 +4,21 @@ from rest_framework import serializers
 User = get_user_model()
 
 
+class SparseFieldsetMixin:
+    """Limits output to the field names in the ``sparse_fields`` context."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get("sparse_fields")
+        if not requested:
+            return fields
+        return {
+            name: field
+            for name, field in fields.items()
+            if name == "id" or name in requested
+        }
+
+
 class UserMiniSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -0,0 +1,234 @@
+import base64
+import binascii
+import hashlib
+import io
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.urls import reverse
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional at runtime.
+    Image = None
+
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+EXTENSION_CONTENT_TYPES = {
+    extension: content_type
+    for content_type, extension in CONTENT_TYPE_EXTENSIONS.items()
+}
+# Pillow format names of the images we accept.
+IMAGE_FORMAT_CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+THUMBNAIL_EXTENSION = "jpg"
+BLOB_NAME_RE = re.compile(r"^(?P<digest>[0-9a-f]{64})\.(?P<extension>jpg|png|webp)$")
+DATA_URL_RE = re.compile(
+    r"^data:(?P<content_type>[\w/+.-]+);base64,(?P<payload>.+)$",
+    re.DOTALL,
+)
+
+
+class BlobError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    digest: str
+    content_type: str
+    size: int
+    has_thumbnail: bool
+
+    @property
+    def extension(self) -> str:
+        return CONTENT_TYPE_EXTENSIONS[self.content_type]
+
+    @property
+    def name(self) -> str:
+        return f"{self.digest}.{self.extension}"
+
+    @property
+    def url(self) -> str:
+        return blob_url(self.name)
+
+    @property
+    def thumbnail_url(self) -> str:
+        if not self.has_thumbnail:
+            return self.url
+        return blob_url(f"{self.digest}.{THUMBNAIL_EXTENSION}", thumbnail=True)
+
+
+def is_data_url(value) -> bool:
+    return isinstance(value, str) and value.startswith("data:")
+
+
+def decode_data_url(value: str) -> tuple[str, bytes]:
+    match = DATA_URL_RE.match(value.strip())
+    if not match:
+        raise BlobError("Invalid data URL.")
+    content_type = match.group("content_type").lower()
+    if content_type not in CONTENT_TYPE_EXTENSIONS:
+        raise BlobError(f"Unsupported content type: {content_type}.")
+    try:
+        data = base64.b64decode(match.group("payload"), validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise BlobError("Invalid base64 payload.") from exc
+    return content_type, data
+
+
+def _blob_root() -> Path:
+    return Path(settings.BLOB_STORAGE_ROOT)
+
+
+def _sharded_path(root: Path, name: str) -> Path:
+    return root / name[:2] / name[2:4] / name
+
+
+def blob_path(name: str, thumbnail: bool = False) -> Path:
+    if not BLOB_NAME_RE.match(name):
+        raise BlobError("Invalid blob name.")
+    root = _blob_root() / ("thumbs" if thumbnail else "originals")
+    return _sharded_path(root, name)
+
+
+def blob_url(name: str, thumbnail: bool = False) -> str:
+    route = "blob-thumbnail" if thumbnail else "blob-detail"
+    path = reverse(route, kwargs={"name": name})
+    return f"{settings.BLOB_PUBLIC_BASE_URL.rstrip('/')}{path}"
+
+
+def blob_url_prefix() -> str:
+    return f"{settings.BLOB_PUBLIC_BASE_URL.rstrip('/')}{reverse('blob-upload')}"
+
+
+def thumbnail_url_for(url: str) -> str:
+    # Derived from the digest alone so serializing rows never touches the
+    # disk; the thumbnail route serves the original when none was built.
+    prefix = blob_url_prefix()
+    if not url or not url.startswith(prefix):
+        return url
+    match = BLOB_NAME_RE.match(url[len(prefix):])
+    if not match:
+        return url
+    return blob_url(f"{match.group('digest')}.{THUMBNAIL_EXTENSION}", thumbnail=True)
+
+
+def original_blob_path(digest: str) -> Path | None:
+    for extension in CONTENT_TYPE_EXTENSIONS.values():
+        path = blob_path(f"{digest}.{extension}")
+        if path.exists():
+            return path
+    return None
+
+
+def content_type_for(name: str) -> str:
+    match = BLOB_NAME_RE.match(name)
+    if not match:
+        raise BlobError("Invalid blob name.")
+    return EXTENSION_CONTENT_TYPES[match.group("extension")]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def _build_thumbnail(data: bytes) -> bytes | None:
+    if Image is None:
+        return None
+    size = settings.BLOB_THUMBNAIL_SIZE
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image = image.convert("RGB")
+            image.thumbnail((size, size))
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=80, optimize=True)
+    except (OSError, ValueError):
+        return None
+    return output.getvalue()
+
+
+def _sniff_content_type(data: bytes) -> str | None:
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def detect_content_type(data: bytes) -> str:
+    if Image is None:
+        content_type = _sniff_content_type(data)
+    else:
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image.verify()
+                content_type = IMAGE_FORMAT_CONTENT_TYPES.get(image.format)
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+            content_type = None
+    if content_type is None:
+        raise BlobError("Payload is not a supported image.")
+    return content_type
+
+
+def store_blob(data: bytes) -> StoredBlob:
+    # The declared content type is never trusted; the bytes decide.
+    if not data:
+        raise BlobError("Empty payload.")
+    if len(data) > settings.BLOB_MAX_BYTES:
+        raise BlobError("Payload is too large.")
+    content_type = detect_content_type(data)
+
+    digest = hashlib.sha256(data).hexdigest()
+    extension = CONTENT_TYPE_EXTENSIONS[content_type]
+    path = blob_path(f"{digest}.{extension}")
+    if not path.exists():
+        _write_atomic(path, data)
+
+    thumb_path = blob_path(f"{digest}.{THUMBNAIL_EXTENSION}", thumbnail=True)
+    has_thumbnail = thumb_path.exists()
+    if not has_thumbnail:
+        thumbnail = _build_thumbnail(data)
+        if thumbnail is not None:
+            _write_atomic(thumb_path, thumbnail)
+            has_thumbnail = True
+
+    return StoredBlob(
+        digest=digest,
+        content_type=content_type,
+        size=len(data),
+        has_thumbnail=has_thumbnail,
+    )
+
+
+def store_data_url(value: str) -> StoredBlob:
+    _, data = decode_data_url(value)
+    return store_blob(data)
+
+
+def offload_data_url(value):
+    if not is_data_url(value):
+        return value
+    return store_data_url(value).url
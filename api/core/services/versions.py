@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+VERSION_CACHE_PREFIX = "version"
+
+
+def _version_key(scope: str, ident=None) -> str:
+    if ident is None:
+        return f"{VERSION_CACHE_PREFIX}:{scope}"
+    return f"{VERSION_CACHE_PREFIX}:{scope}:{ident}"
+
+
+def _version_timeout():
+    # A process-local cache cannot see bumps made by other workers, so its
+    # versions expire quickly to bound staleness; shared caches keep them.
+    # ``cache`` is a proxy, so the backend itself is checked.
+    if isinstance(caches["default"], LocMemCache):
+        return settings.VERSION_LOCAL_TIMEOUT_SECONDS
+    return None
+
+
+def _new_version() -> int:
+    # Wall-clock nanoseconds: a regenerated counter (eviction, restart)
+    # never repeats an ETag, and it doubles as the Last-Modified time.
+    return time.time_ns()
+
+
+def get_versions(keys) -> list[int]:
+    """Current versions for ``(scope, ident)`` pairs, created on first read."""
+    cache_keys = [_version_key(scope, ident) for scope, ident in keys]
+    found = cache.get_many(cache_keys)
+    missing = {key: _new_version() for key in cache_keys if key not in found}
+    if missing:
+        timeout = _version_timeout()
+        for key, value in missing.items():
+            if not cache.add(key, value, timeout=timeout):
+                value = cache.get(key, value)
+            found[key] = value
+    return [found[key] for key in cache_keys]
+
+
+def get_version(scope: str, ident=None) -> int:
+    return get_versions([(scope, ident)])[0]
+
+
+def bump_versions(keys) -> int:
+    value = _new_version()
+    cache.set_many(
+        {_version_key(scope, ident): value for scope, ident in keys},
+        timeout=_version_timeout(),
+    )
+    return value
+
+
+def bump_version(scope: str, ident=None) -> int:
+    return bump_versions([(scope, ident)])
+
+
+def version_datetime(version: int) -> datetime:
+    return datetime.fromtimestamp(version / 1_000_000_000, tz=dt_timezone.utc)
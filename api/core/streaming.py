@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ParseError
+
+from .renderers import json_dumps
+
+STREAM_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+STREAM_BUFFER_BYTES = 64 * 1024
+
+
+def get_stream_format(request):
+    value = (request.query_params.get("stream") or "").strip().lower()
+    if not value:
+        return None
+    if value not in STREAM_CONTENT_TYPES:
+        raise ParseError("stream must be one of: json, ndjson.")
+    return value
+
+
+def row_serializer(serializer_class):
+    # Fast serializers expose a per-row function; DRF ones are wrapped.
+    to_dict = getattr(serializer_class, "to_dict", None)
+    if to_dict is not None:
+        return to_dict
+    return lambda item: serializer_class(item).data
+
+
+def _buffered(chunks):
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_BUFFER_BYTES:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _ndjson_chunks(rows):
+    for row in rows:
+        yield json_dumps(row) + b"\n"
+
+
+def _json_array_chunks(rows):
+    # Same keys as the buffered {"count", "results"} payload; count is only
+    # known once the cursor is exhausted, so it is written last.
+    count = 0
+    yield b'{"results":['
+    for row in rows:
+        if count:
+            yield b","
+        yield json_dumps(row)
+        count += 1
+    yield b'],"count":' + str(count).encode() + b"}"
+
+
+def streaming_list_response(
+    queryset, serializer_class, stream_format, chunk_size=None
+):
+    chunk_size = chunk_size or settings.STREAMING_CHUNK_SIZE
+    to_dict = row_serializer(serializer_class)
+    rows = (to_dict(item) for item in queryset.iterator(chunk_size=chunk_size))
+    if stream_format == "ndjson":
+        chunks = _ndjson_chunks(rows)
+    else:
+        chunks = _json_array_chunks(rows)
+    response = StreamingHttpResponse(
+        _buffered(chunks), content_type=STREAM_CONTENT_TYPES[stream_format]
+    )
+    response["X-Accel-Buffering"] = "no"
+    return response
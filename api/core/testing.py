@@ -0,0 +1,28 @@
+"""Test helpers shared across apps."""
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """Adds ``assertMaxQueries`` to a TestCase.
+
+    Unlike ``assertNumQueries`` it only fails when an endpoint exceeds its
+    budget, so adding a cache hit or dropping a query does not break tests.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, limit, using=DEFAULT_DB_ALIAS):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed = len(context.captured_queries)
+        if executed > limit:
+            queries = "\n".join(
+                f"{index}. {query['sql']}"
+                for index, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(
+                f"{executed} queries executed, at most {limit} expected.\n"
+                f"Captured queries were:\n{queries}"
+            )
@@ -1,4 +1,33 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.cache_backends import TieredCache
+from core.cache_url import parse_cache_url
+from core.parallel import run_concurrently
+from core.renderers import FastJSONRenderer
+from core.services import blobs
+from core.services.versions import bump_versions, get_version
+
+from matches.models import Match, Rating, Team, Tournament
 
 
 class HealthEndpointTests(TestCase):
@@ -7,3 +36,293 @@ class HealthEndpointTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"ok": True, "status": "healthy"})
+
+
+def _png_data_url(color=(200, 30, 30)):
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.new("RGB", (64, 64), color).save(output, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(output.getvalue()).decode()
+
+
+class BlobStoreTests(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        override = override_settings(BLOB_STORAGE_ROOT=Path(self.temp_dir.name))
+        override.enable()
+        self.addCleanup(override.disable)
+
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+
+    def test_upload_is_content_addressed_and_served_immutable(self):
+        data_url = _png_data_url()
+        first = self.client.post(
+            reverse("blob-upload"), {"data": data_url}, format="json", **self.auth
+        )
+        second = self.client.post(
+            reverse("blob-upload"), {"data": data_url}, **self.auth
+        )
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(first.json()["hash"], second.json()["hash"])
+
+        response = self.client.get(first.json()["url"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertIn("immutable", response["Cache-Control"])
+        etag = response["ETag"]
+        self.assertEqual(etag, f'"{first.json()["hash"]}"')
+
+        cached = self.client.get(first.json()["url"], HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+
+        thumbnail = self.client.get(first.json()["thumbnail_url"])
+        self.assertEqual(thumbnail.status_code, 200)
+        self.assertEqual(thumbnail["Content-Type"], "image/jpeg")
+
+    def test_upload_rejects_invalid_payload(self):
+        response = self.client.post(
+            reverse("blob-upload"), {"data": "data:text/plain;base64,aGk="}, **self.auth
+        )
+        self.assertEqual(response.status_code, 400)
+        missing = self.client.get(reverse("blob-detail", kwargs={"name": "notahash.png"}))
+        self.assertEqual(missing.status_code, 404)
+
+    def test_upload_type_comes_from_the_decoded_image(self):
+        fake = "data:image/png;base64," + base64.b64encode(b"<svg>not an image</svg>").decode()
+        response = self.client.post(reverse("blob-upload"), {"data": fake}, **self.auth)
+        self.assertEqual(response.status_code, 400)
+
+        from PIL import Image
+
+        output = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(output, format="JPEG")
+        mislabeled = "data:image/png;base64," + base64.b64encode(output.getvalue()).decode()
+        response = self.client.post(reverse("blob-upload"), {"data": mislabeled}, **self.auth)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["content_type"], "image/jpeg")
+        self.assertTrue(response.json()["url"].endswith(".jpg"))
+
+    def test_thumbnail_urls_skip_the_filesystem(self):
+        with mock.patch.object(blobs, "Image", None):
+            blob = blobs.store_data_url(_png_data_url())
+        self.assertFalse(blob.has_thumbnail)
+        with mock.patch.object(Path, "exists") as exists:
+            thumbnail_url = blobs.thumbnail_url_for(blob.url)
+        exists.assert_not_called()
+        # Without a built thumbnail the route redirects to the original,
+        # without the immutable caching of real thumbnails.
+        response = self.client.get(thumbnail_url)
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn("immutable", response["Cache-Control"])
+        response = self.client.get(response["Location"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+
+    def test_memory_patch_and_command_offload_data_urls(self):
+        tournament = Tournament.objects.create(name="Liga")
+        home = Team.objects.create(name="Home")
+        away = Team.objects.create(name="Away")
+        match = Match.objects.create(
+            tournament=tournament,
+            home_team=home,
+            away_team=away,
+            date_time="2026-01-01T12:00:00Z",
+        )
+        rating = Rating.objects.create(user=self.user, match=match, score=70)
+
+        response = self.client.patch(
+            reverse("match-memory", kwargs={"pk": match.id}),
+            {"stadium_photo_url": _png_data_url()},
+            content_type="application/json",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 200)
+        rating.refresh_from_db()
+        self.assertTrue(rating.stadium_photo_url.startswith("/api/v1/blobs/"))
+
+        Rating.objects.filter(id=rating.id).update(
+            representative_photo_url=_png_data_url((10, 10, 200))
+        )
+        call_command("offload_rating_photos", stdout=io.StringIO())
+        rating.refresh_from_db()
+        self.assertTrue(rating.representative_photo_url.startswith("/api/v1/blobs/"))
+        self.assertEqual(self.client.get(rating.representative_photo_url).status_code, 200)
+
+
+class FastJSONRendererTests(TestCase):
+    payload = {
+        "name": "Pe\u00f1arol \u2028 Nacional",
+        "score": Decimal("7.50"),
+        "items": [1, 2.5, None, True],
+        "nested": {"date": "2026-01-01T12:00:00Z"},
+    }
+
+    def test_matches_default_renderer_output(self):
+        expected = JSONRenderer().render(self.payload)
+        self.assertEqual(FastJSONRenderer().render(self.payload), expected)
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.payload), expected)
+
+    def test_datetimes_decimals_and_int_keys_match_default_renderer(self):
+        payload = {
+            "played_at": datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc),
+            "local": datetime(2026, 1, 1, 9, 30, tzinfo=dt_timezone(timedelta(hours=-3))),
+            "day": date(2026, 1, 1),
+            "average": Decimal("81.25"),
+            "counts": {7: 2, 12: 1},
+        }
+        expected = JSONRenderer().render(payload)
+        self.assertIn(b'"2026-01-01T12:00:00.123456Z"', expected)
+        self.assertEqual(FastJSONRenderer().render(payload), expected)
+
+    def test_indent_falls_back_to_default_renderer(self):
+        rendered = FastJSONRenderer().render(
+            self.payload, "application/json; indent=2"
+        )
+        self.assertIn(b"\n  ", rendered)
+
+
+class StreamingListTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        teams = [Team.objects.create(name=f"Team {index}") for index in range(4)]
+        for index in range(3):
+            Match.objects.create(
+                tournament=tournament,
+                home_team=teams[index],
+                away_team=teams[index + 1],
+                date_time=f"2026-01-0{index + 1}T12:00:00Z",
+            )
+
+    def _get(self, query=""):
+        return self.client.get(reverse("match-list") + query, **self.auth)
+
+    def test_json_stream_matches_buffered_response(self):
+        buffered = self._get().json()
+        response = self._get("?stream=json")
+        self.assertTrue(response.streaming)
+        streamed = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(streamed, buffered)
+
+    def test_ndjson_stream_emits_one_row_per_line(self):
+        buffered = self._get().json()["results"]
+        response = self._get("?stream=ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], buffered)
+
+    def test_unknown_stream_format_is_rejected(self):
+        self.assertEqual(self._get("?stream=xml").status_code, 400)
+
+
+class CacheUrlTests(TestCase):
+    def test_parses_supported_schemes(self):
+        self.assertEqual(
+            parse_cache_url("locmem://"),
+            {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        )
+        self.assertEqual(
+            parse_cache_url("db://ballboxd_cache?timeout=600"),
+            {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "ballboxd_cache",
+                "TIMEOUT": 600,
+            },
+        )
+        self.assertEqual(
+            parse_cache_url("file:///var/tmp/ballboxd?max_entries=5000")["LOCATION"],
+            "/var/tmp/ballboxd",
+        )
+        redis = parse_cache_url("redis://:secret@cache:6379/1?key_prefix=bbx")
+        self.assertEqual(redis["BACKEND"], "django.core.cache.backends.redis.RedisCache")
+        self.assertEqual(redis["LOCATION"], "redis://:secret@cache:6379/1")
+        self.assertEqual(redis["KEY_PREFIX"], "bbx")
+
+    def test_rejects_unknown_scheme_and_missing_table(self):
+        with self.assertRaises(ValueError):
+            parse_cache_url("memcached://localhost:11211")
+        with self.assertRaises(ValueError):
+            parse_cache_url("db://")
+
+
+class TieredCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tiered = TieredCache(
+            "default",
+            {"OPTIONS": {"L1_TIMEOUT": 60, "NEGATIVE_TIMEOUT": 60}},
+        )
+
+    def test_reads_are_served_from_l1_until_written_through(self):
+        self.tiered.set("team:1", "River")
+        cache.set("team:1", "changed elsewhere")
+        self.assertEqual(self.tiered.get("team:1"), "River")
+        self.tiered.set("team:1", "Boca")
+        self.assertEqual(cache.get("team:1"), "Boca")
+        self.assertEqual(self.tiered.get_many(["team:1", "team:2"]), {"team:1": "Boca"})
+
+    def test_misses_are_negatively_cached(self):
+        self.assertIsNone(self.tiered.get("missing"))
+        cache.set("missing", "late")
+        self.assertIsNone(self.tiered.get("missing"))
+        self.assertFalse(self.tiered.has_key("missing"))
+        self.tiered.delete("missing")
+        cache.set("missing", "late")
+        self.assertEqual(self.tiered.get("missing"), "late")
+
+    def test_atomic_operations_use_the_shared_tier(self):
+        self.assertTrue(self.tiered.add("lock", "a", timeout=30))
+        self.assertFalse(self.tiered.add("lock", "b", timeout=30))
+        self.assertFalse(cache.add("lock", "c"))
+        self.tiered.set("hits", 1)
+        cache.incr("hits")
+        self.assertEqual(self.tiered.incr("hits"), 3)
+        self.assertEqual(self.tiered.get("hits"), 3)
+
+
+class VersionCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(VERSION_LOCAL_TIMEOUT_SECONDS=30)
+    def test_local_default_cache_expires_versions(self):
+        default = caches["default"]
+        self.assertIsInstance(default, LocMemCache)
+        get_version("teams")
+        bump_versions([("team", 1)])
+        now = time.time()
+        for key in ("version:teams", "version:team:1"):
+            expires_at = default._expire_info[default.make_key(key)]
+            self.assertIsNotNone(expires_at)
+            self.assertLessEqual(expires_at, now + 31)
+
+
+@override_settings(PARALLEL_QUERY_WORKERS=4)
+class ParallelQueryTests(TransactionTestCase):
+    # Committed rows, so pool threads on their own connections can see them.
+    def setUp(self):
+        Team.objects.create(name="River")
+        Team.objects.create(name="Boca")
+
+    def test_tasks_fan_out_to_pool_connections(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def count_teams():
+            # Both tasks must be running at once to pass the barrier.
+            barrier.wait()
+            return threading.current_thread().name, Team.objects.count()
+
+        outcomes = run_concurrently({"first": count_teams, "second": count_teams})
+        names = {outcomes[key][0][0] for key in ("first", "second")}
+        self.assertEqual(len(names), 2)
+        self.assertTrue(all(name.startswith("bbx-query") for name in names))
+        self.assertEqual([outcomes[key][0][1] for key in ("first", "second")], [2, 2])
@@ -0,0 +1,13 @@
+import re
+import unicodedata
+
+
+def fold_text(value: str) -> str:
+    """Lowercases, strips accents and turns punctuation into spaces."""
+    normalized = unicodedata.normalize("NFKD", value.lower())
+    stripped = "".join(char for char in normalized if not unicodedata.combining(char))
+    return re.sub(r"[^a-z0-9\s]+", " ", stripped).strip()
+
+
+def squash_text(value: str) -> str:
+    return " ".join(fold_text(value).split())
@@ -1,12 +1,29 @@
-from django.http import JsonResponse
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponseNotModified,
+    HttpResponseRedirect,
+    JsonResponse,
+)
 from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.views.decorators.http import require_GET
 from rest_framework import status
 from rest_framework.authtoken.models import Token
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .serializers import RegisterSerializer, UserMiniSerializer
+from .services.blobs import (
+    BLOB_NAME_RE,
+    BlobError,
+    blob_path,
+    content_type_for,
+    original_blob_path,
+    store_blob,
+    store_data_url,
+)
 
 User = get_user_model()
 
@@ -30,3 +47,83 @@ class RegisterView(APIView):
             },
             status=status.HTTP_201_CREATED,
         )
+
+
+class BlobUploadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # Stores an image (data URL or multipart file) and returns its URLs.
+    def post(self, request):
+        upload = request.FILES.get("file")
+        try:
+            if upload is not None:
+                blob = store_blob(upload.read())
+            else:
+                value = request.data.get("data")
+                if not isinstance(value, str):
+                    return Response(
+                        {"detail": "Provide a data URL in 'data' or a 'file' upload."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                blob = store_data_url(value)
+        except BlobError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "hash": blob.digest,
+                "content_type": blob.content_type,
+                "size": blob.size,
+                "url": blob.url,
+                "thumbnail_url": blob.thumbnail_url,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# Until a thumbnail exists its URL redirects to the original; kept short so
+# a thumbnail built later is picked up.
+THUMBNAIL_FALLBACK_CACHE_SECONDS = 300
+
+
+def _serve_blob(request, name, thumbnail):
+    match = BLOB_NAME_RE.match(name)
+    if not match:
+        raise Http404("Blob not found.")
+    path = blob_path(name, thumbnail=thumbnail)
+    if not path.exists() and thumbnail:
+        # No thumbnail was built (Pillow missing or undecodable image), but
+        # thumbnail URLs are handed out without checking. Redirect rather
+        # than serve the original here: this URL's immutable caching and
+        # ETag belong to the thumbnail bytes.
+        original = original_blob_path(match.group("digest"))
+        if original is not None:
+            response = HttpResponseRedirect(
+                reverse("blob-detail", kwargs={"name": original.name})
+            )
+            response["Cache-Control"] = f"public, max-age={THUMBNAIL_FALLBACK_CACHE_SECONDS}"
+            return response
+    if not path.exists():
+        raise Http404("Blob not found.")
+    content_type = content_type_for(name)
+
+    # Blobs are content addressed, so the digest is a strong validator and
+    # the bytes behind a URL never change.
+    etag = f'"{match.group("digest")}"'
+    if request.headers.get("If-None-Match") == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(path.open("rb"), content_type=content_type)
+    response["ETag"] = etag
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+@require_GET
+def blob_view(request, name):
+    return _serve_blob(request, name, thumbnail=False)
+
+
+@require_GET
+def blob_thumbnail_view(request, name):
+    return _serve_blob(request, name, thumbnail=True)
@@ -12,3 +12,31 @@ max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
 accesslog = "-"
 errorlog = "-"
 loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+# Each new worker builds its per-process search structures (indexes,
+# autocomplete, popularity) in a background thread once Django is loaded,
+# so no request pays for them. GUNICORN_WARMUP=1 also replays popular
+# searches, teams and profiles, so recycled workers (max_requests) do not
+# start cold. It runs after the app is imported, which plain post_fork
+# precedes unless preload_app is set.
+warmup_enabled = os.getenv("GUNICORN_WARMUP", "0") == "1"
+
+
+def post_worker_init(worker):
+    import threading
+
+    def run():
+        from django.db import connections
+
+        from social.services.warmup import warm_caches, warm_process_caches
+
+        try:
+            summary = warm_caches() if warmup_enabled else warm_process_caches()
+        except Exception:
+            worker.log.exception("Cache warmup failed")
+            return
+        finally:
+            connections.close_all()
+        worker.log.info("Cache warmup finished: %s", summary)
+
+    threading.Thread(target=run, name="bbx-warmup", daemon=True).start()
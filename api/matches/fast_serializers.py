@@ -0,0 +1,197 @@
+"""Plain-function serializers for hot match list endpoints.
+
+Each function mirrors a DRF serializer in ``matches.serializers`` field for
+field (same keys, order and value formatting), so the rendered JSON is
+byte-identical while skipping per-row field introspection.
+"""
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def format_datetime(value):
+    # Same output as rest_framework.fields.DateTimeField with ISO_8601.
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    if settings.USE_TZ:
+        current_timezone = timezone.get_current_timezone()
+        if timezone.is_aware(value):
+            value = value.astimezone(current_timezone)
+        else:
+            value = timezone.make_aware(value, current_timezone)
+    elif timezone.is_aware(value):
+        value = timezone.make_naive(value, datetime.timezone.utc)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _weighted_average(obj):
+    weighted_sum = getattr(obj, "weighted_score_sum", None)
+    weight_sum = getattr(obj, "weight_sum", None)
+    if weighted_sum is not None and weight_sum:
+        return round(float(weighted_sum) / float(weight_sum), 2)
+    value = getattr(obj, "avg_score", None)
+    return float(value or 0)
+
+
+def tournament_to_dict(tournament):
+    return {
+        "id": tournament.id,
+        "name": tournament.name,
+        "country": tournament.country,
+        "code": tournament.code,
+        "logo_url": tournament.logo_url,
+    }
+
+
+def team_to_dict(team):
+    return {
+        "id": team.id,
+        "name": team.name,
+        "country": team.country,
+        "logo_url": team.logo_url,
+    }
+
+
+def team_summary_to_dict(team):
+    return {
+        "id": team.id,
+        "name": team.name,
+        "logo_url": team.logo_url,
+    }
+
+
+def league_to_dict(tournament):
+    return {
+        "id": tournament.id,
+        "name": tournament.name,
+        "country": tournament.country,
+        "season": None,
+        "logo_url": tournament.logo_url,
+    }
+
+
+def rating_to_dict(rating):
+    user = rating.user
+    return {
+        "id": rating.id,
+        "user": {"id": user.id, "username": user.username},
+        "score": rating.score,
+        "minutes_watched": rating.minutes_watched,
+        "review": rating.review,
+        "created_at": format_datetime(rating.created_at),
+    }
+
+
+def feed_match_to_dict(match):
+    rating_list = getattr(match, "my_rating_list", [])
+    return {
+        "id": match.id,
+        "tournament": tournament_to_dict(match.tournament),
+        "home_team": team_to_dict(match.home_team),
+        "away_team": team_to_dict(match.away_team),
+        "date_time": format_datetime(match.date_time),
+        "venue": match.venue,
+        "status": match.status,
+        "home_score": match.home_score,
+        "away_score": match.away_score,
+        "avg_score": _weighted_average(match),
+        "rating_count": int(getattr(match, "rating_count", None) or 0),
+        "my_rating": rating_to_dict(rating_list[0]) if rating_list else None,
+        "watchability_score": match.watchability_score,
+        "watchability_confidence": match.watchability_confidence,
+        "watchability_updated_at": format_datetime(match.watchability_updated_at),
+    }
+
+
+def search_match_to_dict(match):
+    rating_list = getattr(match, "my_rating_list", [])
+    return {
+        "id": match.id,
+        "kickoff_at": format_datetime(match.date_time),
+        "league": league_to_dict(match.tournament),
+        "home": team_summary_to_dict(match.home_team),
+        "away": team_summary_to_dict(match.away_team),
+        "status": "upcoming" if match.date_time >= timezone.now() else "finished",
+        "score": {
+            "home": match.home_score,
+            "away": match.away_score,
+        },
+        "avg_rating": _weighted_average(match),
+        "my_rating": rating_list[0].score if rating_list else None,
+    }
+
+
+def normalized_match_to_dict(match):
+    # feed_match_to_dict with team/tournament objects replaced by their ids.
+    rating_list = getattr(match, "my_rating_list", [])
+    return {
+        "id": match.id,
+        "tournament_id": match.tournament_id,
+        "home_team_id": match.home_team_id,
+        "away_team_id": match.away_team_id,
+        "date_time": format_datetime(match.date_time),
+        "venue": match.venue,
+        "status": match.status,
+        "home_score": match.home_score,
+        "away_score": match.away_score,
+        "avg_score": _weighted_average(match),
+        "rating_count": int(getattr(match, "rating_count", None) or 0),
+        "my_rating": rating_to_dict(rating_list[0]) if rating_list else None,
+        "watchability_score": match.watchability_score,
+        "watchability_confidence": match.watchability_confidence,
+        "watchability_updated_at": format_datetime(match.watchability_updated_at),
+    }
+
+
+def normalize_matches(matches):
+    # Side-loads each team and tournament once, keyed by stringified id.
+    teams = {}
+    tournaments = {}
+    results = []
+    for match in matches:
+        for team in (match.home_team, match.away_team):
+            key = str(team.id)
+            if key not in teams:
+                teams[key] = team_to_dict(team)
+        tournament_key = str(match.tournament_id)
+        if tournament_key not in tournaments:
+            tournaments[tournament_key] = tournament_to_dict(match.tournament)
+        results.append(normalized_match_to_dict(match))
+    return {"results": results, "teams": teams, "tournaments": tournaments}
+
+
+class FastSerializer:
+    """Read-only stand-in for ``Serializer(instance, many=...)`` that
+    builds ``.data`` with a plain function."""
+
+    to_dict = None
+
+    def __init__(self, instance=None, many=False, context=None):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+
+    @property
+    def data(self):
+        to_dict = type(self).to_dict
+        if self.many:
+            return [to_dict(item) for item in self.instance]
+        return to_dict(self.instance)
+
+
+class FastFeedMatchSerializer(FastSerializer):
+    to_dict = staticmethod(feed_match_to_dict)
+
+
+class FastMatchListSerializer(FastFeedMatchSerializer):
+    pass
+
+
+class FastSearchMatchSerializer(FastSerializer):
+    to_dict = staticmethod(search_match_to_dict)
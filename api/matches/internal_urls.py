@@ -5,6 +5,8 @@ from .internal_views import (
     import_fixtures_view,
     poll_matches_view,
     recompute_watchability_view,
+    response_cache_stats_view,
+    search_popularity_view,
 )
 
 urlpatterns = [
@@ -20,4 +22,16 @@ urlpatterns = [
         name="internal-recompute-watchability",
     ),
     path("recompute-watchability/", recompute_watchability_view),
+    path(
+        "response-cache-stats",
+        response_cache_stats_view,
+        name="internal-response-cache-stats",
+    ),
+    path("response-cache-stats/", response_cache_stats_view),
+    path(
+        "search-popularity",
+        search_popularity_view,
+        name="internal-search-popularity",
+    ),
+    path("search-popularity/", search_popularity_view),
 ]
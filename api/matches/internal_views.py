@@ -10,13 +10,15 @@ from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.dateparse import parse_date
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 
+from core.response_cache import metrics as response_cache_metrics
 from matches.services.football_data import FootballDataError
 from matches.models import Match
 from matches.services.bootstrap import bootstrap_once
 from matches.services.jobs import import_fixtures_once, poll_matches_once
 from matches.services.watchability import compute_watchability
+from social.services.popularity import refresh_search_popularity
 
 logger = logging.getLogger(__name__)
 
@@ -638,3 +640,73 @@ def recompute_watchability_view(request):
         )
     finally:
         _release_job_lock(lock_key)
+
+
+@csrf_exempt
+@require_POST
+def search_popularity_view(request):
+    if not _is_authorized(request):
+        logger.warning(
+            "Internal search-popularity unauthorized ip=%s",
+            _get_client_ip(request),
+        )
+        return _unauthorized()
+    if not _rate_limit_ip(request, key_prefix="internal:search-popularity"):
+        return JsonResponse({"ok": False, "error": "rate_limited"}, status=429)
+
+    lock_key = _acquire_job_lock("search-popularity", timeout_seconds=60 * 15)
+    if not lock_key:
+        return _already_running("search-popularity")
+
+    try:
+        body = _parse_json_body(request)
+        since_hours = _parse_int_param(
+            _first_defined(
+                body.get("since_hours"),
+                request.POST.get("since_hours"),
+                request.GET.get("since_hours"),
+            )
+        )
+        since = (
+            timezone.now() - timedelta(hours=max(since_hours, 0))
+            if since_hours is not None
+            else None
+        )
+        start_time = time.monotonic()
+        try:
+            written = refresh_search_popularity(since=since)
+        except Exception:
+            logger.exception("Internal search-popularity failed.")
+            return JsonResponse(
+                {
+                    "ok": False,
+                    "error": "internal_error",
+                    "reason": "unexpected_exception",
+                },
+                status=500,
+            )
+        duration = time.monotonic() - start_time
+        logger.info(
+            "Internal search-popularity done written=%s since_hours=%s duration=%.3fs",
+            written,
+            since_hours,
+            duration,
+        )
+        return JsonResponse(
+            {
+                "ok": True,
+                "written": written,
+                "since_hours": since_hours,
+                "duration_seconds": round(duration, 3),
+            }
+        )
+    finally:
+        _release_job_lock(lock_key)
+
+
+@require_GET
+def response_cache_stats_view(request):
+    # Counters are per worker process; poll a few times to cover them all.
+    if not _is_authorized(request):
+        return _unauthorized()
+    return JsonResponse({"ok": True, "response_cache": response_cache_metrics.snapshot()})
@@ -0,0 +1,125 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from matches.fast_serializers import (
+    FastFeedMatchSerializer,
+    FastMatchListSerializer,
+    FastSearchMatchSerializer,
+)
+from matches.models import Match, Rating, Team, Tournament
+from matches.serializers import (
+    FeedMatchSerializer,
+    MatchListSerializer,
+    SearchMatchSerializer,
+)
+
+SERIALIZER_PAIRS = [
+    ("feed", FeedMatchSerializer, FastFeedMatchSerializer),
+    ("list", MatchListSerializer, FastMatchListSerializer),
+    ("search", SearchMatchSerializer, FastSearchMatchSerializer),
+]
+
+
+def _build_matches(count):
+    # Unsaved instances shaped like the annotated/prefetched view querysets.
+    User = get_user_model()
+    user = User(id=1, username="bench")
+    tournament = Tournament(id=1, name="Liga", country="AR", code="LPF", logo_url="")
+    teams = [
+        Team(id=index, name=f"Team {index}", country="AR", logo_url="")
+        for index in range(1, 21)
+    ]
+    now = timezone.now()
+    matches = []
+    for index in range(count):
+        match = Match(
+            id=index + 1,
+            tournament=tournament,
+            home_team=teams[index % 20],
+            away_team=teams[(index + 1) % 20],
+            date_time=now + timedelta(hours=index - count // 2),
+            venue="Stadium",
+            status="FINISHED",
+            home_score=index % 4,
+            away_score=index % 3,
+            watchability_score=index % 100,
+            watchability_confidence="medium",
+            watchability_updated_at=now,
+        )
+        match.weighted_score_sum = 70.0 * (index % 5 + 1)
+        match.weight_sum = float(index % 5 + 1)
+        match.rating_count = index % 5 + 1
+        match.my_rating_list = (
+            [
+                Rating(
+                    id=index + 1,
+                    user=user,
+                    score=60 + index % 40,
+                    minutes_watched="FULL",
+                    review="",
+                    created_at=now,
+                )
+            ]
+            if index % 3 == 0
+            else []
+        )
+        matches.append(match)
+    return matches
+
+
+class Command(BaseCommand):
+    help = "Compare DRF and fast-path match serializers on in-memory rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            default="100,1000,10000",
+            help="Comma-separated row counts (default: 100,1000,10000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per measurement; the fastest is reported (default: 3).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            row_counts = [int(item) for item in options["rows"].split(",") if item]
+        except ValueError as exc:
+            raise CommandError(
+                "--rows must be a comma-separated list of integers."
+            ) from exc
+        repeat = max(int(options["repeat"]), 1)
+        renderer = JSONRenderer()
+
+        self.stdout.write(
+            f"{'shape':<8}{'rows':>8}{'drf ms':>12}{'fast ms':>12}{'speedup':>10}"
+        )
+        for count in row_counts:
+            matches = _build_matches(count)
+            for label, drf_class, fast_class in SERIALIZER_PAIRS:
+                drf_ms, drf_bytes = self._measure(drf_class, matches, renderer, repeat)
+                fast_ms, fast_bytes = self._measure(fast_class, matches, renderer, repeat)
+                if drf_bytes != fast_bytes:
+                    raise CommandError(f"{label} output differs at {count} rows.")
+                self.stdout.write(
+                    f"{label:<8}{count:>8}{drf_ms:>12.1f}{fast_ms:>12.1f}"
+                    f"{drf_ms / fast_ms:>9.1f}x"
+                )
+        self.stdout.write(self.style.SUCCESS("Fast-path output matched DRF output."))
+
+    def _measure(self, serializer_class, matches, renderer, repeat):
+        best = None
+        payload = b""
+        for _ in range(repeat):
+            started = time.perf_counter()
+            payload = renderer.render(serializer_class(matches, many=True).data)
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best, payload
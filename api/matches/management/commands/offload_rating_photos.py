@@ -0,0 +1,90 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.services.blobs import BlobError, is_data_url, offload_data_url
+from core.services.versions import bump_versions
+from matches.models import Rating
+
+PHOTO_FIELDS = ("stadium_photo_url", "representative_photo_url")
+
+
+class Command(BaseCommand):
+    help = "Move inline data URL photos on ratings into the blob store."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Ratings loaded per batch (default: 100).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count affected ratings without writing blobs or rows.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(int(options["batch_size"]), 1)
+        dry_run = options["dry_run"]
+        inline_filter = Q()
+        for field in PHOTO_FIELDS:
+            inline_filter |= Q(**{f"{field}__startswith": "data:"})
+        base_qs = (
+            Rating.objects.filter(inline_filter)
+            .only("id", *PHOTO_FIELDS)
+            .order_by("id")
+        )
+
+        if dry_run:
+            total = base_qs.count()
+            self.stdout.write(
+                self.style.SUCCESS(f"{total} ratings have inline photos.")
+            )
+            return
+
+        # Walk by primary key so each batch only holds a few large rows and
+        # rows that fail to decode are not revisited.
+        last_id = 0
+        moved = 0
+        failed = 0
+        while True:
+            batch = list(base_qs.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            changed = []
+            for rating in batch:
+                updated = False
+                for field in PHOTO_FIELDS:
+                    value = getattr(rating, field)
+                    if not is_data_url(value):
+                        continue
+                    try:
+                        setattr(rating, field, offload_data_url(value))
+                    except BlobError as exc:
+                        failed += 1
+                        self.stderr.write(
+                            f"Rating {rating.id} {field}: {exc}"
+                        )
+                        continue
+                    updated = True
+                if updated:
+                    changed.append(rating)
+            if changed:
+                Rating.objects.bulk_update(changed, PHOTO_FIELDS)
+                # bulk_update skips the Rating signals that rotate ETags.
+                bump_versions(
+                    [
+                        ("ratings", None),
+                        *{("user", rating.user_id) for rating in changed},
+                        *{("match", rating.match_id) for rating in changed},
+                    ]
+                )
+                moved += len(changed)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Offloaded photos for {moved} ratings ({failed} failed)."
+            )
+        )
@@ -6,8 +6,11 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from core.services.versions import bump_versions
 from matches.models import Match, Rating
 from matches.services.watchability import compute_watchability
+from social.services.rollups import rebuild_daily_stats
+from social.services.stats import rebuild_all_user_stats
 
 
 class Command(BaseCommand):
@@ -63,6 +66,10 @@ class Command(BaseCommand):
             total_created += created
             self._update_watchability(match)
 
+        # bulk_create skips the rating signals, so rebuild the derived rows.
+        rebuild_all_user_stats()
+        rebuild_daily_stats()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"Created {total_created} ratings across {len(matches)} matches."
@@ -137,6 +144,10 @@ class Command(BaseCommand):
         ]
         with transaction.atomic():
             Rating.objects.bulk_create(ratings)
+        bump_versions(
+            [("ratings", None), ("match", match.id)]
+            + [("user", user.id) for user in selected]
+        )
         return len(selected), users
 
     def _update_watchability(self, match: Match) -> None:
@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+from core.text import squash_text
+
+BATCH_SIZE = 1000
+
+
+def backfill_name_normalized(apps, schema_editor):
+    for model_name in ("Team", "Tournament"):
+        model = apps.get_model("matches", model_name)
+        batch = []
+        for instance in model.objects.only("id", "name").iterator(chunk_size=BATCH_SIZE):
+            instance.name_normalized = squash_text(instance.name)[:120]
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, ["name_normalized"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["name_normalized"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matches", "0006_match_watchability_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="team",
+            name="name_normalized",
+            field=models.CharField(blank=True, default="", editable=False, max_length=120),
+        ),
+        migrations.AddField(
+            model_name="tournament",
+            name="name_normalized",
+            field=models.CharField(blank=True, default="", editable=False, max_length=120),
+        ),
+        migrations.RunPython(backfill_name_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(
+                fields=["name_normalized"],
+                name="team_name_norm_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tournament",
+            index=models.Index(
+                fields=["name_normalized"],
+                name="tournament_name_norm_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
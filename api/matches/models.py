@@ -1,10 +1,30 @@
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import F, Q
 
+from core.text import squash_text
 
-class Tournament(models.Model):
+
+class NormalizedNameModel(models.Model):
+    """Keeps ``name_normalized`` (accent-folded ``name``) in step on save."""
+
+    name_normalized = models.CharField(
+        max_length=120, blank=True, default="", editable=False
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.name_normalized = squash_text(self.name)[:120]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "name_normalized"}
+        super().save(*args, **kwargs)
+
+
+class Tournament(NormalizedNameModel):
     """Competition / League / Tournament."""
 
     name = models.CharField(max_length=120)
@@ -17,6 +37,11 @@ class Tournament(models.Model):
         indexes = [
             models.Index(fields=["external_id"]),
             models.Index(fields=["code"]),
+            models.Index(
+                fields=["name_normalized"],
+                name="tournament_name_norm_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -36,7 +61,7 @@ class Tournament(models.Model):
         return self.name
 
 
-class Team(models.Model):
+class Team(NormalizedNameModel):
     name = models.CharField(max_length=120)
     country = models.CharField(max_length=80, blank=True, default="")
     external_id = models.PositiveIntegerField(null=True, blank=True)
@@ -45,6 +70,11 @@ class Team(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["external_id"]),
+            models.Index(
+                fields=["name_normalized"],
+                name="team_name_norm_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -180,5 +210,11 @@ class Rating(models.Model):
             ),
         ]
 
+    def save(self, *args, **kwargs):
+        # One transaction around the save signals: the stats snapshot taken
+        # in pre_save locks the stored row until post_save applied its delta.
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return f"{self.user} rated {self.match} = {self.score}"
@@ -1,6 +1,11 @@
 from rest_framework import serializers
 
-from core.serializers import UserMiniSerializer
+from core.serializers import SparseFieldsetMixin, UserMiniSerializer
+from core.services.blobs import BlobError, offload_data_url, thumbnail_url_for
+from social.services.follow_state import (
+    FOLLOWED_TEAM_IDS_CONTEXT_KEY,
+    get_followed_team_ids,
+)
 from .models import Match, Rating, Team, Tournament
 
 
@@ -27,15 +32,30 @@ class TeamSummarySerializer(serializers.ModelSerializer):
         return obj.logo_url
 
 
-class TeamListSerializer(serializers.ModelSerializer):
-    is_following = serializers.BooleanField()
+class TeamFollowStateMixin:
+    # Reads an is_following annotation when present, otherwise checks the
+    # viewer's followed-team set, loaded once per serializer tree.
+    def get_is_following(self, obj):
+        annotated = getattr(obj, "is_following", None)
+        if annotated is not None:
+            return bool(annotated)
+        followed = self.context.get(FOLLOWED_TEAM_IDS_CONTEXT_KEY)
+        if followed is None:
+            request = self.context.get("request")
+            followed = get_followed_team_ids(getattr(request, "user", None))
+            self.context[FOLLOWED_TEAM_IDS_CONTEXT_KEY] = followed
+        return obj.id in followed
+
+
+class TeamListSerializer(TeamFollowStateMixin, serializers.ModelSerializer):
+    is_following = serializers.SerializerMethodField()
 
     class Meta:
         model = Team
         fields = ["id", "name", "country", "logo_url", "is_following"]
 
 
-class TeamDetailSerializer(serializers.ModelSerializer):
+class TeamDetailSerializer(TeamFollowStateMixin, serializers.ModelSerializer):
     city = serializers.SerializerMethodField()
     stadium = serializers.SerializerMethodField()
     logo_url = serializers.SerializerMethodField()
@@ -54,14 +74,6 @@ class TeamDetailSerializer(serializers.ModelSerializer):
     def get_logo_url(self, obj):
         return obj.logo_url
 
-    def get_is_following(self, obj):
-        request = self.context.get("request")
-        if not request or not request.user.is_authenticated:
-            return False
-        from social.models import Follow
-
-        return Follow.objects.filter(user=request.user, team=obj).exists()
-
 
 class LeagueSerializer(serializers.ModelSerializer):
     season = serializers.SerializerMethodField()
@@ -137,7 +149,7 @@ class RatingMemorySerializer(serializers.ModelSerializer):
         ]
 
 
-class RatingWithMatchSerializer(serializers.ModelSerializer):
+class RatingWithMatchSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = UserMiniSerializer(read_only=True)
     match = MatchSerializer(read_only=True)
 
@@ -160,6 +172,35 @@ class RatingWithMatchSerializer(serializers.ModelSerializer):
         ]
 
 
+# List variant of RatingWithMatchSerializer for querysets built with
+# with_photo_summary(): photos are reduced to a flag and a thumbnail URL.
+class RatingListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    user = UserMiniSerializer(read_only=True)
+    match = MatchSerializer(read_only=True)
+    has_photo = serializers.BooleanField(read_only=True)
+    thumbnail_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Rating
+        fields = [
+            "id",
+            "user",
+            "match",
+            "score",
+            "minutes_watched",
+            "review",
+            "attended",
+            "featured_order",
+            "featured_primary_image",
+            "has_photo",
+            "thumbnail_url",
+            "created_at",
+        ]
+
+    def get_thumbnail_url(self, obj):
+        return thumbnail_url_for(obj.photo_blob_url) or None
+
+
 class RatingUpsertSerializer(serializers.ModelSerializer):
     class Meta:
         model = Rating
@@ -177,6 +218,19 @@ class RatingMemoryUpdateSerializer(serializers.ModelSerializer):
             "featured_primary_image",
         ]
 
+    # Inline data URLs are moved into the blob store; only the URL is kept.
+    def _offload_photo(self, value):
+        try:
+            return offload_data_url(value)
+        except BlobError as exc:
+            raise serializers.ValidationError(str(exc)) from exc
+
+    def validate_stadium_photo_url(self, value):
+        return self._offload_photo(value)
+
+    def validate_representative_photo_url(self, value):
+        return self._offload_photo(value)
+
 
 class FeedMatchSerializer(serializers.ModelSerializer):
     tournament = TournamentSerializer(read_only=True)
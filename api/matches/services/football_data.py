@@ -7,7 +7,7 @@ from typing import Optional
 
 import httpx
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import caches
 
 logger = logging.getLogger(__name__)
 
@@ -131,7 +131,7 @@ class FootballDataClient:
         headers = {"X-Auth-Token": self.token}
         cache_key = self._build_cache_key(path, params)
         if self.cache_seconds > 0:
-            cached = cache.get(cache_key)
+            cached = caches["tiered"].get(cache_key)
             if cached is not None:
                 return cached
 
@@ -303,7 +303,7 @@ class FootballDataClient:
                 await asyncio.sleep(wait_seconds)
 
             if self.cache_seconds > 0:
-                cache.set(cache_key, payload, timeout=self.cache_seconds)
+                caches["tiered"].set(cache_key, payload, timeout=self.cache_seconds)
 
             return payload
 
@@ -0,0 +1,55 @@
+from django.db.models import Case, Count, F, Max, Q, Sum, When
+from rest_framework import serializers
+
+from matches.models import Match
+from .importers import FINISHED_STATUSES
+
+
+def pair_filter(team_ids, opponent_ids) -> Q:
+    # Either orientation, so both (home_team, date_time) and
+    # (away_team, date_time) indexes can drive the lookup.
+    return Q(home_team_id__in=team_ids, away_team_id__in=opponent_ids) | Q(
+        home_team_id__in=opponent_ids, away_team_id__in=team_ids
+    )
+
+
+def _goals_for(team_id: int):
+    return Sum(
+        Case(
+            When(home_team_id=team_id, then=F("home_score")),
+            default=F("away_score"),
+        )
+    )
+
+
+def _wins_for(team_id: int):
+    return Count(
+        "id",
+        filter=Q(home_team_id=team_id, home_score__gt=F("away_score"))
+        | Q(away_team_id=team_id, away_score__gt=F("home_score")),
+    )
+
+
+def get_head_to_head(team_id: int, opponent_id: int, matches=None) -> dict:
+    queryset = Match.objects.all() if matches is None else matches
+    totals = (
+        queryset.filter(pair_filter([team_id], [opponent_id]))
+        .filter(status__in=FINISHED_STATUSES)
+        .aggregate(
+            played=Count("id"),
+            team_wins=_wins_for(team_id),
+            opponent_wins=_wins_for(opponent_id),
+            draws=Count("id", filter=Q(home_score=F("away_score"))),
+            team_goals=_goals_for(team_id),
+            opponent_goals=_goals_for(opponent_id),
+            last_played_at=Max("date_time"),
+        )
+    )
+    totals["team_goals"] = totals["team_goals"] or 0
+    totals["opponent_goals"] = totals["opponent_goals"] or 0
+    if totals["last_played_at"] is not None:
+        # Same wire format as the serializers' date_time fields.
+        totals["last_played_at"] = serializers.DateTimeField().to_representation(
+            totals["last_played_at"]
+        )
+    return totals
@@ -9,6 +9,7 @@ from django.conf import settings
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+from core.text import squash_text
 from matches.models import Match, Team, Tournament
 
 from .football_data import FootballDataClient, FootballDataError
@@ -317,8 +318,13 @@ def upsert_team_from_api(team_data):
     area = team_data.get("area") or {}
     country = area.get("name") or ""
     team = Team.objects.filter(external_id=external_id).first()
-    if not team:
-        team = Team.objects.filter(name__iexact=name, country=country).first()
+    if not team and name:
+        # name_normalized is indexed, unlike name__iexact (and accent-folded),
+        # but folds non-Latin or punctuation-only names to "", which would
+        # match every such club in the country.
+        folded = squash_text(name)
+        same_name = {"name_normalized": folded} if folded else {"name__iexact": name}
+        team = Team.objects.filter(country=country, **same_name).first()
         if team:
             team.external_id = external_id
 
@@ -0,0 +1,39 @@
+from django.db.models import BooleanField, Case, F, Q, TextField, Value, When
+
+from core.services.blobs import blob_url_prefix
+
+PHOTO_FIELDS = ("stadium_photo_url", "representative_photo_url")
+LEAN_DEFERRED_FIELDS = PHOTO_FIELDS + ("featured_note",)
+
+
+def with_photo_summary(queryset):
+    # Photo columns may still hold inline data URLs, so list queries defer
+    # them and only pull the short blob URL of the card's primary image.
+    prefix = blob_url_prefix()
+    return queryset.defer(*LEAN_DEFERRED_FIELDS).annotate(
+        has_photo=Case(
+            When(
+                ~Q(stadium_photo_url="") | ~Q(representative_photo_url=""),
+                then=Value(True),
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+        photo_blob_url=Case(
+            When(
+                featured_primary_image="stadium",
+                stadium_photo_url__startswith=prefix,
+                then=F("stadium_photo_url"),
+            ),
+            When(
+                representative_photo_url__startswith=prefix,
+                then=F("representative_photo_url"),
+            ),
+            When(
+                stadium_photo_url__startswith=prefix,
+                then=F("stadium_photo_url"),
+            ),
+            default=Value(""),
+            output_field=TextField(),
+        ),
+    )
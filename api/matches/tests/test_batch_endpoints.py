@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from core.testing import QueryBudgetMixin
+from matches.models import Match, Rating, Team, Tournament
+from social.models import Follow
+
+
+class BatchEndpointTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        self.teams = [Team.objects.create(name=f"Team {index}") for index in range(6)]
+        Follow.objects.create(user=self.user, team=self.teams[0])
+        self.matches = [
+            Match.objects.create(
+                tournament=tournament,
+                home_team=self.teams[index],
+                away_team=self.teams[index + 1],
+                date_time=f"2026-01-0{index + 1}T12:00:00Z",
+            )
+            for index in range(5)
+        ]
+        Rating.objects.create(user=self.user, match=self.matches[0], score=80)
+
+    def test_match_batch_returns_keyed_map(self):
+        ids = [match.id for match in self.matches] + [9999]
+        query = "?ids=" + ",".join(str(item) for item in ids)
+        with self.assertMaxQueries(3):
+            response = self.client.get(reverse("match-batch") + query, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(list(payload["results"]), [str(item) for item in ids])
+        self.assertIsNone(payload["results"]["9999"])
+        self.assertEqual(payload["not_found"], [9999])
+        first = payload["results"][str(self.matches[0].id)]
+        self.assertEqual(first["my_rating"]["score"], 80)
+        self.assertEqual(first["rating_count"], 1)
+
+    def test_team_batch_reports_follow_state(self):
+        ids = [team.id for team in self.teams]
+        query = "?ids=" + ",".join(str(item) for item in ids)
+        self.client.get(reverse("team-batch") + query, **self.auth)
+        with self.assertMaxQueries(2):
+            response = self.client.get(reverse("team-batch") + query, **self.auth)
+        results = response.json()["results"]
+        self.assertTrue(results[str(self.teams[0].id)]["is_following"])
+        self.assertFalse(results[str(self.teams[1].id)]["is_following"])
+        self.assertEqual(response.json()["not_found"], [])
+
+    @override_settings(BATCH_MAX_IDS=3)
+    def test_invalid_ids_are_rejected(self):
+        url = reverse("team-batch")
+        for query in ["", "?ids=", "?ids=1,x", "?ids=1,2,3,4"]:
+            self.assertEqual(self.client.get(url + query).status_code, 400, query)
@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+from social.models import UserFollow
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.other = User.objects.create_user(username="bob", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        home = Team.objects.create(name="Home")
+        away = Team.objects.create(name="Away")
+        self.match = Match.objects.create(
+            tournament=tournament,
+            home_team=home,
+            away_team=away,
+            date_time="2026-01-01T12:00:00Z",
+        )
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.auth)
+
+    def test_unchanged_list_returns_304_without_queries(self):
+        url = reverse("match-list")
+        first = self.client.get(url, **self.auth)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertIn("Last-Modified", first)
+        self.assertIn("no-cache", first["Cache-Control"])
+        # Only the token lookup runs before the 304.
+        with self.assertNumQueries(1):
+            response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_rating_write_changes_etag(self):
+        list_url = reverse("match-list")
+        detail_url = reverse("match-detail", args=[self.match.id])
+        list_etag = self.client.get(list_url, **self.auth)["ETag"]
+        detail_etag = self.client.get(detail_url, **self.auth)["ETag"]
+        Rating.objects.create(user=self.other, match=self.match, score=70)
+        response = self._revalidate(list_url, list_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["rating_count"], 1)
+        self.assertEqual(self._revalidate(detail_url, detail_etag).status_code, 200)
+
+    def test_match_import_update_changes_etag(self):
+        url = reverse("team-matches", args=[self.match.home_team_id])
+        etag = self.client.get(url, **self.auth)["ETag"]
+        self.assertEqual(self._revalidate(url, etag).status_code, 304)
+        self.match.home_score = 2
+        self.match.save(update_fields=["home_score"])
+        self.assertEqual(self._revalidate(url, etag).status_code, 200)
+
+    def test_profile_etag_tracks_follows_and_viewer(self):
+        url = reverse("public-profile", args=["bob"])
+        etag = self.client.get(url, **self.auth)["ETag"]
+        self.assertEqual(self._revalidate(url, etag).status_code, 304)
+        anonymous = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(anonymous.status_code, 200)
+        UserFollow.objects.create(follower=self.user, following=self.other)
+        response = self._revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["is_following"])
+
+    def test_profile_stats_etag_varies_by_range(self):
+        url = reverse("profile-stats", args=["bob"])
+        month = self.client.get(url + "?range=month", **self.auth)["ETag"]
+        self.assertEqual(self._revalidate(url + "?range=month", month).status_code, 304)
+        self.assertEqual(self._revalidate(url + "?range=year", month).status_code, 200)
+
+    def test_memory_updates_change_profile_etag(self):
+        Rating.objects.create(user=self.user, match=self.match, score=70, featured_order=1)
+        url = reverse("public-profile", args=["alice"])
+        etag = self.client.get(url, **self.auth)["ETag"]
+        anonymous = self.client.get(url)
+        self.assertEqual(self._revalidate(url, etag).status_code, 304)
+        response = self.client.delete(
+            reverse("profile-memory-detail", args=["alice", self.match.id]), **self.auth
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self._revalidate(url, etag).status_code, 200)
+        self.assertNotEqual(self.client.get(url)["ETag"], anonymous["ETag"])
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Prefetch
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from matches.fast_serializers import (
+    FastFeedMatchSerializer,
+    FastMatchListSerializer,
+    FastSearchMatchSerializer,
+)
+from matches.models import Match, Rating, Team, Tournament
+from matches.serializers import (
+    FeedMatchSerializer,
+    MatchListSerializer,
+    SearchMatchSerializer,
+)
+
+
+class FastSerializerEqualityTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        tournament = Tournament.objects.create(name="Liga", country="AR", code="LPF")
+        home = Team.objects.create(name="Home", logo_url="https://example.com/h.png")
+        away = Team.objects.create(name="Away", country="AR")
+        now = timezone.now().replace(microsecond=123456)
+        played = Match.objects.create(
+            tournament=tournament,
+            home_team=home,
+            away_team=away,
+            date_time=now - timedelta(days=2),
+            venue="Stadium",
+            status="FINISHED",
+            home_score=2,
+            away_score=1,
+            watchability_score=80,
+            watchability_confidence="high",
+            watchability_updated_at=now,
+        )
+        Match.objects.create(
+            tournament=tournament,
+            home_team=away,
+            away_team=home,
+            date_time=now + timedelta(days=3),
+        )
+        Rating.objects.create(user=self.user, match=played, score=73, review="Nice")
+
+    def _matches(self):
+        my_ratings = Rating.objects.filter(user=self.user).select_related("user")
+        return list(
+            Match.objects.select_related("tournament", "home_team", "away_team")
+            .annotate(rating_count=Count("ratings"))
+            .prefetch_related(
+                Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
+            )
+            .order_by("date_time")
+        )
+
+    def _assert_same_json(self, drf_class, fast_class):
+        matches = self._matches()
+        renderer = JSONRenderer()
+        expected = renderer.render(drf_class(matches, many=True).data)
+        self.assertEqual(renderer.render(fast_class(matches, many=True).data), expected)
+        self.assertEqual(
+            renderer.render(fast_class(matches[0]).data),
+            renderer.render(drf_class(matches[0]).data),
+        )
+
+    def test_feed_match_output_is_byte_identical(self):
+        self._assert_same_json(FeedMatchSerializer, FastFeedMatchSerializer)
+
+    def test_match_list_output_is_byte_identical(self):
+        self._assert_same_json(MatchListSerializer, FastMatchListSerializer)
+
+    def test_search_match_output_is_byte_identical(self):
+        self._assert_same_json(SearchMatchSerializer, FastSearchMatchSerializer)
+
+    @override_settings(TIME_ZONE="America/Argentina/Buenos_Aires")
+    def test_datetimes_follow_current_timezone(self):
+        self._assert_same_json(FeedMatchSerializer, FastFeedMatchSerializer)
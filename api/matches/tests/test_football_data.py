@@ -6,7 +6,7 @@ from django.test import TestCase, override_settings
 
 from matches.models import Match, Team, Tournament
 from matches.services.football_data import FootballDataClient, FootballDataError
-from matches.services.importers import import_matches_global
+from matches.services.importers import import_matches_global, upsert_team_from_api
 
 @override_settings(FOOTBALL_DATA_CACHE_SECONDS=0, FOOTBALL_DATA_THROTTLE_SECONDS=0)
 class FootballDataClientTests(TestCase):
@@ -284,6 +284,31 @@ class ImportMatchesTests(TestCase):
         self.assertEqual(summary_again.updated_matches, 0)
         self.assertEqual(summary_again.skipped_matches, 1)
 
+    def test_team_upsert_matches_names_that_fold_to_nothing_exactly(self):
+        zenit, created, _ = upsert_team_from_api(
+            {"id": 501, "name": "Зенит", "area": {"name": "Russia"}}
+        )
+        self.assertTrue(created)
+        spartak, created, _ = upsert_team_from_api(
+            {"id": 502, "name": "Спартак", "area": {"name": "Russia"}}
+        )
+        self.assertTrue(created)
+        self.assertNotEqual(zenit.pk, spartak.pk)
+
+        legacy = Team.objects.create(name="Атлетико", country="Spain")
+        team, created, _ = upsert_team_from_api(
+            {"id": 503, "name": "Атлетико", "area": {"name": "Spain"}}
+        )
+        self.assertFalse(created)
+        self.assertEqual(team.pk, legacy.pk)
+
+        accented = Team.objects.create(name="Atlético Madrid", country="Spain")
+        team, created, _ = upsert_team_from_api(
+            {"id": 504, "name": "Atletico Madrid", "area": {"name": "Spain"}}
+        )
+        self.assertFalse(created)
+        self.assertEqual(team.pk, accented.pk)
+
 
 class _FakeResponse:
     def __init__(self, status_code, payload, headers=None):
@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Team, Tournament
+
+
+class NormalizedFormatTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        self.teams = [Team.objects.create(name=f"Team {index}") for index in range(3)]
+        for index in range(4):
+            Match.objects.create(
+                tournament=tournament,
+                home_team=self.teams[index % 3],
+                away_team=self.teams[(index + 1) % 3],
+                date_time=f"2026-01-0{index + 1}T12:00:00Z",
+            )
+
+    def _denormalize(self, payload):
+        matches = []
+        for row in payload["results"]:
+            match = dict(row)
+            match["tournament"] = payload["tournaments"][str(match.pop("tournament_id"))]
+            match["home_team"] = payload["teams"][str(match.pop("home_team_id"))]
+            match["away_team"] = payload["teams"][str(match.pop("away_team_id"))]
+            matches.append(match)
+        return matches
+
+    def test_match_list_side_loads_entities(self):
+        url = reverse("match-list")
+        nested = self.client.get(url, **self.auth).json()
+        response = self.client.get(url + "?format=normalized", **self.auth)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["count"], 4)
+        self.assertEqual(len(payload["teams"]), 3)
+        self.assertEqual(len(payload["tournaments"]), 1)
+        self.assertNotIn("home_team", payload["results"][0])
+
+        self.assertEqual(
+            sorted(self._denormalize(payload), key=lambda item: item["id"]),
+            sorted(nested["results"], key=lambda item: item["id"]),
+        )
+
+    def test_renderer_format_override_still_works(self):
+        response = self.client.get(reverse("match-list") + "?format=json", **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("home_team", response.json()["results"][0])
+
+    def test_team_matches_normalized(self):
+        url = reverse("team-matches", kwargs={"pk": self.teams[0].id})
+        response = self.client.get(url + "?format=normalized", **self.auth)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["total"], len(payload["results"]))
+        self.assertIn(str(self.teams[0].id), payload["teams"])
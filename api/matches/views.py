@@ -2,15 +2,25 @@ from django.db.models import Case, Count, F, FloatField, Prefetch, Q, Sum, Value
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from social.models import UserFollow
+from core.batch import keyed_batch_payload, parse_batch_ids
+from core.conditional import conditional_get
+from core.negotiation import get_payload_format
+from core.streaming import get_stream_format, streaming_list_response
+from core.text import squash_text
+from social.services.graph import get_social_graph
+from .fast_serializers import (
+    FastFeedMatchSerializer,
+    FastMatchListSerializer,
+    normalize_matches,
+)
 from .models import Match, Rating
 from .serializers import (
-    MatchListSerializer,
     MatchDetailResponseSerializer,
     RatingMemorySerializer,
     RatingMemoryUpdateSerializer,
@@ -49,10 +59,25 @@ def _weighted_avg_score(ratings):
     return round(weighted_sum / weight_total, 2)
 
 
+def _match_list_versions(request, *args, **kwargs):
+    return [("matches", None), ("ratings", None), ("teams", None)]
+
+
+def _match_detail_versions(request, pk):
+    # Viewer's version covers the followed-ratings block.
+    return [
+        ("match", pk),
+        ("teams", None),
+        ("user", request.user.id),
+    ]
+
+
 class MatchListView(APIView):
     permission_classes = [IsAuthenticated]
+    match_serializer_class = FastMatchListSerializer
 
     # Returns a catalog of matches with optional filters.
+    @method_decorator(conditional_get(_match_list_versions))
     def get(self, request):
         date_param = request.query_params.get("date")
         from_param = request.query_params.get("from")
@@ -91,16 +116,16 @@ class MatchListView(APIView):
                 matches_qs = matches_qs.filter(tournament_id=int(trimmed))
             else:
                 matches_qs = matches_qs.filter(
-                    tournament__name__iexact=trimmed
+                    tournament__name_normalized=squash_text(trimmed)
                 )
 
         if search_param:
-            trimmed = search_param.strip()
-            if trimmed:
+            folded = squash_text(search_param)
+            if folded:
                 matches_qs = matches_qs.filter(
-                    Q(home_team__name__icontains=trimmed)
-                    | Q(away_team__name__icontains=trimmed)
-                    | Q(tournament__name__icontains=trimmed)
+                    Q(home_team__name_normalized__contains=folded)
+                    | Q(away_team__name_normalized__contains=folded)
+                    | Q(tournament__name_normalized__contains=folded)
                 )
 
         weight_case = _minutes_weight_case()
@@ -110,20 +135,57 @@ class MatchListView(APIView):
             rating_count=Count("ratings"),
         ).order_by("-date_time")
 
-        my_ratings = Rating.objects.filter(user=request.user)
+        my_ratings = Rating.objects.filter(user=request.user).select_related("user")
         matches_qs = matches_qs.prefetch_related(
             Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
         )
 
-        serializer = MatchListSerializer(matches_qs, many=True)
+        stream_format = get_stream_format(request)
+        if stream_format:
+            return streaming_list_response(
+                matches_qs, self.match_serializer_class, stream_format
+            )
+
+        if get_payload_format(request) == "normalized":
+            payload = normalize_matches(matches_qs)
+            return Response({"count": len(payload["results"]), **payload})
+
+        serializer = self.match_serializer_class(matches_qs, many=True)
         data = serializer.data
         return Response({"count": len(data), "results": data})
 
 
+class MatchBatchView(APIView):
+    permission_classes = [IsAuthenticated]
+    match_serializer_class = FastFeedMatchSerializer
+
+    # Returns list-shaped matches keyed by id, with null for unknown ids.
+    def get(self, request):
+        ids = parse_batch_ids(request)
+        weight_case = _minutes_weight_case()
+        my_ratings = Rating.objects.filter(user=request.user).select_related("user")
+        matches_qs = (
+            Match.objects.filter(id__in=ids)
+            .select_related("tournament", "home_team", "away_team")
+            .annotate(
+                weighted_score_sum=Sum(F("ratings__score") * weight_case),
+                weight_sum=Sum(weight_case),
+                rating_count=Count("ratings"),
+            )
+            .prefetch_related(
+                Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
+            )
+        )
+        serializer = self.match_serializer_class(matches_qs, many=True)
+        found = {item["id"]: item for item in serializer.data}
+        return Response(keyed_batch_payload(ids, found))
+
+
 class MatchDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
     # Returns match details with aggregate stats and context.
+    @method_decorator(conditional_get(_match_detail_versions))
     def get(self, request, pk):
         match = get_object_or_404(
             Match.objects.select_related(
@@ -149,9 +211,7 @@ class MatchDetailView(APIView):
 
         featured_reviews = ratings_qs.exclude(review="").order_by("-created_at")[:3]
 
-        following_ids = UserFollow.objects.filter(
-            follower=request.user
-        ).values_list("following_id", flat=True)
+        following_ids = get_social_graph(request.user.id).following_ids
         followed_ratings = ratings_qs.filter(user_id__in=following_ids).order_by(
             "-created_at"
         )[:10]
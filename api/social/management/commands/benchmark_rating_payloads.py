@@ -0,0 +1,115 @@
+import base64
+import os
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from matches.models import Match, Rating, Team, Tournament
+from matches.serializers import RatingListSerializer, RatingWithMatchSerializer
+from matches.services.ratings import with_photo_summary
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rating list payload sizes for the full and lean serializers "
+        "on synthetic data (rolled back afterwards)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ratings",
+            type=int,
+            default=50,
+            help="Synthetic ratings to create (default: 50).",
+        )
+        parser.add_argument(
+            "--photo-kb",
+            type=int,
+            default=100,
+            help="Size of each inline photo data URL in KB (default: 100).",
+        )
+
+    def handle(self, *args, **options):
+        count = max(int(options["ratings"]), 1)
+        photo_bytes = max(int(options["photo_kb"]), 1) * 1024 * 3 // 4
+        try:
+            with transaction.atomic():
+                rows = self._benchmark(count, photo_bytes)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        for label, size, elapsed in rows:
+            self.stdout.write(
+                f"{label:<8} {size / 1024:>10.1f} KB {elapsed * 1000:>9.1f} ms"
+            )
+        full_size, lean_size = rows[0][1], rows[1][1]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Lean payload is {lean_size / full_size:.1%} of the full payload "
+                f"for {count} ratings."
+            )
+        )
+
+    def _benchmark(self, count, photo_bytes):
+        User = get_user_model()
+        user = User.objects.create_user(username=f"payload-bench-{time.time_ns()}")
+        tournament = Tournament.objects.create(name="Benchmark League")
+        home = Team.objects.create(name="Benchmark Home")
+        away = Team.objects.create(name="Benchmark Away")
+        photo = "data:image/jpeg;base64," + base64.b64encode(
+            os.urandom(photo_bytes)
+        ).decode()
+        now = timezone.now()
+        matches = Match.objects.bulk_create(
+            Match(
+                tournament=tournament,
+                home_team=home,
+                away_team=away,
+                date_time=now - timedelta(days=index + 1),
+            )
+            for index in range(count)
+        )
+        Rating.objects.bulk_create(
+            Rating(
+                user=user,
+                match=match,
+                score=50,
+                stadium_photo_url=photo,
+                representative_photo_url=photo,
+                featured_note="Benchmark note",
+            )
+            for match in matches
+        )
+
+        base_qs = (
+            Rating.objects.filter(user=user)
+            .select_related(
+                "user",
+                "match",
+                "match__tournament",
+                "match__home_team",
+                "match__away_team",
+            )
+            .order_by("-created_at")
+        )
+        return [
+            self._measure("full", RatingWithMatchSerializer, base_qs),
+            self._measure("lean", RatingListSerializer, with_photo_summary(base_qs)),
+        ]
+
+    def _measure(self, label, serializer_class, queryset):
+        started = time.perf_counter()
+        data = serializer_class(list(queryset), many=True).data
+        payload = JSONRenderer().render(data)
+        elapsed = time.perf_counter() - started
+        return label, len(payload), elapsed
@@ -0,0 +1,161 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Value, When
+from django.utils import timezone
+
+from matches.models import Match, Team, Tournament
+from social.services.db_search import db_search_ids
+from social.services.search_index import TrigramIndex
+from social.services.text import fold_text, squash_text
+
+PREFIXES = ["Atlético", "Deportivo", "Club", "Unión", "Real", "Sporting", "FC", "São"]
+SYLLABLES = ["ma", "dri", "se", "vi", "lla", "bo", "ca", "ri", "ver", "to", "lu", "cá", "nia"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare team search latency for the legacy icontains query, the "
+        "in-memory trigram index and the database backend on synthetic data "
+        "(rolled back afterwards)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams",
+            type=int,
+            default=100_000,
+            help="Synthetic teams to create (default: 100000).",
+        )
+        parser.add_argument(
+            "--matches",
+            type=int,
+            default=1_000_000,
+            help="Synthetic matches to create (default: 1000000).",
+        )
+        parser.add_argument(
+            "--queries",
+            default="atletico,real ma,union san,dri",
+            help="Comma-separated queries to time.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per query; the median is reported (default: 5).",
+        )
+
+    def handle(self, *args, **options):
+        queries = [item.strip() for item in options["queries"].split(",") if item.strip()]
+        repeat = max(int(options["repeat"]), 1)
+        try:
+            with transaction.atomic():
+                rows, build_seconds = self._benchmark(
+                    max(int(options["teams"]), 1),
+                    max(int(options["matches"]), 0),
+                    queries,
+                    repeat,
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(f"In-memory index build: {build_seconds * 1000:.1f} ms")
+        self.stdout.write(f"{'query':<14} {'backend':<10} {'hits':>7} {'median':>11}")
+        for query, backend, hits, elapsed in rows:
+            self.stdout.write(
+                f"{query:<14} {backend:<10} {hits:>7} {elapsed * 1000:>8.2f} ms"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Benchmarked {len(queries)} queries on {connection.vendor}."
+            )
+        )
+
+    def _benchmark(self, team_count, match_count, queries, repeat):
+        rng = random.Random(42)
+        started = time.perf_counter()
+        # bulk_create skips save(), so the folded names are set here.
+        tournaments = Tournament.objects.bulk_create(
+            Tournament(
+                name=f"Benchmark League {index}",
+                name_normalized=f"benchmark league {index}",
+                country="Benchmark",
+            )
+            for index in range(max(team_count // 500, 1))
+        )
+        Team.objects.bulk_create(
+            (
+                Team(name=name, name_normalized=squash_text(name))
+                for name in (self._team_name(rng) for _ in range(team_count))
+            ),
+            batch_size=5000,
+        )
+        team_ids = list(Team.objects.values_list("id", flat=True))
+        now = timezone.now()
+        for offset in range(0, match_count, 5000):
+            batch = []
+            for index in range(min(5000, match_count - offset)):
+                home_id, away_id = rng.sample(team_ids, 2)
+                batch.append(
+                    Match(
+                        tournament=rng.choice(tournaments),
+                        home_team_id=home_id,
+                        away_team_id=away_id,
+                        date_time=now - timedelta(hours=offset + index),
+                    )
+                )
+            Match.objects.bulk_create(batch)
+        self.stdout.write(
+            f"Created {team_count} teams and {match_count} matches in "
+            f"{time.perf_counter() - started:.1f}s."
+        )
+
+        started = time.perf_counter()
+        index = TrigramIndex()
+        for row in Team.objects.values_list("id", "name"):
+            index.upsert(*row)
+        build_seconds = time.perf_counter() - started
+
+        backends = [
+            ("icontains", self._legacy_search),
+            ("memory", lambda query: index.search(fold_text(query).split(), query)),
+            ("database", lambda query: db_search_ids("teams", query)),
+        ]
+        rows = []
+        for query in queries:
+            for label, search in backends:
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    hits = len(search(query))
+                    timings.append(time.perf_counter() - started)
+                rows.append((query, label, hits, statistics.median(timings)))
+        return rows, build_seconds
+
+    def _team_name(self, rng):
+        city = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        return f"{rng.choice(PREFIXES)} {city.capitalize()}"
+
+    def _legacy_search(self, query):
+        # The SearchView query before the search index existed.
+        teams_qs = Team.objects.all()
+        for token in fold_text(query).split():
+            teams_qs = teams_qs.filter(name__icontains=token)
+        teams_qs = teams_qs.annotate(
+            rank=Case(
+                When(name__iexact=query, then=Value(0)),
+                When(name__istartswith=query, then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField(),
+            )
+        ).order_by("rank", "name")
+        return list(teams_qs.values_list("id", flat=True))
@@ -0,0 +1,139 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from social.services.suggest import (
+    SUGGEST_KINDS,
+    PrefixIndex,
+    Suggestion,
+    _database_suggestions,
+    load_suggestions,
+)
+from social.services.text import squash_text
+
+PREFIXES = ["Atlético", "Deportivo", "Club", "Unión", "Real", "Sporting", "FC", "São"]
+SYLLABLES = ["ma", "dri", "se", "vi", "lla", "bo", "ca", "ri", "ver", "to", "lu", "cá", "nia"]
+# Lookups timed against the database fallback that answers while a worker's
+# first index build is still running.
+COLD_QUERIES = 200
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure autocomplete lookup latency on a synthetic prefix index and "
+        "fail when p99 exceeds the budget. Also times a refresh from the "
+        "configured database and the cold-start fallback lookups, which the "
+        "budget does not cover."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entries",
+            type=int,
+            default=100_000,
+            help="Synthetic teams, leagues and users to index (default: 100000).",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=20_000,
+            help="Prefix lookups to time (default: 20000).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=8,
+            help="Suggestions per lookup (default: 8).",
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=10.0,
+            help="Allowed p99 latency in milliseconds (default: 10).",
+        )
+        parser.add_argument(
+            "--skip-database",
+            action="store_true",
+            help="Skip the refresh and cold-start timings against the database.",
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        entries = max(int(options["entries"]), 1)
+        suggestions = [
+            Suggestion(
+                SUGGEST_KINDS[index % len(SUGGEST_KINDS)],
+                index,
+                self._name(rng),
+                "",
+                rng.paretovariate(1.5),
+            )
+            for index in range(entries)
+        ]
+
+        started = time.perf_counter()
+        index = PrefixIndex(suggestions)
+        build_seconds = time.perf_counter() - started
+
+        # Typed prefixes of real names, as a user would send keystroke by keystroke.
+        queries = []
+        for _ in range(max(int(options["queries"]), 1)):
+            folded = squash_text(rng.choice(suggestions).name)
+            queries.append(folded[: rng.randint(1, min(len(folded), 8))])
+
+        timings = []
+        limit = max(int(options["limit"]), 1)
+        for query in queries:
+            started = time.perf_counter()
+            index.suggest(query, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        p50, p95, p99 = self._percentiles(timings)
+        self.stdout.write(
+            f"Indexed {entries} names ({len(index.keys)} keys) in {build_seconds * 1000:.0f} ms."
+        )
+        self.stdout.write(
+            f"{len(queries)} warm lookups: p50 {p50:.3f} ms, p95 {p95:.3f} ms, "
+            f"p99 {p99:.3f} ms, max {max(timings):.3f} ms"
+        )
+        if options["skip_database"]:
+            self.stdout.write(
+                "Refresh and cold-start lookups not measured (--skip-database)."
+            )
+        else:
+            self._database_timings(queries[:COLD_QUERIES], limit)
+        budget = float(options["budget_ms"])
+        if p99 > budget:
+            raise CommandError(f"Warm p99 {p99:.3f} ms exceeds the {budget:g} ms budget.")
+        self.stdout.write(self.style.SUCCESS(f"Warm p99 within the {budget:g} ms budget."))
+
+    def _database_timings(self, queries, limit):
+        started = time.perf_counter()
+        index = PrefixIndex(load_suggestions())
+        self.stdout.write(
+            f"Refresh from the database: {len(index.suggestions)} names in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms (background thread; "
+            "requests keep the previous index meanwhile)."
+        )
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            _database_suggestions(query, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+        p50, p95, p99 = self._percentiles(timings)
+        self.stdout.write(
+            f"{len(timings)} cold-start lookups (database fallback before the first build): "
+            f"p50 {p50:.3f} ms, p95 {p95:.3f} ms, p99 {p99:.3f} ms"
+        )
+
+    def _percentiles(self, timings):
+        if len(timings) < 2:
+            return timings[0], timings[0], timings[0]
+        cuts = statistics.quantiles(timings, n=100)
+        return cuts[49], cuts[94], cuts[98]
+
+    def _name(self, rng):
+        city = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        return f"{rng.choice(PREFIXES)} {city.capitalize()}"
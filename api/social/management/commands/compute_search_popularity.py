@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from social.services.popularity import POPULARITY_KINDS, refresh_search_popularity
+from social.services.search_changes import prune_search_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute search popularity signals (followers, recent ratings, "
+        "upcoming fixtures). Run nightly in full, or with --since-hours for "
+        "incremental updates. Incremental runs pick up new follows, ratings "
+        "and kickoffs and ratings aging out of the window, but unfollows only "
+        "lower scores at the next full run. Full runs also prune the search "
+        "change feed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            dest="kinds",
+            choices=POPULARITY_KINDS,
+            help="Only refresh this kind (repeatable).",
+        )
+        parser.add_argument(
+            "--since-hours",
+            type=int,
+            default=None,
+            help="Only refresh objects with activity in the last N hours.",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since_hours"] is not None:
+            since = timezone.now() - timedelta(hours=max(options["since_hours"], 0))
+        written = refresh_search_popularity(options.get("kinds"), since=since)
+        summary = ", ".join(f"{kind}={count}" for kind, count in written.items())
+        if since is None:
+            summary += f", pruned {prune_search_changes()} search changes"
+        self.stdout.write(self.style.SUCCESS(f"Refreshed search popularity: {summary}."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from social.services.rollups import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Backfill per-user daily rating rollups from existing ratings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only rebuild this user id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        rows = rebuild_daily_stats(options.get("user_ids"))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily rollup rows."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from social.services.stats import rebuild_all_user_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized profile counters from ratings and follows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only rebuild this user id (repeatable).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Users per aggregate batch (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_all_user_stats(
+            options.get("user_ids"),
+            batch_size=max(int(options["batch_size"]), 1),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {rebuilt} users."))
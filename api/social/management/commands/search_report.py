@@ -0,0 +1,111 @@
+import statistics
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, Max
+from django.utils import timezone
+
+from social.models import SearchQueryLog
+
+
+def _percentile(values, cut: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[cut - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Report top searches, zero-result searches and latency percentiles "
+        "from SearchQueryLog."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Days of searches to report on (default: 7).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Queries listed per section (default: 20).",
+        )
+        parser.add_argument(
+            "--prune-days",
+            type=int,
+            default=None,
+            help="Delete searches older than this many days first.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        if options["prune_days"] is not None:
+            deleted, _ = SearchQueryLog.objects.filter(
+                created_at__lt=now - timedelta(days=max(options["prune_days"], 1))
+            ).delete()
+            self.stdout.write(f"Pruned {deleted} old searches.")
+
+        days = max(int(options["days"]), 1)
+        limit = max(int(options["limit"]), 1)
+        logs = SearchQueryLog.objects.filter(created_at__gte=now - timedelta(days=days))
+
+        durations = []
+        per_type = {}
+        cached = 0
+        for duration_ms, types in logs.values_list("duration_ms", "per_type").iterator():
+            durations.append(duration_ms)
+            # Served from the anonymous response cache: no per-type runs.
+            cached += int(not types)
+            for kind, outcome in (types or {}).items():
+                stats = per_type.setdefault(kind, {"ms": [], "hits": 0, "empty": 0})
+                stats["ms"].append(outcome.get("ms", 0.0))
+                stats["hits"] += int(bool(outcome.get("hit")))
+                stats["empty"] += int(not outcome.get("count"))
+        if not durations:
+            self.stdout.write(f"No searches recorded in the last {days} days.")
+            return
+
+        self.stdout.write(
+            f"{len(durations)} searches in the last {days} days: "
+            f"p50 {_percentile(durations, 50):.1f} ms, "
+            f"p95 {_percentile(durations, 95):.1f} ms, max {max(durations):.1f} ms, "
+            f"{cached * 100 / len(durations):.0f}% from the response cache"
+        )
+        for kind in sorted(per_type):
+            stats = per_type[kind]
+            runs = len(stats["ms"])
+            self.stdout.write(
+                f"  {kind}: {runs} runs, p95 {_percentile(stats['ms'], 95):.1f} ms, "
+                f"cache hits {stats['hits'] * 100 / runs:.0f}%, "
+                f"empty {stats['empty'] * 100 / runs:.0f}%"
+            )
+
+        grouped = logs.values("query").annotate(
+            searches=Count("id"), avg_ms=Avg("duration_ms"), max_ms=Max("duration_ms")
+        )
+        self._section(
+            "Top queries",
+            grouped.order_by("-searches", "query")[:limit],
+        )
+        self._section(
+            "Zero-result queries",
+            grouped.filter(total=0).order_by("-searches", "query")[:limit],
+        )
+        self._section(
+            "Slowest queries",
+            grouped.order_by("-max_ms", "query")[:limit],
+        )
+        self.stdout.write(self.style.SUCCESS("Search report complete."))
+
+    def _section(self, title, rows):
+        self.stdout.write(f"\n{title}:")
+        for row in rows:
+            self.stdout.write(
+                f"  {row['searches']:>6}  avg {row['avg_ms']:>7.1f} ms  "
+                f"max {row['max_ms']:>7.1f} ms  {row['query']}"
+            )
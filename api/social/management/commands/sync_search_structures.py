@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from social.services.db_search import sync_search_structures
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or drop the database search tables, triggers and indexes to "
+        "match SEARCH_BACKEND. Run after switching backends."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            outcome = sync_search_structures()
+        if outcome == "unsupported":
+            self.stderr.write(
+                "This database cannot host the search structures; "
+                "searches fall back to the normalized name columns."
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Search structures {outcome} (SEARCH_BACKEND={settings.SEARCH_BACKEND})."
+            )
+        )
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from social.services.warmup import warm_caches
+
+
+class Command(BaseCommand):
+    help = (
+        "Prefill search indexes and the shared caches for the most searched "
+        "queries and the most popular teams and profiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--searches",
+            type=int,
+            default=None,
+            help="Top recorded searches to replay (default: WARMUP_TOP_N).",
+        )
+        parser.add_argument(
+            "--teams",
+            type=int,
+            default=None,
+            help="Most popular teams to warm (default: WARMUP_TOP_N).",
+        )
+        parser.add_argument(
+            "--profiles",
+            type=int,
+            default=None,
+            help="Most popular profiles to warm (default: WARMUP_TOP_N).",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Days of recorded searches to rank (default: 7).",
+        )
+        parser.add_argument(
+            "--connections",
+            type=int,
+            default=None,
+            help="Most database connections held at once (default: WARMUP_DB_CONNECTIONS).",
+        )
+
+    def handle(self, *args, **options):
+        summary = warm_caches(
+            searches=options["searches"],
+            teams=options["teams"],
+            profiles=options["profiles"],
+            days=max(int(options["days"]), 1),
+            workers=options["connections"],
+        )
+        indexes = ", ".join(f"{kind}={size}" for kind, size in summary["indexes"].items())
+        self.stdout.write(f"Indexes: {indexes}")
+        self.stdout.write(
+            f"Warmed {summary.get('searches', 0)} searches, {summary.get('teams', 0)} team "
+            f"requests and {summary.get('profiles', 0)} profiles in {summary['seconds']} s "
+            f"({summary.get('failed', 0)} failed)."
+        )
+        self.stdout.write(self.style.SUCCESS("Cache warmup complete."))
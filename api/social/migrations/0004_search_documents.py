@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.db import migrations
+
+from core.text import squash_text
+
+# The search SQL is frozen here rather than imported from
+# social.services.db_search, so later changes to the service do not
+# rewrite history. Structures are only created for SEARCH_BACKEND =
+# "database"; the SQLite triggers call bbx_fold, a per-connection function,
+# and would break writes from connections that never registered it.
+# Switching backends later goes through the sync_search_structures command.
+FOLD_FUNCTION = "bbx_fold"
+SEARCH_SOURCES = (
+    # (model, FTS table, indexed fields; the first is the display name)
+    ("matches.Team", "social_search_teams", ("name",)),
+    ("matches.Tournament", "social_search_leagues", ("name", "country")),
+    (settings.AUTH_USER_MODEL, "social_search_users", ("username",)),
+)
+
+POSTGRES_FUNCTION_SQL = (
+    "CREATE OR REPLACE FUNCTION bbx_fold(value text) RETURNS text AS $$ "
+    "SELECT btrim(regexp_replace(regexp_replace("
+    "lower(public.unaccent('public.unaccent'::regdictionary, coalesce(value, ''))), "
+    "'[^a-z0-9\\s]+', ' ', 'g'), '\\s+', ' ', 'g')) "
+    "$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE"
+)
+
+
+def _fold_sql_value(value):
+    return squash_text(value) if value is not None else ""
+
+
+def _folded_body_sql(fields, prefix="") -> str:
+    return " || ' ' || ".join(f"bbx_fold({prefix}{field})" for field in fields)
+
+
+def _sqlite_schema_sql(fts, fields, table) -> list[str]:
+    name = fields[0]
+    insert = (
+        f"INSERT INTO {fts}(rowid, name, folded_name, body) VALUES "
+        f"(new.id, new.{name}, bbx_fold(new.{name}), {_folded_body_sql(fields, 'new.')});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        "name UNINDEXED, folded_name UNINDEXED, body, tokenize = 'trigram')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {', '.join(fields)} ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; END",
+        f"INSERT INTO {fts}(rowid, name, folded_name, body) "
+        f"SELECT id, {name}, bbx_fold({name}), {_folded_body_sql(fields)} FROM {table}",
+    ]
+
+
+def _sqlite_has_fts5(cursor) -> bool:
+    cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+    return bool(cursor.fetchone()[0])
+
+
+def create_search_structures(apps, schema_editor):
+    if getattr(settings, "SEARCH_BACKEND", "memory") != "database":
+        return
+    connection = schema_editor.connection
+    vendor = connection.vendor
+    if vendor == "sqlite":
+        connection.ensure_connection()
+        connection.connection.create_function(
+            FOLD_FUNCTION, 1, _fold_sql_value, deterministic=True
+        )
+        with connection.cursor() as cursor:
+            if not _sqlite_has_fts5(cursor):
+                return
+            for model, fts, fields in SEARCH_SOURCES:
+                table = apps.get_model(model)._meta.db_table
+                for sql in _sqlite_schema_sql(fts, fields, table):
+                    cursor.execute(sql)
+    elif vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+            cursor.execute(POSTGRES_FUNCTION_SQL)
+            for model, fts, fields in SEARCH_SOURCES:
+                table = apps.get_model(model)._meta.db_table
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {fts}_trgm ON {table} "
+                    f"USING gin (({_folded_body_sql(fields)}) gin_trgm_ops)"
+                )
+
+
+def drop_search_structures(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for _model, fts, _fields in SEARCH_SOURCES:
+            if connection.vendor == "sqlite":
+                for suffix in ("ai", "au", "ad"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+                cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+            elif connection.vendor == "postgresql":
+                cursor.execute(f"DROP INDEX IF EXISTS {fts}_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0003_userdailystats"),
+        ("matches", "0006_match_watchability_fields"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_structures, drop_search_structures),
+    ]
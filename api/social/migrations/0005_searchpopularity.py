@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0004_search_documents"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchPopularity",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(max_length=10)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("followers", models.PositiveIntegerField(default=0)),
+                ("recent_ratings", models.PositiveIntegerField(default=0)),
+                ("upcoming_matches", models.PositiveIntegerField(default=0)),
+                ("score", models.FloatField(default=0.0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "object_id"), name="uniq_search_popularity")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from core.text import squash_text
+
+BATCH_SIZE = 1000
+# Frozen copy of the search sync triggers (see 0004_search_documents):
+# (model, FTS table, indexed fields; the first is the display name).
+SQLITE_TRIGGER_SOURCES = (
+    ("matches.Team", "social_search_teams", ("name",)),
+    ("matches.Tournament", "social_search_leagues", ("name", "country")),
+)
+
+
+def _fold_sql_value(value):
+    return squash_text(value) if value is not None else ""
+
+
+def _sqlite_trigger_sql(fts, fields, table) -> list[str]:
+    name = fields[0]
+    body = " || ' ' || ".join(f"bbx_fold(new.{field})" for field in fields)
+    insert = (
+        f"INSERT INTO {fts}(rowid, name, folded_name, body) VALUES "
+        f"(new.id, new.{name}, bbx_fold(new.{name}), {body});"
+    )
+    return [
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {', '.join(fields)} ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; END",
+    ]
+
+
+def backfill_user_search_names(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    UserSearchName = apps.get_model("social", "UserSearchName")
+    batch = []
+    for user_id, username in User.objects.values_list("id", "username").iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        batch.append(UserSearchName(user_id=user_id, username_normalized=squash_text(username)))
+        if len(batch) >= BATCH_SIZE:
+            UserSearchName.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        UserSearchName.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def restore_sqlite_search_triggers(apps, schema_editor):
+    # Adding name_normalized rebuilt the SQLite team and tournament tables,
+    # which drops the triggers keeping their FTS tables in sync.
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    connection.ensure_connection()
+    connection.connection.create_function(
+        "bbx_fold", 1, _fold_sql_value, deterministic=True
+    )
+    with connection.cursor() as cursor:
+        for model, fts, fields in SQLITE_TRIGGER_SOURCES:
+            # Only databases migrated with SEARCH_BACKEND = "database" have them.
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [fts],
+            )
+            if cursor.fetchone() is None:
+                continue
+            for suffix in ("ai", "au", "ad"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            table = apps.get_model(model)._meta.db_table
+            for sql in _sqlite_trigger_sql(fts, fields, table):
+                cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0005_searchpopularity"),
+        ("matches", "0007_name_normalized"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserSearchName",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_name",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("username_normalized", models.CharField(max_length=150)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["username_normalized"],
+                        name="user_search_name_norm_idx",
+                        opclasses=["varchar_pattern_ops"],
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_user_search_names, migrations.RunPython.noop),
+        migrations.RunPython(restore_sqlite_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0006_usersearchname"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchQueryLog",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("query", models.CharField(max_length=200)),
+                ("types", models.CharField(max_length=40)),
+                ("total", models.PositiveIntegerField(default=0)),
+                ("duration_ms", models.FloatField()),
+                ("per_type", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,115 @@
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Frozen copies of rebuild_daily_stats and rebuild_all_user_stats (grouped
+# queries, no per-user loops) over the historical models, so the rollups
+# and counters exist for ratings written before they were introduced.
+FULL = "FULL"
+BATCH_SIZE = 500
+
+
+def backfill_daily_stats(apps, schema_editor):
+    Rating = apps.get_model("matches", "Rating")
+    UserDailyStats = apps.get_model("social", "UserDailyStats")
+    by_day = Rating.objects.annotate(day=TruncDate("created_at")).order_by()
+
+    rows = {}
+    for item in by_day.values("user_id", "day").annotate(
+        rating_count=Count("id"),
+        score_sum=Sum("score"),
+        full_count=Count("id", filter=Q(minutes_watched=FULL)),
+    ):
+        rows[(item["user_id"], item["day"])] = UserDailyStats(
+            user_id=item["user_id"],
+            day=item["day"],
+            rating_count=item["rating_count"],
+            score_sum=item["score_sum"] or 0,
+            full_count=item["full_count"],
+            team_counts={},
+            tournament_counts={},
+        )
+
+    team_counts = defaultdict(Counter)
+    for column in ("match__home_team_id", "match__away_team_id"):
+        for user_id, day, team_id, total in (
+            by_day.values("user_id", "day", column)
+            .annotate(total=Count("id"))
+            .values_list("user_id", "day", column, "total")
+        ):
+            team_counts[(user_id, day)][str(team_id)] += total
+    for key, counts in team_counts.items():
+        rows[key].team_counts = dict(counts)
+
+    for user_id, day, tournament_id, total in (
+        by_day.values("user_id", "day", "match__tournament_id")
+        .annotate(total=Count("id"))
+        .values_list("user_id", "day", "match__tournament_id", "total")
+    ):
+        rows[(user_id, day)].tournament_counts[str(tournament_id)] = total
+
+    UserDailyStats.objects.all().delete()
+    UserDailyStats.objects.bulk_create(rows.values(), batch_size=BATCH_SIZE)
+
+
+def _grouped(queryset, column: str) -> dict:
+    return dict(
+        queryset.values(column).annotate(total=Count("id")).values_list(column, "total")
+    )
+
+
+def backfill_user_stats(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Rating = apps.get_model("matches", "Rating")
+    Follow = apps.get_model("social", "Follow")
+    UserFollow = apps.get_model("social", "UserFollow")
+    UserStats = apps.get_model("social", "UserStats")
+
+    all_ids = list(User.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(all_ids), BATCH_SIZE):
+        batch = all_ids[start : start + BATCH_SIZE]
+        ratings = {
+            row["user_id"]: row
+            for row in Rating.objects.filter(user_id__in=batch)
+            .values("user_id")
+            .annotate(
+                total_ratings=Count("id"),
+                score_sum=Sum("score"),
+                full_count=Count("id", filter=Q(minutes_watched=FULL)),
+            )
+        }
+        teams = _grouped(Follow.objects.filter(user_id__in=batch), "user_id")
+        followers = _grouped(UserFollow.objects.filter(following_id__in=batch), "following_id")
+        following = _grouped(UserFollow.objects.filter(follower_id__in=batch), "follower_id")
+        UserStats.objects.filter(user_id__in=batch).delete()
+        UserStats.objects.bulk_create(
+            UserStats(
+                user_id=user_id,
+                teams_followed=teams.get(user_id, 0),
+                followers=followers.get(user_id, 0),
+                following=following.get(user_id, 0),
+                total_ratings=ratings.get(user_id, {}).get("total_ratings") or 0,
+                score_sum=ratings.get(user_id, {}).get("score_sum") or 0,
+                full_count=ratings.get(user_id, {}).get("full_count") or 0,
+                updated_at=timezone.now(),
+            )
+            for user_id in batch
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0007_searchquerylog"),
+        ("matches", "0007_name_normalized"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+        migrations.RunPython(backfill_user_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import migrations
+
+# Frozen names from 0004_search_documents. Databases migrated before the
+# structures were gated on SEARCH_BACKEND have the SQLite triggers, whose
+# bbx_fold calls fail on connections that never registered the function,
+# and GIN indexes nothing queries; drop them unless the backend uses them.
+FTS_TABLES = ("social_search_teams", "social_search_leagues", "social_search_users")
+
+
+def drop_unused_search_structures(apps, schema_editor):
+    if getattr(settings, "SEARCH_BACKEND", "memory") == "database":
+        return
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for fts in FTS_TABLES:
+            if connection.vendor == "sqlite":
+                for suffix in ("ai", "au", "ad"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+                cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+            elif connection.vendor == "postgresql":
+                cursor.execute(f"DROP INDEX IF EXISTS {fts}_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0008_backfill_user_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_unused_search_structures, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0009_gate_search_structures"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(max_length=20)),
+                ("object_id", models.PositiveBigIntegerField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["kind", "created_at"], name="search_change_kind_idx"),
+                    models.Index(fields=["created_at"], name="search_change_created_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social", "0010_searchchange"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchquerylog",
+            name="request_params",
+            field=models.CharField(blank=True, default="", max_length=500),
+        ),
+    ]
@@ -59,3 +59,150 @@ class UserFollow(models.Model):
 
     def __str__(self) -> str:
         return f"{self.follower} -> {self.following}"
+
+
+class UserStats(models.Model):
+    """Denormalized per-user counters backing profile responses."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="profile_stats",
+    )
+    teams_followed = models.PositiveIntegerField(default=0)
+    followers = models.PositiveIntegerField(default=0)
+    following = models.PositiveIntegerField(default=0)
+    total_ratings = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveBigIntegerField(default=0)
+    full_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.user} stats"
+
+    @property
+    def avg_score(self) -> float:
+        if not self.total_ratings:
+            return 0.0
+        return round(self.score_sum / self.total_ratings, 2)
+
+    @property
+    def fully_watched_pct(self) -> float:
+        if not self.total_ratings:
+            return 0.0
+        return round((self.full_count / self.total_ratings) * 100, 2)
+
+
+class UserDailyStats(models.Model):
+    """Per-user, per-day rollup of ratings for range queries."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+    )
+    day = models.DateField()
+    rating_count = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveIntegerField(default=0)
+    full_count = models.PositiveIntegerField(default=0)
+    team_counts = models.JSONField(default=dict, blank=True)
+    tournament_counts = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day"],
+                name="uniq_user_daily_stats",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} {self.day}"
+
+
+class SearchPopularity(models.Model):
+    """Precomputed popularity signals blended into search ranking."""
+
+    kind = models.CharField(max_length=10)
+    object_id = models.PositiveBigIntegerField()
+    followers = models.PositiveIntegerField(default=0)
+    recent_ratings = models.PositiveIntegerField(default=0)
+    upcoming_matches = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                name="uniq_search_popularity",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id} {self.score:.2f}"
+
+
+class UserSearchName(models.Model):
+    """Accent-folded username, indexed for exact and prefix lookups."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_name",
+    )
+    username_normalized = models.CharField(max_length=150)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["username_normalized"],
+                name="user_search_name_norm_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.username_normalized
+
+
+class SearchQueryLog(models.Model):
+    """One executed search, written in batches by the analytics buffer."""
+
+    query = models.CharField(max_length=200)
+    types = models.CharField(max_length=40)
+    total = models.PositiveIntegerField(default=0)
+    duration_ms = models.FloatField()
+    # {"teams": {"count": 3, "ms": 1.2, "hit": true}, ...}
+    per_type = models.JSONField(default=dict, blank=True)
+    # The query string as the response cache keys it (raw q, sorted, blanks
+    # dropped), so warmup replays the URLs clients actually send.
+    request_params = models.CharField(max_length=500, blank=True, default="")
+    created_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"{self.query} ({self.duration_ms:.0f} ms)"
+
+
+class SearchChange(models.Model):
+    """Append-only log of searchable writes, read by every process.
+
+    Name changes are logged per object (kind = teams/leagues/users) so
+    per-process indexes can apply them as deltas; popularity refreshes log
+    one row per kind with no object.
+    """
+
+    kind = models.CharField(max_length=20)
+    object_id = models.PositiveBigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["kind", "created_at"], name="search_change_kind_idx"),
+            models.Index(fields=["created_at"], name="search_change_created_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id}"
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from core.serializers import UserMiniSerializer
 from matches.serializers import (
+    RatingListSerializer,
     RatingWithMatchSerializer,
     TeamSerializer,
     TeamSummarySerializer,
@@ -42,14 +43,14 @@ class ProfileStatsResponseSerializer(serializers.Serializer):
 class ProfileActivityResponseSerializer(serializers.Serializer):
     user = UserMiniSerializer()
     range = serializers.CharField()
-    results = RatingWithMatchSerializer(many=True)
+    results = RatingListSerializer(many=True)
 
 
 class ProfileHighlightsResponseSerializer(serializers.Serializer):
     user = UserMiniSerializer()
     range = serializers.CharField()
-    top_rated = RatingWithMatchSerializer(many=True)
-    low_rated = RatingWithMatchSerializer(many=True)
+    top_rated = RatingListSerializer(many=True)
+    low_rated = RatingListSerializer(many=True)
 
 
 class ProfileMemoriesResponseSerializer(serializers.Serializer):
@@ -60,13 +61,13 @@ class ProfileMemoriesResponseSerializer(serializers.Serializer):
 
 class ProfileRatedResponseSerializer(serializers.Serializer):
     user = UserMiniSerializer()
-    results = RatingWithMatchSerializer(many=True)
+    results = RatingListSerializer(many=True)
 
 
 class ProfileResponseSerializer(serializers.Serializer):
     user = UserMiniSerializer()
     stats = ProfileStatsSerializer()
-    recent_activity = RatingWithMatchSerializer(many=True)
+    recent_activity = RatingListSerializer(many=True)
 
 
 class FriendFeedMatchSerializer(serializers.Serializer):
@@ -100,4 +101,4 @@ class PublicProfileRatingsResponseSerializer(serializers.Serializer):
     page = serializers.IntegerField()
     page_size = serializers.IntegerField()
     total = serializers.IntegerField()
-    ratings = RatingWithMatchSerializer(many=True)
+    ratings = RatingListSerializer(many=True)
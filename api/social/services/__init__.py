@@ -0,0 +1 @@
+"""Service layer for follows and profiles."""
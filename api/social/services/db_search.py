@@ -0,0 +1,356 @@
+"""
+Database-backed search for teams, leagues and users.
+
+SQLite keeps one FTS5 trigram table per kind (rowid = source id), synced by
+triggers that fold names through the ``bbx_fold`` SQL function registered on
+every connection. Postgres indexes ``bbx_fold(...)`` expressions with
+pg_trgm GIN indexes, ``bbx_fold`` being an IMMUTABLE wrapper over
+``unaccent``. Other vendors fall back to substring filters on the stored
+``*_normalized`` columns. Popularity is blended in by joining the
+precomputed SearchPopularity rows.
+
+The tables, triggers and indexes only exist while SEARCH_BACKEND is
+"database": sync_search_structures creates or drops them to match.
+"""
+from dataclasses import dataclass
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.db.models import Q
+
+from .text import fold_text, squash_text
+
+FOLD_FUNCTION = "bbx_fold"
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    kind: str
+    model: str
+    fields: tuple[str, ...]
+    # Stored squash_text(name), b-tree indexed for equality and prefixes.
+    normalized_field: str
+
+    @property
+    def name_field(self) -> str:
+        return self.fields[0]
+
+    @property
+    def fts_table(self) -> str:
+        return f"social_search_{self.kind}"
+
+
+SEARCH_SOURCES = {
+    "teams": SearchSource("teams", "matches.Team", ("name",), "name_normalized"),
+    "leagues": SearchSource(
+        "leagues", "matches.Tournament", ("name", "country"), "name_normalized"
+    ),
+    "users": SearchSource(
+        "users",
+        settings.AUTH_USER_MODEL,
+        ("username",),
+        "search_name__username_normalized",
+    ),
+}
+
+
+def _fold_sql_value(value):
+    return squash_text(value) if value is not None else ""
+
+
+def register_sqlite_functions(sender=None, connection=None, **kwargs):
+    if connection is not None and connection.vendor == "sqlite":
+        connection.connection.create_function(
+            FOLD_FUNCTION, 1, _fold_sql_value, deterministic=True
+        )
+
+
+def _folded_body_sql(source, prefix="") -> str:
+    return " || ' ' || ".join(
+        f"{FOLD_FUNCTION}({prefix}{field})" for field in source.fields
+    )
+
+
+def sqlite_trigger_sql(source, table: str) -> list[str]:
+    fts = source.fts_table
+    name = source.name_field
+    insert = (
+        f"INSERT INTO {fts}(rowid, name, folded_name, body) VALUES "
+        f"(new.id, new.{name}, {FOLD_FUNCTION}(new.{name}), "
+        f"{_folded_body_sql(source, 'new.')});"
+    )
+    columns = ", ".join(source.fields)
+    return [
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; END",
+    ]
+
+
+def sqlite_schema_sql(source, table: str) -> list[str]:
+    fts = source.fts_table
+    name = source.name_field
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        "name UNINDEXED, folded_name UNINDEXED, body, tokenize = 'trigram')",
+        *sqlite_trigger_sql(source, table),
+        f"INSERT INTO {fts}(rowid, name, folded_name, body) "
+        f"SELECT id, {name}, {FOLD_FUNCTION}({name}), {_folded_body_sql(source)} "
+        f"FROM {table}",
+    ]
+
+
+def sqlite_drop_sql(source) -> list[str]:
+    fts = source.fts_table
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def _sqlite_has_fts5(cursor) -> bool:
+    cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+    return bool(cursor.fetchone()[0])
+
+
+POSTGRES_FUNCTION_SQL = (
+    f"CREATE OR REPLACE FUNCTION {FOLD_FUNCTION}(value text) RETURNS text AS $$ "
+    "SELECT btrim(regexp_replace(regexp_replace("
+    "lower(public.unaccent('public.unaccent'::regdictionary, coalesce(value, ''))), "
+    "'[^a-z0-9\\s]+', ' ', 'g'), '\\s+', ' ', 'g')) "
+    "$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE"
+)
+
+
+def postgres_index_sql(source, table: str) -> str:
+    return (
+        f"CREATE INDEX IF NOT EXISTS {source.fts_table}_trgm ON {table} "
+        f"USING gin (({_folded_body_sql(source)}) gin_trgm_ops)"
+    )
+
+
+def search_structures_exist() -> bool:
+    probe = SEARCH_SOURCES["teams"].fts_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [probe]
+            )
+        elif connection.vendor == "postgresql":
+            cursor.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", [f"{probe}_trgm"])
+        else:
+            return False
+        return cursor.fetchone() is not None
+
+
+def create_search_structures() -> bool:
+    if connection.vendor == "sqlite":
+        connection.ensure_connection()
+        register_sqlite_functions(connection=connection)
+        with connection.cursor() as cursor:
+            if not _sqlite_has_fts5(cursor):
+                return False
+            for source in SEARCH_SOURCES.values():
+                table = global_apps.get_model(source.model)._meta.db_table
+                for sql in sqlite_schema_sql(source, table):
+                    cursor.execute(sql)
+        return True
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+            cursor.execute(POSTGRES_FUNCTION_SQL)
+            for source in SEARCH_SOURCES.values():
+                table = global_apps.get_model(source.model)._meta.db_table
+                cursor.execute(postgres_index_sql(source, table))
+        return True
+    return False
+
+
+def drop_search_structures() -> None:
+    with connection.cursor() as cursor:
+        for source in SEARCH_SOURCES.values():
+            if connection.vendor == "sqlite":
+                for sql in sqlite_drop_sql(source):
+                    cursor.execute(sql)
+            elif connection.vendor == "postgresql":
+                cursor.execute(f"DROP INDEX IF EXISTS {source.fts_table}_trgm")
+
+
+def sync_search_structures() -> str:
+    wanted = settings.SEARCH_BACKEND == "database"
+    if wanted == search_structures_exist():
+        return "unchanged"
+    if not wanted:
+        drop_search_structures()
+        return "dropped"
+    return "created" if create_search_structures() else "unsupported"
+
+
+def _rank_sql(folded_name_sql: str) -> str:
+    return (
+        f"CASE WHEN {folded_name_sql} = %s THEN 0 "
+        f"WHEN {folded_name_sql} LIKE %s THEN 1 ELSE 2 END"
+    )
+
+
+def _popularity_join(id_sql: str, kind: str, weight: float):
+    """Join and ORDER BY term blending SearchPopularity into the rank."""
+    if weight <= 0:
+        return "", "", [], []
+    table = connection.ops.quote_name(
+        global_apps.get_model("social.SearchPopularity")._meta.db_table
+    )
+    return (
+        f" LEFT JOIN {table} pop ON pop.kind = %s AND pop.object_id = {id_sql}",
+        " - %s * COALESCE(pop.score, 0)",
+        [kind],
+        [weight],
+    )
+
+
+def _split_tokens(query: str):
+    tokens = fold_text(query).split()
+    return tokens, " ".join(tokens)
+
+
+class SqliteFTSSearch:
+    vendor = "sqlite"
+
+    def search(self, source, query: str, weight: float = 0.0) -> list[int]:
+        tokens, folded_query = _split_tokens(query)
+        if not tokens:
+            return []
+        fts = source.fts_table
+        join, boost, join_params, boost_params = _popularity_join(
+            f"{fts}.rowid", source.kind, weight
+        )
+        long_tokens = [token for token in tokens if len(token) >= 3]
+        clauses, params = [], []
+        if long_tokens:
+            # Trigram MATCH needs 3+ characters; shorter tokens use LIKE.
+            clauses.append(f"{fts} MATCH %s")
+            params.append(" AND ".join(f'"{token}"' for token in long_tokens))
+        for token in tokens:
+            if len(token) < 3:
+                clauses.append("body LIKE %s")
+                params.append(f"%{token}%")
+        sql = (
+            f"SELECT {fts}.rowid FROM {fts}{join} WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {_rank_sql('folded_name')}{boost}, name, {fts}.rowid"
+        )
+        params = join_params + params + [folded_query, f"{folded_query}%"] + boost_params
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return [row[0] for row in cursor.fetchall()]
+        except OperationalError:
+            # SQLite built without FTS5: the migration skipped the tables.
+            return IContainsSearch().search(source, query, weight)
+
+
+class PostgresTrigramSearch:
+    vendor = "postgresql"
+
+    def search(self, source, query: str, weight: float = 0.0) -> list[int]:
+        tokens, folded_query = _split_tokens(query)
+        if not tokens:
+            return []
+        model = global_apps.get_model(source.model)
+        table = connection.ops.quote_name(model._meta.db_table)
+        body = _folded_body_sql(source)
+        folded_name = f"{FOLD_FUNCTION}({source.name_field})"
+        join, boost, join_params, boost_params = _popularity_join(
+            f"{table}.id", source.kind, weight
+        )
+        clauses = " AND ".join(f"({body}) LIKE %s" for _ in tokens)
+        sql = (
+            f"SELECT {table}.id FROM {table}{join} WHERE {clauses} "
+            f"ORDER BY {_rank_sql(folded_name)}{boost}, {source.name_field}, {table}.id"
+        )
+        params = join_params + [f"%{token}%" for token in tokens]
+        params += [folded_query, f"{folded_query}%"] + boost_params
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+
+class IContainsSearch:
+    """Fallback for other vendors: scans the stored folded names."""
+
+    vendor = None
+
+    def search(self, source, query: str, weight: float = 0.0) -> list[int]:
+        tokens, folded_query = _split_tokens(query)
+        if not tokens:
+            return []
+        model = global_apps.get_model(source.model)
+        qs = model.objects.all()
+        for token in tokens:
+            condition = Q(**{f"{source.normalized_field}__contains": token})
+            for field in source.fields[1:]:
+                condition |= Q(**{f"{field}__icontains": token})
+            qs = qs.filter(condition)
+        rows = list(qs.values_list("id", source.name_field, source.normalized_field))
+        scores = {}
+        if weight > 0:
+            scores = dict(
+                global_apps.get_model("social.SearchPopularity")
+                .objects.filter(kind=source.kind, object_id__in=[row[0] for row in rows])
+                .values_list("object_id", "score")
+            )
+
+        def rank(row):
+            folded = row[2] or ""
+            if folded == folded_query:
+                bucket = 0
+            elif folded.startswith(folded_query):
+                bucket = 1
+            else:
+                bucket = 2
+            return bucket - weight * scores.get(row[0], 0.0), row[1], row[0]
+
+        return [row[0] for row in sorted(rows, key=rank)]
+
+
+DB_SEARCH_BACKENDS = {
+    backend.vendor: backend for backend in (SqliteFTSSearch(), PostgresTrigramSearch())
+}
+
+
+def get_db_search():
+    return DB_SEARCH_BACKENDS.get(connection.vendor, IContainsSearch())
+
+
+def db_search_ids(kind: str, query: str, weight: float = 0.0) -> list[int]:
+    return get_db_search().search(SEARCH_SOURCES[kind], query, weight)
+
+
+def normalized_prefix_q(field: str, prefix: str) -> Q:
+    """Prefix filter on a folded column that its b-tree index can serve.
+
+    SQLite only uses an index for LIKE with case_sensitive_like, so it gets
+    the equivalent range; folded text is ``[a-z0-9 ]`` so bumping the last
+    character gives the upper bound. Postgres indexes the columns with
+    ``varchar_pattern_ops`` for ``LIKE 'prefix%'``.
+    """
+    if connection.vendor == "sqlite":
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return Q(**{f"{field}__gte": prefix, f"{field}__lt": upper})
+    return Q(**{f"{field}__startswith": prefix})
+
+
+def normalized_prefix_queryset(kind: str, prefix: str):
+    source = SEARCH_SOURCES[kind]
+    model = global_apps.get_model(source.model)
+    folded = squash_text(prefix)
+    if not folded:
+        return model.objects.none()
+    return model.objects.filter(
+        normalized_prefix_q(source.normalized_field, folded)
+    ).order_by(source.normalized_field, "id")
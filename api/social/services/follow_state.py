@@ -0,0 +1,27 @@
+from django.db.models import BooleanField, Exists, OuterRef, Value
+
+from social.models import Follow
+from social.services.graph import get_social_graph
+
+FOLLOWED_TEAM_IDS_CONTEXT_KEY = "followed_team_ids"
+
+
+def get_followed_team_ids(user) -> frozenset[int]:
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    return get_social_graph(user.id).team_ids
+
+
+def follow_state_context(request) -> dict:
+    return {
+        "request": request,
+        FOLLOWED_TEAM_IDS_CONTEXT_KEY: get_followed_team_ids(request.user),
+    }
+
+
+def annotate_team_follow_state(queryset, user, field: str = "is_following"):
+    if user is None or not user.is_authenticated:
+        return queryset.annotate(**{field: Value(False, output_field=BooleanField())})
+    return queryset.annotate(
+        **{field: Exists(Follow.objects.filter(user=user, team=OuterRef("pk")))}
+    )
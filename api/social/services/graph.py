@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from social.models import Follow, UserFollow
+
+GRAPH_CACHE_PREFIX = "social:graph"
+
+
+@dataclass(frozen=True)
+class SocialGraph:
+    user_id: int
+    team_ids: frozenset[int]
+    following_ids: frozenset[int]
+    followers_count: int
+    following_count: int
+
+    @property
+    def teams_followed(self) -> int:
+        return len(self.team_ids)
+
+
+def _graph_cache_key(user_id: int) -> str:
+    return f"{GRAPH_CACHE_PREFIX}:{user_id}"
+
+
+def _graph_cache_seconds() -> int:
+    return int(getattr(settings, "SOCIAL_GRAPH_CACHE_SECONDS", 300))
+
+
+def _load_social_graph(user_id: int) -> SocialGraph:
+    team_ids = frozenset(
+        Follow.objects.filter(user_id=user_id).values_list("team_id", flat=True)
+    )
+    following_ids = frozenset(
+        UserFollow.objects.filter(follower_id=user_id).values_list(
+            "following_id", flat=True
+        )
+    )
+    followers_count = UserFollow.objects.filter(following_id=user_id).count()
+    return SocialGraph(
+        user_id=user_id,
+        team_ids=team_ids,
+        following_ids=following_ids,
+        followers_count=followers_count,
+        following_count=len(following_ids),
+    )
+
+
+def get_social_graph(user_id: int) -> SocialGraph:
+    key = _graph_cache_key(user_id)
+    # Cached as plain tuples to keep the pickled entry small.
+    cached = cache.get(key)
+    if cached is not None:
+        team_ids, following_ids, followers_count = cached
+        return SocialGraph(
+            user_id=user_id,
+            team_ids=frozenset(team_ids),
+            following_ids=frozenset(following_ids),
+            followers_count=followers_count,
+            following_count=len(following_ids),
+        )
+
+    graph = _load_social_graph(user_id)
+    timeout = _graph_cache_seconds()
+    if timeout > 0:
+        cache.set(
+            key,
+            (
+                tuple(sorted(graph.team_ids)),
+                tuple(sorted(graph.following_ids)),
+                graph.followers_count,
+            ),
+            timeout=timeout,
+        )
+    return graph
+
+
+def invalidate_social_graph(*user_ids: int) -> None:
+    keys = [_graph_cache_key(user_id) for user_id in user_ids if user_id]
+    if keys:
+        cache.delete_many(keys)
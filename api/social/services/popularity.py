@@ -0,0 +1,198 @@
+import math
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from core.services.versions import bump_version
+from matches.models import Match, Rating
+from social.models import Follow, SearchPopularity, UserFollow
+from .search_changes import popularity_change_kind, search_changes
+
+POPULARITY_VERSION_SCOPE = "popularity"
+POPULARITY_KINDS = ("teams", "leagues", "users")
+# A follow signals more intent than a single rating.
+FOLLOW_WEIGHT = 5
+WRITE_BATCH_SIZE = 1000
+
+
+def popularity_score(followers: int, ratings: int, upcoming: int = 0) -> float:
+    return math.log1p(followers * FOLLOW_WEIGHT + ratings) + 0.5 * math.log1p(upcoming)
+
+
+def _window_days() -> int:
+    return int(getattr(settings, "SEARCH_POPULARITY_WINDOW_DAYS", 30))
+
+
+def count_by(queryset, field: str) -> dict[int, int]:
+    return {
+        row[field]: row["total"]
+        for row in queryset.values(field).annotate(total=Count("id"))
+        if row[field] is not None
+    }
+
+
+def _merge(*counts: dict[int, int]) -> dict[int, int]:
+    merged: dict[int, int] = {}
+    for items in counts:
+        for key, value in items.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _team_signals(ids, now, recent_from, upcoming_to):
+    follows = Follow.objects.all()
+    ratings = Rating.objects.filter(created_at__gte=recent_from)
+    upcoming = Match.objects.filter(date_time__gte=now, date_time__lt=upcoming_to)
+    if ids is not None:
+        follows = follows.filter(team_id__in=ids)
+        ratings = ratings.filter(Q(match__home_team_id__in=ids) | Q(match__away_team_id__in=ids))
+        upcoming = upcoming.filter(Q(home_team_id__in=ids) | Q(away_team_id__in=ids))
+    return (
+        count_by(follows, "team_id"),
+        _merge(count_by(ratings, "match__home_team_id"), count_by(ratings, "match__away_team_id")),
+        _merge(count_by(upcoming, "home_team_id"), count_by(upcoming, "away_team_id")),
+    )
+
+
+def _league_signals(ids, now, recent_from, upcoming_to):
+    ratings = Rating.objects.filter(created_at__gte=recent_from)
+    upcoming = Match.objects.filter(date_time__gte=now, date_time__lt=upcoming_to)
+    if ids is not None:
+        ratings = ratings.filter(match__tournament_id__in=ids)
+        upcoming = upcoming.filter(tournament_id__in=ids)
+    return (
+        {},
+        count_by(ratings, "match__tournament_id"),
+        count_by(upcoming, "tournament_id"),
+    )
+
+
+def _user_signals(ids, now, recent_from, upcoming_to):
+    follows = UserFollow.objects.all()
+    ratings = Rating.objects.filter(created_at__gte=recent_from)
+    if ids is not None:
+        follows = follows.filter(following_id__in=ids)
+        ratings = ratings.filter(user_id__in=ids)
+    return count_by(follows, "following_id"), count_by(ratings, "user_id"), {}
+
+
+SIGNALS = {
+    "teams": _team_signals,
+    "leagues": _league_signals,
+    "users": _user_signals,
+}
+
+
+def _touched_ids(kind: str, since) -> set[int]:
+    # New ratings, plus ratings that left the window since the last run, so
+    # their objects' scores drop too. Deleted follows leave no row to find.
+    now = timezone.now()
+    window = timedelta(days=_window_days())
+    rated = Q(created_at__gte=since) | Q(
+        created_at__gte=since - window, created_at__lt=now - window
+    )
+    if kind == "teams":
+        ids = set(Follow.objects.filter(follow_date__gte=since).values_list("team_id", flat=True))
+        for home_id, away_id in Match.objects.filter(
+            Q(id__in=Rating.objects.filter(rated).values("match_id"))
+            | Q(date_time__gte=since, date_time__lte=now)
+        ).values_list("home_team_id", "away_team_id"):
+            ids.update((home_id, away_id))
+        return ids
+    if kind == "leagues":
+        return set(
+            Match.objects.filter(
+                Q(id__in=Rating.objects.filter(rated).values("match_id"))
+                | Q(date_time__gte=since, date_time__lte=now)
+            ).values_list("tournament_id", flat=True)
+        )
+    return set(
+        UserFollow.objects.filter(created_at__gte=since).values_list("following_id", flat=True)
+    ) | set(Rating.objects.filter(rated).values_list("user_id", flat=True))
+
+
+def refresh_search_popularity(kinds=None, since=None) -> dict[str, int]:
+    """Recomputes popularity rows and returns how many were written per kind.
+
+    Without ``since`` every row of the kind is rebuilt (the nightly run);
+    with it only objects followed, rated, kicked off or with ratings aging
+    out of the window since then are. Unfollows are only reflected by the
+    full run.
+    """
+    now = timezone.now()
+    recent_from = now - timedelta(days=_window_days())
+    upcoming_to = now + timedelta(days=_window_days())
+    written = {}
+    for kind in kinds or POPULARITY_KINDS:
+        ids = None if since is None else _touched_ids(kind, since)
+        if ids is not None and not ids:
+            written[kind] = 0
+            continue
+        followers, ratings, upcoming = SIGNALS[kind](ids, now, recent_from, upcoming_to)
+        rows = [
+            SearchPopularity(
+                kind=kind,
+                object_id=object_id,
+                followers=followers.get(object_id, 0),
+                recent_ratings=ratings.get(object_id, 0),
+                upcoming_matches=upcoming.get(object_id, 0),
+                score=popularity_score(
+                    followers.get(object_id, 0),
+                    ratings.get(object_id, 0),
+                    upcoming.get(object_id, 0),
+                ),
+            )
+            for object_id in set(followers) | set(ratings) | set(upcoming)
+        ]
+        with transaction.atomic():
+            existing = SearchPopularity.objects.filter(kind=kind)
+            if ids is None:
+                existing.delete()
+            else:
+                ordered = sorted(ids)
+                for offset in range(0, len(ordered), WRITE_BATCH_SIZE):
+                    existing.filter(
+                        object_id__in=ordered[offset : offset + WRITE_BATCH_SIZE]
+                    ).delete()
+            SearchPopularity.objects.bulk_create(rows, batch_size=WRITE_BATCH_SIZE)
+            search_changes.record(popularity_change_kind(kind))
+        bump_version(POPULARITY_VERSION_SCOPE, kind)
+        written[kind] = len(rows)
+    return written
+
+
+class PopularityScores:
+    """Per-process ``{object_id: score}`` maps, reloaded when a refresh
+    appears in the SearchChange feed (which, unlike the popularity version,
+    does not expire from a process-local cache)."""
+
+    def __init__(self):
+        self._scores: dict[str, tuple[tuple, dict[int, float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str) -> dict[int, float]:
+        version = search_changes.latest([popularity_change_kind(kind)])
+        cached = self._scores.get(kind)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with self._lock:
+            scores = dict(
+                SearchPopularity.objects.filter(kind=kind).values_list("object_id", "score")
+            )
+            self._scores[kind] = (version, scores)
+        return scores
+
+    def reset(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+
+popularity_scores = PopularityScores()
+
+
+def popularity_weight() -> float:
+    return float(getattr(settings, "SEARCH_POPULARITY_WEIGHT", 0.25))
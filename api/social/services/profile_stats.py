@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from social.models import UserDailyStats
+from .rollups import rating_totals, sum_daily_stats
+
+PROFILE_STATS_CACHE_PREFIX = "social:profile-stats"
+RANGE_DAYS = {
+    "week": 7,
+    "month": 30,
+    "year": 365,
+}
+ALL_RANGE = "all"
+TOP_TEAMS = 5
+TOP_LEAGUES = 5
+
+
+@dataclass(frozen=True)
+class ProfileAggregates:
+    total_ratings: int
+    score_sum: int
+    full_count: int
+    team_mentions: int
+    top_teams: tuple[tuple[int, int], ...]
+    others_count: int
+    top_leagues: tuple[tuple[int, int], ...]
+    league_mentions: int
+
+    @property
+    def avg_score(self) -> float:
+        if not self.total_ratings:
+            return 0.0
+        return round(self.score_sum / self.total_ratings, 2)
+
+    @property
+    def fully_watched_pct(self) -> float:
+        if not self.total_ratings:
+            return 0.0
+        return round((self.full_count / self.total_ratings) * 100, 2)
+
+
+def normalize_range(range_key: Optional[str]) -> str:
+    return range_key if range_key in RANGE_DAYS else ALL_RANGE
+
+
+def get_range_start(range_key: Optional[str]):
+    days = RANGE_DAYS.get(range_key or "")
+    if not days:
+        return None
+    return timezone.now() - timedelta(days=days)
+
+
+def get_range_start_day(range_key: Optional[str]):
+    range_start = get_range_start(range_key)
+    if range_start is None:
+        return None
+    return timezone.localdate(range_start)
+
+
+def compute_profile_aggregates(user_id: int, range_key: Optional[str]) -> ProfileAggregates:
+    # Daily rollups are day-granular, so a range includes the whole first day.
+    totals = sum_daily_stats(user_id, get_range_start_day(range_key))
+    if not totals["rating_count"] and not UserDailyStats.objects.filter(user_id=user_id).exists():
+        # No rollups at all means they were never built, not zero ratings.
+        totals = rating_totals(user_id, get_range_start(range_key))
+    team_counts = totals["team_counts"]
+    sorted_teams = sorted(team_counts.items(), key=lambda item: (-item[1], item[0]))
+    league_counts = totals["tournament_counts"]
+    sorted_leagues = sorted(
+        league_counts.items(), key=lambda item: (-item[1], item[0])
+    )
+
+    return ProfileAggregates(
+        total_ratings=totals["rating_count"],
+        score_sum=totals["score_sum"],
+        full_count=totals["full_count"],
+        team_mentions=sum(team_counts.values()),
+        top_teams=tuple(sorted_teams[:TOP_TEAMS]),
+        others_count=sum(count for _, count in sorted_teams[TOP_TEAMS:]),
+        top_leagues=tuple(sorted_leagues[:TOP_LEAGUES]),
+        league_mentions=sum(league_counts.values()),
+    )
+
+
+def _profile_stats_cache_key(user_id: int, range_key: str) -> str:
+    return f"{PROFILE_STATS_CACHE_PREFIX}:{user_id}:{range_key}"
+
+
+def get_profile_aggregates(user_id: int, range_key: Optional[str]) -> ProfileAggregates:
+    normalized = normalize_range(range_key)
+    key = _profile_stats_cache_key(user_id, normalized)
+    aggregates = cache.get(key)
+    if aggregates is None:
+        aggregates = compute_profile_aggregates(user_id, normalized)
+        timeout = int(getattr(settings, "PROFILE_STATS_CACHE_SECONDS", 300))
+        if timeout > 0:
+            cache.set(key, aggregates, timeout=timeout)
+    return aggregates
+
+
+def invalidate_profile_aggregates(user_id: int) -> None:
+    cache.delete_many(
+        [
+            _profile_stats_cache_key(user_id, range_key)
+            for range_key in (*RANGE_DAYS, ALL_RANGE)
+        ]
+    )
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from core.services.versions import get_versions
+from matches.models import Rating
+from .search_index import SEARCH_VERSION_SCOPE
+from .text import squash_text
+
+RATED_INDEX_PREFIX = "rated-index"
+
+
+def _rated_index_tags(user_id: int):
+    # Rating writes bump ("user", id); the search versions only move when a
+    # team or league name changes, unlike the global teams/tournaments tags
+    # every score or crest update bumps.
+    return [
+        ("user", user_id),
+        (SEARCH_VERSION_SCOPE, "teams"),
+        (SEARCH_VERSION_SCOPE, "leagues"),
+    ]
+
+
+def _build_rated_index(user_id: int):
+    rows = (
+        Rating.objects.filter(user_id=user_id)
+        .order_by("-created_at")
+        .values_list(
+            "id",
+            "match__home_team__name_normalized",
+            "match__away_team__name_normalized",
+            "match__tournament__name_normalized",
+        )
+    )
+    return tuple(
+        (rating_id, tuple(name or "" for name in names)) for rating_id, *names in rows
+    )
+
+
+def get_rated_index(user_id: int):
+    """``(rating_id, (home, away, league))`` folded names, newest first."""
+    key = f"{RATED_INDEX_PREFIX}:{user_id}"
+    versions = tuple(get_versions(_rated_index_tags(user_id)))
+    entry = cache.get(key)
+    if entry is not None and entry[0] == versions:
+        return entry[1]
+    index = _build_rated_index(user_id)
+    timeout = int(getattr(settings, "RATED_INDEX_CACHE_SECONDS", 3600))
+    if timeout > 0:
+        cache.set(key, (versions, index), timeout=timeout)
+    return index
+
+
+def search_rated_ids(user_id: int, query: str) -> list[int]:
+    folded = squash_text(query)
+    index = get_rated_index(user_id)
+    if not folded:
+        return [rating_id for rating_id, _ in index]
+    return [
+        rating_id
+        for rating_id, names in index
+        if any(folded in name for name in names)
+    ]
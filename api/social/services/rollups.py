@@ -0,0 +1,218 @@
+from collections import Counter, defaultdict
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from matches.models import Match, Rating
+from social.models import UserDailyStats
+
+FULL = Rating.MinutesWatched.FULL
+
+
+def _rating_day(rating: Rating) -> date:
+    return timezone.localdate(rating.created_at)
+
+
+def _match_keys(rating: Rating) -> tuple[int, int, int] | None:
+    if Rating.match.is_cached(rating):
+        match = rating.match
+        return match.home_team_id, match.away_team_id, match.tournament_id
+    return (
+        Match.objects.filter(pk=rating.match_id)
+        .values_list("home_team_id", "away_team_id", "tournament_id")
+        .first()
+    )
+
+
+def _bump_counts(counts: dict, keys, delta: int) -> None:
+    for key in keys:
+        key = str(key)
+        value = counts.get(key, 0) + delta
+        if value > 0:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+
+def _apply_rollup_delta(
+    user_id: int,
+    day: date,
+    *,
+    rating_count: int = 0,
+    score_sum: int = 0,
+    full_count: int = 0,
+    team_ids=(),
+    tournament_ids=(),
+) -> None:
+    with transaction.atomic():
+        row = (
+            UserDailyStats.objects.select_for_update()
+            .filter(user_id=user_id, day=day)
+            .first()
+        )
+        if row is None:
+            if rating_count <= 0:
+                return
+            # select_for_update locks nothing while the row is missing, so two
+            # first ratings of the day both get here; uniq_user_daily_stats
+            # lets one insert win and the other waits on its lock below.
+            UserDailyStats.objects.get_or_create(user_id=user_id, day=day)
+            row = UserDailyStats.objects.select_for_update().get(user_id=user_id, day=day)
+        row.rating_count = max(row.rating_count + rating_count, 0)
+        row.score_sum = max(row.score_sum + score_sum, 0)
+        row.full_count = max(row.full_count + full_count, 0)
+        _bump_counts(row.team_counts, team_ids, rating_count)
+        _bump_counts(row.tournament_counts, tournament_ids, rating_count)
+        if row.rating_count == 0:
+            row.delete()
+            return
+        row.save()
+
+
+def record_rating_created(rating: Rating) -> None:
+    keys = _match_keys(rating)
+    if not keys:
+        return
+    home_team_id, away_team_id, tournament_id = keys
+    _apply_rollup_delta(
+        rating.user_id,
+        _rating_day(rating),
+        rating_count=1,
+        score_sum=rating.score,
+        full_count=int(rating.minutes_watched == FULL),
+        team_ids=(home_team_id, away_team_id),
+        tournament_ids=(tournament_id,),
+    )
+
+
+def record_rating_updated(rating: Rating, old_score: int, old_minutes: str) -> None:
+    score_delta = rating.score - old_score
+    full_delta = int(rating.minutes_watched == FULL) - int(old_minutes == FULL)
+    if not score_delta and not full_delta:
+        return
+    _apply_rollup_delta(
+        rating.user_id,
+        _rating_day(rating),
+        score_sum=score_delta,
+        full_count=full_delta,
+    )
+
+
+def record_rating_deleted(rating: Rating) -> None:
+    keys = _match_keys(rating)
+    if not keys:
+        return
+    home_team_id, away_team_id, tournament_id = keys
+    _apply_rollup_delta(
+        rating.user_id,
+        _rating_day(rating),
+        rating_count=-1,
+        score_sum=-rating.score,
+        full_count=-int(rating.minutes_watched == FULL),
+        team_ids=(home_team_id, away_team_id),
+        tournament_ids=(tournament_id,),
+    )
+
+
+def sum_daily_stats(user_id: int, start_day: date | None = None) -> dict:
+    rows = UserDailyStats.objects.filter(user_id=user_id)
+    if start_day:
+        rows = rows.filter(day__gte=start_day)
+
+    totals = {"rating_count": 0, "score_sum": 0, "full_count": 0}
+    team_counts = Counter()
+    tournament_counts = Counter()
+    for row in rows.values_list(
+        "rating_count", "score_sum", "full_count", "team_counts", "tournament_counts"
+    ):
+        rating_count, score_sum, full_count, teams, tournaments = row
+        totals["rating_count"] += rating_count
+        totals["score_sum"] += score_sum
+        totals["full_count"] += full_count
+        team_counts.update({int(key): value for key, value in teams.items()})
+        tournament_counts.update({int(key): value for key, value in tournaments.items()})
+    totals["team_counts"] = team_counts
+    totals["tournament_counts"] = tournament_counts
+    return totals
+
+
+def _counts_by(ratings, column: str) -> Counter:
+    return Counter(
+        {
+            key: total
+            for key, total in ratings.order_by()
+            .values(column)
+            .annotate(total=Count("id"))
+            .values_list(column, "total")
+            if key is not None
+        }
+    )
+
+
+def rating_totals(user_id: int, since=None) -> dict:
+    # Same shape as sum_daily_stats, read straight from Rating for users
+    # whose rollups have not been built yet.
+    ratings = Rating.objects.filter(user_id=user_id)
+    if since is not None:
+        ratings = ratings.filter(created_at__gte=since)
+    row = ratings.aggregate(
+        rating_count=Count("id"),
+        score_sum=Sum("score"),
+        full_count=Count("id", filter=Q(minutes_watched=FULL)),
+    )
+    totals = {key: value or 0 for key, value in row.items()}
+    totals["team_counts"] = _counts_by(ratings, "match__home_team_id") + _counts_by(
+        ratings, "match__away_team_id"
+    )
+    totals["tournament_counts"] = _counts_by(ratings, "match__tournament_id")
+    return totals
+
+
+def rebuild_daily_stats(user_ids=None, *, batch_size: int = 1000) -> int:
+    ratings_qs = Rating.objects.all()
+    if user_ids:
+        ratings_qs = ratings_qs.filter(user_id__in=user_ids)
+    by_day = ratings_qs.annotate(day=TruncDate("created_at")).order_by()
+
+    rows = {}
+    for item in by_day.values("user_id", "day").annotate(
+        rating_count=Count("id"),
+        score_sum=Sum("score"),
+        full_count=Count("id", filter=Q(minutes_watched=FULL)),
+    ):
+        rows[(item["user_id"], item["day"])] = UserDailyStats(
+            user_id=item["user_id"],
+            day=item["day"],
+            rating_count=item["rating_count"],
+            score_sum=item["score_sum"] or 0,
+            full_count=item["full_count"],
+        )
+
+    team_counts = defaultdict(Counter)
+    for column in ("match__home_team_id", "match__away_team_id"):
+        for user_id, day, team_id, total in (
+            by_day.values("user_id", "day", column)
+            .annotate(total=Count("id"))
+            .values_list("user_id", "day", column, "total")
+        ):
+            team_counts[(user_id, day)][str(team_id)] += total
+    for key, counts in team_counts.items():
+        rows[key].team_counts = dict(counts)
+
+    for user_id, day, tournament_id, total in (
+        by_day.values("user_id", "day", "match__tournament_id")
+        .annotate(total=Count("id"))
+        .values_list("user_id", "day", "match__tournament_id", "total")
+    ):
+        rows[(user_id, day)].tournament_counts[str(tournament_id)] = total
+
+    with transaction.atomic():
+        existing = UserDailyStats.objects.all()
+        if user_ids:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+        UserDailyStats.objects.bulk_create(rows.values(), batch_size=batch_size)
+    return len(rows)
@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from social.models import SearchQueryLog
+
+logger = logging.getLogger(__name__)
+WRITE_BATCH_SIZE = 500
+_paused = threading.local()
+
+
+@contextmanager
+def analytics_paused():
+    # Synthetic traffic (cache warming) must not count as real searches.
+    _paused.active = True
+    try:
+        yield
+    finally:
+        _paused.active = False
+
+
+class SearchAnalyticsBuffer:
+    """Per-process ring of executed searches, written to SearchQueryLog in bulk.
+
+    Recording is an append under a lock. The request that finds FLUSH_SIZE
+    entries pending (or the oldest FLUSH_SECONDS old) writes them with one
+    insert, unless it runs inside a transaction. While writes fail, the
+    oldest entries fall off instead of the buffer growing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = deque(
+                maxlen=max(int(getattr(settings, "SEARCH_ANALYTICS_BUFFER_SIZE", 5000)), 1)
+            )
+            self._oldest_at = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, entry: SearchQueryLog) -> None:
+        if getattr(_paused, "active", False):
+            return
+        if int(getattr(settings, "SEARCH_ANALYTICS_BUFFER_SIZE", 5000)) <= 0:
+            return
+        with self._lock:
+            self._entries.append(entry)
+            if self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+            due = len(self._entries) >= int(
+                getattr(settings, "SEARCH_ANALYTICS_FLUSH_SIZE", 200)
+            ) or time.monotonic() - self._oldest_at >= int(
+                getattr(settings, "SEARCH_ANALYTICS_FLUSH_SECONDS", 60)
+            )
+        if due and not transaction.get_connection().in_atomic_block:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            entries = list(self._entries)
+            self._entries.clear()
+            self._oldest_at = None
+        if not entries:
+            return 0
+        try:
+            with transaction.atomic():
+                SearchQueryLog.objects.bulk_create(entries, batch_size=WRITE_BATCH_SIZE)
+        except DatabaseError:
+            logger.warning("Dropped %s search analytics entries", len(entries), exc_info=True)
+            return 0
+        return len(entries)
+
+
+search_analytics = SearchAnalyticsBuffer()
+
+
+def record_search(
+    query: str, per_type: dict, total: int, seconds: float, types=None, request_params=""
+) -> None:
+    # Response-cache hits pass their requested types with an empty per_type.
+    types = ",".join(sorted(per_type if types is None else types))
+    duration_ms = round(seconds * 1000, 2)
+    if duration_ms >= int(getattr(settings, "SEARCH_SLOW_QUERY_MS", 500)):
+        logger.warning(
+            "Slow search q=%r types=%s took %.0f ms: %s",
+            query,
+            types,
+            duration_ms,
+            per_type,
+        )
+    search_analytics.record(
+        SearchQueryLog(
+            query=query[:200],
+            types=types[:40],
+            total=total,
+            duration_ms=duration_ms,
+            per_type=per_type,
+            # Truncated params would replay a different URL.
+            request_params=request_params if len(request_params) <= 500 else "",
+            created_at=timezone.now(),
+        )
+    )
@@ -0,0 +1,94 @@
+"""
+Cross-process change feed for the per-process search structures.
+
+Trigram indexes, the autocomplete index and popularity maps live in each
+worker's memory, and the default cache is process-local, so cache versions
+cannot tell one worker about another's writes. Writes append SearchChange
+rows instead; each process reads them back at most every
+SEARCH_SYNC_SECONDS and applies them. The nightly popularity run prunes
+rows older than SEARCH_CHANGE_RETENTION_HOURS.
+"""
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from social.models import SearchChange
+
+# Rows are read back this far before the last sync too, so one committed
+# after a later id (a long transaction) is not skipped.
+COMMIT_OVERLAP = timedelta(seconds=60)
+
+
+def sync_seconds() -> float:
+    return float(getattr(settings, "SEARCH_SYNC_SECONDS", 5))
+
+
+def retention() -> timedelta:
+    return timedelta(hours=int(getattr(settings, "SEARCH_CHANGE_RETENTION_HOURS", 48)))
+
+
+def popularity_change_kind(kind: str) -> str:
+    return f"popularity:{kind}"
+
+
+def change_watermark(kind: str) -> int:
+    return SearchChange.objects.filter(kind=kind).aggregate(latest=Max("id"))["latest"] or 0
+
+
+def changes_since(kind: str, watermark: int, synced_at) -> list[tuple[int, int]]:
+    return list(
+        SearchChange.objects.filter(kind=kind)
+        .filter(Q(id__gt=watermark) | Q(created_at__gte=synced_at - COMMIT_OVERLAP))
+        .values_list("id", "object_id")
+    )
+
+
+def prune_search_changes() -> int:
+    deleted, _ = SearchChange.objects.filter(
+        created_at__lt=timezone.now() - retention()
+    ).delete()
+    return deleted
+
+
+class ChangeFeed:
+    """Latest SearchChange id per kind as known to this process.
+
+    Changes recorded here count at once; other processes' arrive through
+    one grouped query, run at most every SEARCH_SYNC_SECONDS. Callers only
+    compare the value with the one they built from, so any change counts;
+    local records are counted too, since a rolled-back insert can hand its
+    id to the next one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latest: dict[str, int] = {}
+            self._recorded: dict[str, int] = {}
+            self._polled_at = None
+
+    def record(self, kind: str, object_id=None) -> int:
+        change = SearchChange.objects.create(kind=kind, object_id=object_id)
+        with self._lock:
+            self._latest[kind] = change.id
+            self._recorded[kind] = self._recorded.get(kind, 0) + 1
+        return change.id
+
+    def latest(self, kinds) -> tuple:
+        now = time.monotonic()
+        if self._polled_at is None or now - self._polled_at >= sync_seconds():
+            rows = list(SearchChange.objects.values("kind").annotate(latest=Max("id")))
+            with self._lock:
+                self._latest.update((row["kind"], row["latest"]) for row in rows)
+                self._polled_at = now
+        return tuple((self._latest.get(kind, 0), self._recorded.get(kind, 0)) for kind in kinds)
+
+
+search_changes = ChangeFeed()
@@ -0,0 +1,271 @@
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.services.versions import bump_version
+from matches.models import Team, Tournament
+from .db_search import SEARCH_SOURCES, IContainsSearch, db_search_ids
+from .popularity import popularity_scores, popularity_weight
+from .search_changes import change_watermark, changes_since, retention, search_changes, sync_seconds
+from .text import fold_text, squash_text
+
+logger = logging.getLogger(__name__)
+
+SEARCH_VERSION_SCOPE = "search"
+
+
+def trigrams(value: str) -> set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+@dataclass(frozen=True)
+class IndexedDoc:
+    name: str
+    folded_name: str
+    text: str
+
+
+class TrigramIndex:
+    """Trigram postings over accent-folded text, answering token-AND
+    substring queries.
+
+    Tokens shorter than three characters have no trigrams; they are only
+    checked against the candidates left by the longer tokens (or every
+    document when all tokens are short).
+    """
+
+    def __init__(self):
+        self._docs: dict[int, IndexedDoc] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def upsert(self, doc_id: int, name: str, *extra: str) -> None:
+        folded_name = squash_text(name)
+        text = " ".join([folded_name, *(squash_text(item) for item in extra if item)])
+        with self._lock:
+            self._remove(doc_id)
+            self._docs[doc_id] = IndexedDoc(name, folded_name, text)
+            for gram in trigrams(text):
+                self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: int) -> None:
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for gram in trigrams(doc.text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, tokens: list[str], query: str, scores=None, weight=0.0) -> list[int]:
+        """Ids whose text contains every token, ranked as exact name, then
+        name prefix, then the rest, ties broken by name.
+
+        With ``scores`` each text bucket is lowered by ``weight * score``, so
+        a popular partial match can overtake an obscure prefix match.
+        """
+        folded_query = squash_text(query)
+        with self._lock:
+            candidates = None
+            for token in sorted(tokens, key=len, reverse=True):
+                if len(token) < 3:
+                    continue
+                for gram in trigrams(token):
+                    posting = self._postings.get(gram, set())
+                    candidates = (
+                        set(posting) if candidates is None else candidates & posting
+                    )
+                    if not candidates:
+                        return []
+            if candidates is None:
+                candidates = self._docs.keys()
+            matches = []
+            for doc_id in candidates:
+                doc = self._docs[doc_id]
+                if all(token in doc.text for token in tokens):
+                    matches.append((doc_id, doc))
+
+        def rank(item):
+            doc_id, doc = item
+            if doc.folded_name == folded_query:
+                bucket = 0
+            elif doc.folded_name.startswith(folded_query):
+                bucket = 1
+            else:
+                bucket = 2
+            if scores:
+                return bucket - weight * scores.get(doc_id, 0.0), doc.name, doc_id
+            return bucket, doc.name, doc_id
+
+        return [doc_id for doc_id, _ in sorted(matches, key=rank)]
+
+
+def _team_rows(ids=None):
+    teams = Team.objects.all() if ids is None else Team.objects.filter(pk__in=ids)
+    return teams.values_list("id", "name")
+
+
+def _league_rows(ids=None):
+    leagues = Tournament.objects.all() if ids is None else Tournament.objects.filter(pk__in=ids)
+    return leagues.values_list("id", "name", "country")
+
+
+def _user_rows(ids=None):
+    users = get_user_model().objects.all()
+    if ids is not None:
+        users = users.filter(pk__in=ids)
+    return users.values_list("id", "username")
+
+
+class ManagedIndex:
+    """One per-process index plus the SearchChange watermark it reflects.
+
+    It is built off the request path, by warmup or by a background thread
+    the first search starts (searches scan the name columns until it is
+    ready). Writes in this process update it in place; writes from other
+    processes arrive as deltas read from SearchChange. Inside a transaction
+    it builds inline, since another connection could not see uncommitted
+    rows.
+    """
+
+    def __init__(self, kind: str, load_rows):
+        self.kind = kind
+        self.load_rows = load_rows
+        self.index = None
+        self.watermark = 0
+        self.synced_at = None
+        self.builder = None
+        self._lock = threading.Lock()
+        self._builder_lock = threading.Lock()
+
+    def build(self) -> TrigramIndex:
+        with self._lock:
+            # Watermark first: a write landing during the load is replayed by
+            # the next sync.
+            synced_at = timezone.now()
+            watermark = change_watermark(self.kind)
+            index = TrigramIndex()
+            for row in self.load_rows():
+                index.upsert(*row)
+            self.index, self.watermark, self.synced_at = index, watermark, synced_at
+            return index
+
+    def build_in_background(self) -> None:
+        with self._builder_lock:
+            if self.builder is not None and self.builder.is_alive():
+                return
+
+            def run():
+                try:
+                    self.build()
+                except Exception:
+                    logger.warning("Building the %s search index failed", self.kind, exc_info=True)
+                finally:
+                    connections.close_all()
+
+            self.builder = threading.Thread(
+                target=run, name=f"search-index-{self.kind}", daemon=True
+            )
+            self.builder.start()
+
+    def current(self) -> TrigramIndex | None:
+        index = self.index
+        if index is None or timezone.now() - self.synced_at >= retention():
+            # Never built, or synced too long ago to trust the pruned feed.
+            if transaction.get_connection().in_atomic_block:
+                return self.build()
+            self.build_in_background()
+            return index
+        if timezone.now() - self.synced_at >= timedelta(seconds=sync_seconds()):
+            self.sync()
+        return self.index
+
+    def sync(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            return  # another thread is building or syncing
+        try:
+            synced_at = timezone.now()
+            changes = changes_since(self.kind, self.watermark, self.synced_at)
+            ids = {object_id for _, object_id in changes if object_id is not None}
+            if ids:
+                rows = {row[0]: row for row in self.load_rows(ids)}
+                for doc_id in ids:
+                    if doc_id in rows:
+                        self.index.upsert(*rows[doc_id])
+                    else:
+                        self.index.remove(doc_id)
+            self.watermark = max([self.watermark, *(change_id for change_id, _ in changes)])
+            self.synced_at = synced_at
+        finally:
+            self._lock.release()
+
+    def apply(self, doc_id: int, update) -> None:
+        search_changes.record(self.kind, doc_id)
+        bump_version(SEARCH_VERSION_SCOPE, self.kind)
+        # A build or sync holding the lock reads this change from the feed.
+        if self._lock.acquire(blocking=False):
+            try:
+                if self.index is not None:
+                    update(self.index)
+            finally:
+                self._lock.release()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.index = None
+            self.watermark = 0
+            self.synced_at = None
+
+
+SEARCH_INDEXES = {
+    "teams": ManagedIndex("teams", _team_rows),
+    "leagues": ManagedIndex("leagues", _league_rows),
+    "users": ManagedIndex("users", _user_rows),
+}
+
+
+def search_ids(kind: str, query: str) -> list[int]:
+    weight = popularity_weight()
+    if settings.SEARCH_BACKEND == "database":
+        return db_search_ids(kind, query, weight)
+    tokens = fold_text(query).split()
+    if not tokens:
+        return []
+    index = SEARCH_INDEXES[kind].current()
+    if index is None:
+        # Still building in the background.
+        return IContainsSearch().search(SEARCH_SOURCES[kind], query, weight)
+    scores = popularity_scores.get(kind) if weight > 0 else None
+    return index.search(tokens, query, scores, weight)
+
+
+def index_document(kind: str, doc_id: int, name: str, *extra: str) -> None:
+    SEARCH_INDEXES[kind].apply(doc_id, lambda index: index.upsert(doc_id, name, *extra))
+
+
+def remove_document(kind: str, doc_id: int) -> None:
+    SEARCH_INDEXES[kind].apply(doc_id, lambda index: index.remove(doc_id))
+
+
+def warm_search_indexes() -> dict[str, int]:
+    return {kind: len(managed.build()) for kind, managed in SEARCH_INDEXES.items()}
+
+
+def reset_search_indexes() -> None:
+    for managed in SEARCH_INDEXES.values():
+        managed.reset()
@@ -0,0 +1,33 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.services.versions import get_versions
+
+SEARCH_RESULT_PREFIX = "search:ids"
+
+
+def search_result_key(kind: str, query: str, filters=()) -> str:
+    raw = "|".join([kind, query, *(f"{key}={value}" for key, value in filters)])
+    return f"{SEARCH_RESULT_PREFIX}:{kind}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def cached_search_result(kind: str, query: str, filters, tags, compute):
+    """Returns ``(value, hit)`` for one search type.
+
+    ``query`` should already be normalized so keystrokes that fold to the
+    same text share an entry. Entries carry the versions of ``tags`` and are
+    ignored once any of them is bumped.
+    """
+    timeout = int(getattr(settings, "SEARCH_RESULT_CACHE_SECONDS", 30))
+    if timeout <= 0:
+        return compute(), False
+    key = search_result_key(kind, query, filters)
+    versions = tuple(get_versions(tags))
+    entry = cache.get(key)
+    if entry is not None and entry[0] == versions:
+        return entry[1], True
+    value = compute()
+    cache.set(key, (versions, value), timeout=timeout)
+    return value, False
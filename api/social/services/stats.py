@@ -0,0 +1,151 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from matches.models import Rating
+from social.models import Follow, UserFollow, UserStats
+
+
+def compute_user_stats(user_id: int) -> dict:
+    ratings = Rating.objects.filter(user_id=user_id).aggregate(
+        total_ratings=Count("id"),
+        score_sum=Sum("score"),
+        full_count=Count("id", filter=Q(minutes_watched=Rating.MinutesWatched.FULL)),
+    )
+    return {
+        "teams_followed": Follow.objects.filter(user_id=user_id).count(),
+        "followers": UserFollow.objects.filter(following_id=user_id).count(),
+        "following": UserFollow.objects.filter(follower_id=user_id).count(),
+        "total_ratings": ratings["total_ratings"] or 0,
+        "score_sum": ratings["score_sum"] or 0,
+        "full_count": ratings["full_count"] or 0,
+    }
+
+
+def rebuild_user_stats(user_id: int) -> UserStats:
+    stats, _ = UserStats.objects.update_or_create(
+        user_id=user_id,
+        defaults=compute_user_stats(user_id),
+    )
+    return stats
+
+
+def create_user_stats(user_id: int) -> UserStats | None:
+    # Insert-only: a row another transaction created first may already hold
+    # deltas these counts miss, so it is never overwritten.
+    try:
+        with transaction.atomic():
+            return UserStats.objects.create(user_id=user_id, **compute_user_stats(user_id))
+    except IntegrityError:
+        return None
+
+
+def get_user_stats(user_id: int) -> UserStats:
+    # Rows are created with the user; this covers accounts that predate them.
+    stats = UserStats.objects.filter(user_id=user_id).first()
+    if stats is None:
+        stats = create_user_stats(user_id) or UserStats.objects.get(user_id=user_id)
+    return stats
+
+
+def apply_user_stats_delta(user_id: int, **deltas: int) -> None:
+    updates = {
+        field: Greatest(F(field) + value, 0)
+        for field, value in deltas.items()
+        if value
+    }
+    if not updates:
+        return
+    rows = UserStats.objects.filter(user_id=user_id)
+    if rows.update(updated_at=timezone.now(), **updates):
+        return
+    # No row yet: counting from source includes this transaction's write.
+    # If a concurrent read inserted one first, its counts may predate the
+    # write, so the delta is applied to it instead.
+    if create_user_stats(user_id) is None:
+        rows.update(updated_at=timezone.now(), **updates)
+
+
+def user_stats_payload(stats: UserStats) -> dict:
+    return {
+        "total_ratings": stats.total_ratings,
+        "avg_score": stats.avg_score,
+        "teams_followed": stats.teams_followed,
+        "followers": stats.followers,
+        "following": stats.following,
+        "fully_watched_pct": stats.fully_watched_pct,
+    }
+
+
+def rebuild_all_user_stats(user_ids=None, *, batch_size: int = 500) -> int:
+    users_qs = get_user_model().objects.order_by("pk")
+    if user_ids:
+        users_qs = users_qs.filter(pk__in=user_ids)
+    all_ids = list(users_qs.values_list("pk", flat=True))
+
+    rebuilt = 0
+    for start in range(0, len(all_ids), batch_size):
+        batch = all_ids[start : start + batch_size]
+        ratings = {
+            row["user_id"]: row
+            for row in Rating.objects.filter(user_id__in=batch)
+            .values("user_id")
+            .annotate(
+                total_ratings=Count("id"),
+                score_sum=Sum("score"),
+                full_count=Count(
+                    "id", filter=Q(minutes_watched=Rating.MinutesWatched.FULL)
+                ),
+            )
+        }
+        teams = dict(
+            Follow.objects.filter(user_id__in=batch)
+            .values("user_id")
+            .annotate(total=Count("id"))
+            .values_list("user_id", "total")
+        )
+        followers = dict(
+            UserFollow.objects.filter(following_id__in=batch)
+            .values("following_id")
+            .annotate(total=Count("id"))
+            .values_list("following_id", "total")
+        )
+        following = dict(
+            UserFollow.objects.filter(follower_id__in=batch)
+            .values("follower_id")
+            .annotate(total=Count("id"))
+            .values_list("follower_id", "total")
+        )
+        rows = []
+        for user_id in batch:
+            rating_row = ratings.get(user_id, {})
+            rows.append(
+                UserStats(
+                    user_id=user_id,
+                    teams_followed=teams.get(user_id, 0),
+                    followers=followers.get(user_id, 0),
+                    following=following.get(user_id, 0),
+                    total_ratings=rating_row.get("total_ratings") or 0,
+                    score_sum=rating_row.get("score_sum") or 0,
+                    full_count=rating_row.get("full_count") or 0,
+                    updated_at=timezone.now(),
+                )
+            )
+        UserStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=[
+                "teams_followed",
+                "followers",
+                "following",
+                "total_ratings",
+                "score_sum",
+                "full_count",
+                "updated_at",
+            ],
+        )
+        rebuilt += len(rows)
+    return rebuilt
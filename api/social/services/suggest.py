@@ -0,0 +1,244 @@
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+
+from matches.models import Rating, Team, Tournament
+from social.models import Follow, UserFollow
+from .db_search import SEARCH_SOURCES, normalized_prefix_queryset
+from .popularity import count_by, popularity_score, popularity_scores
+from .search_changes import search_changes
+from .text import squash_text
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_KINDS = ("teams", "leagues", "users")
+SUGGEST_TYPES = {"teams": "team", "leagues": "league", "users": "user"}
+# Prefixes this short match too many names to scan per request, so their
+# top entries are ranked once at build time.
+SHORT_PREFIX_LENGTH = 2
+SHORT_PREFIX_KEEP = 60
+SUGGEST_HINT_FIELDS = {"teams": "country", "leagues": "country", "users": None}
+# Rows read per kind from the name index before ranking by popularity.
+DATABASE_CANDIDATES = 50
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    kind: str
+    id: int
+    name: str
+    hint: str
+    popularity: float
+
+    def as_dict(self) -> dict:
+        return {
+            "type": SUGGEST_TYPES[self.kind],
+            "id": self.id,
+            "name": self.name,
+            "hint": self.hint or None,
+        }
+
+
+class PrefixIndex:
+    """Sorted array of folded word suffixes searched with bisect.
+
+    Every word start of a name gets a key, so "mad" finds "Real Madrid".
+    Suggestions are stored most popular first, so a key's code (its
+    suggestion's position, plus ``len(suggestions)`` when the match is not at
+    the start of the name) orders a prefix range without touching the
+    suggestions themselves.
+    """
+
+    def __init__(self, suggestions):
+        self.suggestions = sorted(
+            suggestions, key=lambda item: (-item.popularity, len(item.name), item.name.lower())
+        )
+        size = len(self.suggestions)
+        pairs = []
+        for position, suggestion in enumerate(self.suggestions):
+            folded = squash_text(suggestion.name)
+            offset = 0
+            for word in folded.split(" "):
+                if word:
+                    pairs.append((folded[offset:], position if offset == 0 else position + size))
+                offset += len(word) + 1
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.codes = [code for _, code in pairs]
+        self.short_prefixes = {
+            prefix: self._top(prefix, SHORT_PREFIX_KEEP)
+            for prefix in {
+                key[:length]
+                for key in self.keys
+                for length in range(1, SHORT_PREFIX_LENGTH + 1)
+            }
+        }
+
+    def _top(self, prefix: str, count: int, kinds=None) -> list[int]:
+        # Keys only hold [a-z0-9 ], so "{" sorts after every continuation.
+        codes = self.codes[
+            bisect_left(self.keys, prefix) : bisect_left(self.keys, prefix + "{")
+        ]
+        size = len(self.suggestions)
+        wanted = count
+        while True:
+            positions = []
+            for code in heapq.nsmallest(wanted, codes):
+                position = code % size
+                if position in positions:
+                    continue
+                if kinds is None or self.suggestions[position].kind in kinds:
+                    positions.append(position)
+                    if len(positions) >= count:
+                        return positions
+            if wanted >= len(codes):
+                return positions
+            # Duplicates or other kinds crowded the first window; widen it.
+            wanted *= 4
+
+    def suggest(self, query: str, limit: int, kinds=None) -> list[Suggestion]:
+        prefix = squash_text(query)
+        if not prefix:
+            return []
+        if len(prefix) <= SHORT_PREFIX_LENGTH and limit <= SHORT_PREFIX_KEEP:
+            positions = [
+                position
+                for position in self.short_prefixes.get(prefix, [])
+                if kinds is None or self.suggestions[position].kind in kinds
+            ]
+            if len(positions) >= limit or kinds is None:
+                return [self.suggestions[position] for position in positions[:limit]]
+        return [self.suggestions[position] for position in self._top(prefix, limit, kinds)]
+
+
+def load_suggestions():
+    team_follows = count_by(Follow.objects.all(), "team_id")
+    home_ratings = count_by(Rating.objects.all(), "match__home_team_id")
+    away_ratings = count_by(Rating.objects.all(), "match__away_team_id")
+    for team_id, name, country in Team.objects.values_list("id", "name", "country"):
+        ratings = home_ratings.get(team_id, 0) + away_ratings.get(team_id, 0)
+        popularity = popularity_score(team_follows.get(team_id, 0), ratings)
+        yield Suggestion("teams", team_id, name, country, popularity)
+
+    league_ratings = count_by(Rating.objects.all(), "match__tournament_id")
+    for league_id, name, country in Tournament.objects.values_list("id", "name", "country"):
+        popularity = popularity_score(0, league_ratings.get(league_id, 0))
+        yield Suggestion("leagues", league_id, name, country, popularity)
+
+    followers = count_by(UserFollow.objects.all(), "following_id")
+    user_ratings = count_by(Rating.objects.all(), "user_id")
+    for user_id, username in get_user_model().objects.values_list("id", "username"):
+        yield Suggestion(
+            "users",
+            user_id,
+            username,
+            "",
+            popularity_score(followers.get(user_id, 0), user_ratings.get(user_id, 0)),
+        )
+
+
+class ManagedPrefixIndex:
+    """Rebuilds when a searchable name changes (the SearchChange feed) or
+    when popularity is older than SUGGEST_REFRESH_SECONDS.
+
+    Rebuilds run in a background thread while requests keep answering from
+    the previous index (or from the name columns before the first build);
+    inside a transaction they run inline, since another connection could
+    not see uncommitted rows.
+    """
+
+    def __init__(self):
+        self.index = None
+        self.watermark = None
+        self.built_at = 0.0
+        self.builder = None
+        self._lock = threading.Lock()
+        self._builder_lock = threading.Lock()
+
+    def _is_fresh(self, watermark) -> bool:
+        max_age = int(getattr(settings, "SUGGEST_REFRESH_SECONDS", 300))
+        return (
+            self.index is not None
+            and self.watermark == watermark
+            and time.monotonic() - self.built_at < max_age
+        )
+
+    def build(self) -> PrefixIndex:
+        with self._lock:
+            # Watermark first: a rename landing during the load triggers the
+            # next rebuild.
+            watermark = search_changes.latest(SUGGEST_KINDS)
+            self.index = PrefixIndex(load_suggestions())
+            self.watermark = watermark
+            self.built_at = time.monotonic()
+            return self.index
+
+    def build_in_background(self) -> None:
+        with self._builder_lock:
+            if self.builder is not None and self.builder.is_alive():
+                return
+
+            def run():
+                try:
+                    self.build()
+                except Exception:
+                    logger.warning("Building the suggest index failed", exc_info=True)
+                finally:
+                    connections.close_all()
+
+            self.builder = threading.Thread(target=run, name="suggest-index", daemon=True)
+            self.builder.start()
+
+    def current(self) -> PrefixIndex | None:
+        index = self.index
+        if self._is_fresh(search_changes.latest(SUGGEST_KINDS)):
+            return index
+        if transaction.get_connection().in_atomic_block:
+            return self.build()
+        self.build_in_background()
+        return index
+
+    def reset(self) -> None:
+        with self._lock:
+            self.index = None
+            self.watermark = None
+
+
+suggest_index = ManagedPrefixIndex()
+
+
+def _database_suggestions(query: str, limit: int, kinds=None) -> list[Suggestion]:
+    # Whole-name prefixes only: each kind is one range scan on its
+    # name_normalized index instead of a per-process copy of every name.
+    found = []
+    for kind in kinds or SUGGEST_KINDS:
+        hint_field = SUGGEST_HINT_FIELDS[kind]
+        fields = ["id", SEARCH_SOURCES[kind].name_field, *([hint_field] if hint_field else [])]
+        scores = popularity_scores.get(kind)
+        rows = normalized_prefix_queryset(kind, query).values_list(*fields)
+        for object_id, name, *hint in rows[:DATABASE_CANDIDATES]:
+            found.append(
+                Suggestion(kind, object_id, name, hint[0] if hint else "", scores.get(object_id, 0.0))
+            )
+    found.sort(key=lambda item: (-item.popularity, len(item.name), item.name.lower()))
+    return found[:limit]
+
+
+def suggest(query: str, limit: int, kinds=None) -> list[dict]:
+    if settings.SEARCH_BACKEND == "database":
+        items = _database_suggestions(query, limit, kinds)
+    else:
+        index = suggest_index.current()
+        if index is None:
+            # First build still running in the background.
+            items = _database_suggestions(query, limit, kinds)
+        else:
+            items = index.suggest(query, limit, kinds)
+    return [item.as_dict() for item in items]
@@ -0,0 +1,3 @@
+# Kept here for the search services; the helpers live in core so models can
+# fold names without importing the social app.
+from core.text import fold_text, squash_text  # noqa: F401
@@ -0,0 +1,143 @@
+"""
+Cache warming after a deploy or worker recycle.
+
+Per-process structures (search and suggest indexes, popularity scores) are
+rebuilt in the calling process. Shared caches are filled by replaying the
+most frequent recorded searches and anonymous GETs for the most popular
+teams and profiles (SearchPopularity, since page views are not recorded),
+which also fills this worker's L1 response cache. Replays run on a bounded
+number of threads so warming never holds more than WARMUP_DB_CONNECTIONS
+connections.
+"""
+import logging
+import time
+from datetime import timedelta
+from functools import partial
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+from django.http import QueryDict
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from core.parallel import run_bounded
+from social.models import SearchPopularity, SearchQueryLog
+from .graph import get_social_graph
+from .popularity import POPULARITY_KINDS, popularity_scores
+from .profile_stats import ALL_RANGE, RANGE_DAYS, get_profile_aggregates
+from .search_analytics import analytics_paused
+from .search_index import warm_search_indexes
+from .stats import get_user_stats
+from .suggest import suggest_index
+
+logger = logging.getLogger(__name__)
+# What browsers' fetch() sends, so warmed response-cache keys match theirs.
+WARM_ACCEPT = "*/*"
+ALL_SEARCH_TYPES = "leagues,matches,teams,users"
+
+_factory = RequestFactory()
+
+
+def warm_process_caches() -> dict[str, int]:
+    counts = warm_search_indexes()
+    counts["suggest"] = len(suggest_index.build().suggestions)
+    for kind in POPULARITY_KINDS:
+        popularity_scores.get(kind)
+    return counts
+
+
+def popular_searches(days: int, limit: int) -> list[str]:
+    # Replays the recorded query strings: the response cache keys on the raw
+    # q, so a folded one would warm entries no client asks for. Rows logged
+    # before request_params existed fall back to the folded query.
+    rows = (
+        SearchQueryLog.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=days), total__gt=0
+        )
+        .values("request_params", "query", "types")
+        .annotate(searches=Count("id"))
+        .order_by("-searches", "request_params", "query")[:limit]
+    )
+    searches = []
+    for row in rows:
+        params = row["request_params"]
+        if not params:
+            legacy = {"q": row["query"]}
+            if row["types"] != ALL_SEARCH_TYPES:
+                legacy["types"] = row["types"]
+            params = urlencode(legacy)
+        if params not in searches:
+            searches.append(params)
+    return searches
+
+
+def popular_ids(kind: str, limit: int) -> list[int]:
+    return list(
+        SearchPopularity.objects.filter(kind=kind)
+        .order_by("-score", "object_id")
+        .values_list("object_id", flat=True)[:limit]
+    )
+
+
+def _anonymous_get(path: str, params=None) -> int:
+    request = _factory.get(path, params or {}, HTTP_ACCEPT=WARM_ACCEPT)
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, "render"):
+        # Rendering runs the response cache's store callback.
+        response.render()
+    return response.status_code
+
+
+def _warm_profile(user_id: int, username: str) -> int:
+    get_user_stats(user_id)
+    get_social_graph(user_id)
+    for range_key in (*RANGE_DAYS, ALL_RANGE):
+        get_profile_aggregates(user_id, range_key)
+    return _anonymous_get(reverse("public-profile", args=[username]))
+
+
+def _safely(func):
+    try:
+        with analytics_paused():
+            return func()
+    except Exception:
+        logger.warning("Cache warmup task failed", exc_info=True)
+        return None
+
+
+def warm_caches(searches=None, teams=None, profiles=None, days=7, workers=None) -> dict:
+    default_limit = int(getattr(settings, "WARMUP_TOP_N", 50))
+    workers = int(getattr(settings, "WARMUP_DB_CONNECTIONS", 2)) if workers is None else workers
+    started = time.perf_counter()
+    summary = {"indexes": warm_process_caches()}
+
+    tasks = {}
+    search_path = reverse("search")
+    for params in popular_searches(days, default_limit if searches is None else searches):
+        tasks[("searches", params)] = partial(_anonymous_get, search_path, QueryDict(params))
+    for team_id in popular_ids("teams", default_limit if teams is None else teams):
+        tasks[("teams", team_id, "detail")] = partial(
+            _anonymous_get, reverse("team-detail", args=[team_id])
+        )
+        tasks[("teams", team_id, "upcoming")] = partial(
+            _anonymous_get, reverse("team-matches", args=[team_id]), {"scope": "upcoming"}
+        )
+    user_ids = popular_ids("users", default_limit if profiles is None else profiles)
+    for user_id, username in get_user_model().objects.filter(id__in=user_ids).values_list(
+        "id", "username"
+    ):
+        tasks[("profiles", user_id, "")] = partial(_warm_profile, user_id, username)
+
+    outcomes = run_bounded(
+        {name: partial(_safely, func) for name, func in tasks.items()}, workers
+    )
+    for (group, *_), (status_code, _seconds) in outcomes.items():
+        summary[group] = summary.get(group, 0) + 1
+        if status_code != 200:
+            summary["failed"] = summary.get("failed", 0) + 1
+    summary["seconds"] = round(time.perf_counter() - started, 2)
+    return summary
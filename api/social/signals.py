@@ -0,0 +1,214 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.services.versions import bump_versions
+from matches.models import Match, Rating, Team, Tournament
+from .models import Follow, UserFollow, UserSearchName, UserStats
+from .services.db_search import register_sqlite_functions
+from .services.graph import invalidate_social_graph
+from .services.profile_stats import invalidate_profile_aggregates
+from .services.search_index import index_document, remove_document
+from .services.rollups import (
+    record_rating_created,
+    record_rating_deleted,
+    record_rating_updated,
+)
+from .services.stats import apply_user_stats_delta
+from .services.text import squash_text
+
+FULL = Rating.MinutesWatched.FULL
+User = get_user_model()
+
+# The SQLite search triggers call bbx_fold on every write.
+connection_created.connect(register_sqlite_functions, dispatch_uid="social.bbx_fold")
+
+
+@receiver([post_save, post_delete], sender=Follow)
+def follow_changed(sender, instance, **kwargs):
+    invalidate_social_graph(instance.user_id)
+    bump_versions([("user", instance.user_id)])
+
+
+@receiver(post_save, sender=Follow)
+def follow_created(sender, instance, created, **kwargs):
+    if created:
+        apply_user_stats_delta(instance.user_id, teams_followed=1)
+
+
+def _user_survives(origin, user_id) -> bool:
+    # A delete cascading from the user itself must not apply deltas: counting
+    # a missing stats row from source would recreate it for a deleted user.
+    if isinstance(origin, User):
+        return origin.pk != user_id
+    if isinstance(origin, QuerySet) and origin.model is User:
+        return not origin.filter(pk=user_id).exists()
+    return True
+
+
+@receiver(post_delete, sender=Follow)
+def follow_deleted(sender, instance, origin=None, **kwargs):
+    if _user_survives(origin, instance.user_id):
+        apply_user_stats_delta(instance.user_id, teams_followed=-1)
+
+
+@receiver([post_save, post_delete], sender=UserFollow)
+def user_follow_changed(sender, instance, **kwargs):
+    invalidate_social_graph(instance.follower_id, instance.following_id)
+    bump_versions([("user", instance.follower_id), ("user", instance.following_id)])
+
+
+@receiver(post_save, sender=UserFollow)
+def user_follow_created(sender, instance, created, **kwargs):
+    if created:
+        apply_user_stats_delta(instance.follower_id, following=1)
+        apply_user_stats_delta(instance.following_id, followers=1)
+
+
+@receiver(post_delete, sender=UserFollow)
+def user_follow_deleted(sender, instance, origin=None, **kwargs):
+    if _user_survives(origin, instance.follower_id):
+        apply_user_stats_delta(instance.follower_id, following=-1)
+    if _user_survives(origin, instance.following_id):
+        apply_user_stats_delta(instance.following_id, followers=-1)
+
+
+@receiver([post_save, post_delete], sender=Rating)
+def rating_changed(sender, instance, **kwargs):
+    invalidate_profile_aggregates(instance.user_id)
+    bump_versions(
+        [("ratings", None), ("match", instance.match_id), ("user", instance.user_id)]
+    )
+
+
+@receiver([post_save, post_delete], sender=Match)
+def match_changed(sender, instance, **kwargs):
+    bump_versions(
+        [
+            ("matches", None),
+            ("match", instance.pk),
+            ("team", instance.home_team_id),
+            ("team", instance.away_team_id),
+        ]
+    )
+
+
+@receiver([post_save, post_delete], sender=Team)
+def team_changed(sender, instance, **kwargs):
+    bump_versions([("teams", None), ("team", instance.pk)])
+
+
+@receiver([post_save, post_delete], sender=Tournament)
+def tournament_changed(sender, instance, **kwargs):
+    bump_versions([("tournaments", None)])
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, **kwargs):
+    keys = [("user", instance.pk)]
+    if created:
+        keys.append(("users", None))
+    bump_versions(keys)
+
+
+@receiver(pre_save, sender=Rating)
+def rating_snapshot(sender, instance, update_fields=None, **kwargs):
+    # Keeps the stored score/minutes so post_save can apply the difference.
+    instance._stats_previous = None
+    if instance._state.adding or not instance.pk:
+        return
+    if update_fields is not None and not (
+        {"score", "minutes_watched"} & set(update_fields)
+    ):
+        return
+    previous = Rating.objects.filter(pk=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        # Rating.save is atomic, so a concurrent save of the same rating
+        # waits here instead of computing its delta from the same snapshot.
+        previous = previous.select_for_update()
+    instance._stats_previous = previous.values_list("score", "minutes_watched").first()
+
+
+@receiver(post_save, sender=Rating)
+def rating_saved(sender, instance, created, **kwargs):
+    if created:
+        apply_user_stats_delta(
+            instance.user_id,
+            total_ratings=1,
+            score_sum=instance.score,
+            full_count=int(instance.minutes_watched == FULL),
+        )
+        record_rating_created(instance)
+        return
+    previous = getattr(instance, "_stats_previous", None)
+    if not previous:
+        return
+    old_score, old_minutes = previous
+    apply_user_stats_delta(
+        instance.user_id,
+        score_sum=instance.score - old_score,
+        full_count=int(instance.minutes_watched == FULL) - int(old_minutes == FULL),
+    )
+    record_rating_updated(instance, old_score, old_minutes)
+
+
+@receiver(post_delete, sender=Rating)
+def rating_deleted(sender, instance, origin=None, **kwargs):
+    if _user_survives(origin, instance.user_id):
+        apply_user_stats_delta(
+            instance.user_id,
+            total_ratings=-1,
+            score_sum=-instance.score,
+            full_count=-int(instance.minutes_watched == FULL),
+        )
+    record_rating_deleted(instance)
+
+
+def _indexed_fields_changed(created, update_fields, fields) -> bool:
+    return created or update_fields is None or bool(set(update_fields) & fields)
+
+
+@receiver(post_save, sender=Team)
+def team_search_indexed(sender, instance, created, update_fields=None, **kwargs):
+    if _indexed_fields_changed(created, update_fields, {"name"}):
+        index_document("teams", instance.pk, instance.name)
+
+
+@receiver(post_save, sender=Tournament)
+def league_search_indexed(sender, instance, created, update_fields=None, **kwargs):
+    if _indexed_fields_changed(created, update_fields, {"name", "country"}):
+        index_document("leagues", instance.pk, instance.name, instance.country)
+
+
+@receiver(post_save, sender=User)
+def user_stats_created(sender, instance, created, **kwargs):
+    if created:
+        UserStats.objects.get_or_create(user_id=instance.pk)
+
+
+@receiver(post_save, sender=User)
+def user_search_indexed(sender, instance, created, update_fields=None, **kwargs):
+    if _indexed_fields_changed(created, update_fields, {"username"}):
+        index_document("users", instance.pk, instance.username)
+        UserSearchName.objects.update_or_create(
+            user_id=instance.pk,
+            defaults={"username_normalized": squash_text(instance.username)},
+        )
+
+
+@receiver(post_delete, sender=Team)
+def team_search_removed(sender, instance, **kwargs):
+    remove_document("teams", instance.pk)
+
+
+@receiver(post_delete, sender=Tournament)
+def league_search_removed(sender, instance, **kwargs):
+    remove_document("leagues", instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_search_removed(sender, instance, **kwargs):
+    remove_document("users", instance.pk)
@@ -0,0 +1,87 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core.response_cache import local_cache
+from matches.models import Match, Rating, Team, Tournament
+from social.models import Follow, SearchQueryLog
+from social.services.popularity import popularity_scores, refresh_search_popularity
+from social.services.search_analytics import search_analytics
+from social.services.search_index import reset_search_indexes
+from social.services.suggest import suggest_index
+from social.services.warmup import warm_caches
+
+
+class CacheWarmupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        reset_search_indexes()
+        suggest_index.reset()
+        popularity_scores.reset()
+        search_analytics.reset()
+        User = get_user_model()
+        self.fan = User.objects.create_user(username="fan", password="testpass123")
+        league = Tournament.objects.create(name="Liga")
+        self.river = Team.objects.create(name="River")
+        self.boca = Team.objects.create(name="Boca")
+        match = Match.objects.create(
+            tournament=league,
+            home_team=self.river,
+            away_team=self.boca,
+            date_time=timezone.now() - timedelta(days=1),
+        )
+        Rating.objects.create(
+            user=self.fan, match=match, score=80, minutes_watched=Rating.MinutesWatched.FULL
+        )
+        Follow.objects.create(user=self.fan, team=self.river)
+        refresh_search_popularity()
+        now = timezone.now()
+        SearchQueryLog.objects.bulk_create(
+            [
+                SearchQueryLog(query="river", types="teams", total=1, duration_ms=5, created_at=now),
+                SearchQueryLog(query="river", types="teams", total=1, duration_ms=4, created_at=now),
+                SearchQueryLog(query="nada", types="teams", total=0, duration_ms=4, created_at=now),
+                SearchQueryLog(
+                    query="boca",
+                    types="leagues,matches,teams,users",
+                    total=1,
+                    duration_ms=4,
+                    request_params="page=1&q=Boca",
+                    created_at=now,
+                ),
+            ]
+        )
+
+    def test_warms_popular_searches_teams_and_profiles(self):
+        summary = warm_caches(workers=2)
+        self.assertEqual(summary["indexes"]["teams"], 2)
+        self.assertEqual(summary["searches"], 2)
+        self.assertEqual(summary["teams"], 4)
+        self.assertEqual(summary["profiles"], 1)
+        self.assertNotIn("failed", summary)
+        self.assertEqual(len(search_analytics), 0)
+
+        for url in (
+            reverse("search") + "?q=river&types=teams",
+            reverse("search") + "?q=Boca&page=1",
+            reverse("team-detail", args=[self.river.id]),
+            reverse("team-matches", args=[self.boca.id]) + "?scope=upcoming",
+        ):
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_ACCEPT="*/*")
+            self.assertEqual(response["X-Cache"], "HIT-L1", url)
+        # Profile tags still resolve the username to its id.
+        response = self.client.get(reverse("public-profile", args=["fan"]), HTTP_ACCEPT="*/*")
+        self.assertEqual(response["X-Cache"], "HIT-L1")
+
+    def test_command_reports_the_warmup(self):
+        out = StringIO()
+        call_command("warm_caches", "--teams", "1", "--profiles", "0", stdout=out)
+        self.assertIn("Warmed 2 searches, 2 team requests and 0 profiles", out.getvalue())
@@ -0,0 +1,123 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models.query import QuerySet
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+from social.models import UserDailyStats
+from social.services.profile_stats import get_profile_aggregates
+from social.services.rollups import record_rating_created, sum_daily_stats
+
+
+class DailyRollupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="alice", password="testpass123"
+        )
+        self.tournament = Tournament.objects.create(name="Liga Test")
+        self.home = Team.objects.create(name="Team A")
+        self.away = Team.objects.create(name="Team B")
+        self.matches = [
+            Match.objects.create(
+                tournament=self.tournament,
+                home_team=self.home,
+                away_team=self.away,
+                date_time=f"2026-01-0{day}T12:00:00Z",
+            )
+            for day in (1, 2, 3)
+        ]
+
+    def _rate(self, match, score, minutes=Rating.MinutesWatched.FULL):
+        return Rating.objects.create(
+            user=self.user, match=match, score=score, minutes_watched=minutes
+        )
+
+    def test_rollup_tracks_rating_writes(self):
+        rating = self._rate(self.matches[0], 80)
+        self._rate(self.matches[1], 60, Rating.MinutesWatched.ONE_HALF)
+        row = UserDailyStats.objects.get(user=self.user)
+        self.assertEqual(row.rating_count, 2)
+        self.assertEqual(row.score_sum, 140)
+        self.assertEqual(row.full_count, 1)
+        self.assertEqual(row.team_counts, {str(self.home.id): 2, str(self.away.id): 2})
+        self.assertEqual(row.tournament_counts, {str(self.tournament.id): 2})
+
+        rating.score = 20
+        rating.save()
+        rating.delete()
+        row.refresh_from_db()
+        self.assertEqual(row.rating_count, 1)
+        self.assertEqual(row.score_sum, 60)
+        self.assertEqual(row.full_count, 0)
+        self.assertEqual(row.team_counts, {str(self.home.id): 1, str(self.away.id): 1})
+
+    def test_range_sums_only_recent_days(self):
+        old = self._rate(self.matches[0], 90)
+        Rating.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=40)
+        )
+        self._rate(self.matches[1], 50)
+        call_command("rebuild_user_daily_stats", stdout=StringIO())
+
+        self.assertEqual(UserDailyStats.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(sum_daily_stats(self.user.id)["rating_count"], 2)
+        month = get_profile_aggregates(self.user.id, "month")
+        self.assertEqual(month.total_ratings, 1)
+        self.assertEqual(month.avg_score, 50.0)
+        self.assertEqual(get_profile_aggregates(self.user.id, "all").total_ratings, 2)
+
+    def test_backfill_matches_incremental_rows(self):
+        self._rate(self.matches[0], 70)
+        self._rate(self.matches[2], 40, Rating.MinutesWatched.LT_30)
+        incremental = list(
+            UserDailyStats.objects.values_list(
+                "day", "rating_count", "score_sum", "full_count", "team_counts"
+            )
+        )
+        call_command("rebuild_user_daily_stats", stdout=StringIO())
+        rebuilt = list(
+            UserDailyStats.objects.values_list(
+                "day", "rating_count", "score_sum", "full_count", "team_counts"
+            )
+        )
+        self.assertEqual(incremental, rebuilt)
+
+    def test_concurrent_first_rating_of_the_day_adds_to_the_row(self):
+        rating = self._rate(self.matches[0], 80)
+        # Another transaction inserted the row after this one found none.
+        real_first = QuerySet.first
+        calls = []
+
+        def first(queryset):
+            calls.append(queryset)
+            return None if len(calls) == 1 else real_first(queryset)
+
+        with mock.patch.object(QuerySet, "first", autospec=True, side_effect=first):
+            record_rating_created(rating)
+        row = UserDailyStats.objects.get(user=self.user)
+        self.assertEqual((row.rating_count, row.score_sum), (2, 160))
+        self.assertEqual(row.team_counts, {str(self.home.id): 2, str(self.away.id): 2})
+
+    def test_missing_rollups_fall_back_to_ratings(self):
+        self._rate(self.matches[0], 80)
+        self._rate(self.matches[1], 40)
+        UserDailyStats.objects.all().delete()
+        month = get_profile_aggregates(self.user.id, "month")
+        self.assertEqual(month.total_ratings, 2)
+        self.assertEqual(month.avg_score, 60.0)
+        self.assertEqual(dict(month.top_teams), {self.home.id: 2, self.away.id: 2})
+        token = Token.objects.create(user=self.user)
+        response = self.client.get(
+            reverse("profile-activity", args=["alice"]) + "?range=week",
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+        )
+        self.assertEqual(len(response.json()["results"]), 2)
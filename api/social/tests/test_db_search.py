@@ -0,0 +1,109 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from matches.models import Team, Tournament
+from matches.services.importers import upsert_team_from_api
+from social.models import UserSearchName
+from social.services.db_search import (
+    SEARCH_SOURCES,
+    IContainsSearch,
+    create_search_structures,
+    db_search_ids,
+    normalized_prefix_queryset,
+    search_structures_exist,
+)
+from social.services.popularity import popularity_scores
+from social.services.suggest import suggest
+
+
+@override_settings(SEARCH_BACKEND="database")
+class DatabaseSearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        popularity_scores.reset()
+        # The test database is migrated with the default memory backend.
+        create_search_structures()
+        self.atletico = Team.objects.create(name="Atlético Madrid")
+        self.real = Team.objects.create(name="Real Madrid")
+        self.other = Team.objects.create(name="Madrid CFF")
+        self.league = Tournament.objects.create(name="Primera División", country="España")
+
+    def test_accent_insensitive_ranked_matches(self):
+        self.assertEqual(db_search_ids("teams", "atletico"), [self.atletico.id])
+        self.assertEqual(
+            db_search_ids("teams", "madrid"),
+            [self.other.id, self.atletico.id, self.real.id],
+        )
+        self.assertEqual(db_search_ids("teams", "real ma"), [self.real.id])
+        self.assertEqual(db_search_ids("leagues", "division espana"), [self.league.id])
+        self.assertEqual(db_search_ids("teams", "  "), [])
+
+    def test_triggers_follow_writes(self):
+        self.assertTrue(search_structures_exist())
+        self.real.name = "Real Betis"
+        self.real.save(update_fields=["name"])
+        self.other.delete()
+        self.assertEqual(db_search_ids("teams", "madrid"), [self.atletico.id])
+        self.assertEqual(db_search_ids("teams", "betis"), [self.real.id])
+        get_user_model().objects.create_user(username="Señor_Gol", password="pw123456")
+        self.assertEqual(len(db_search_ids("users", "senor gol")), 1)
+
+    def test_search_view_uses_database_backend(self):
+        response = self.client.get(reverse("search") + "?q=atletico&types=teams")
+        teams = response.json()["results"]["teams"]
+        self.assertEqual([team["id"] for team in teams], [self.atletico.id])
+
+    def test_icontains_fallback_keeps_ranking(self):
+        ids = IContainsSearch().search(SEARCH_SOURCES["teams"], "madrid")
+        self.assertEqual(ids, [self.other.id, self.atletico.id, self.real.id])
+
+    def test_icontains_fallback_folds_accents(self):
+        ids = IContainsSearch().search(SEARCH_SOURCES["teams"], "atletico")
+        self.assertEqual(ids, [self.atletico.id])
+
+    def test_normalized_names_follow_saves(self):
+        self.assertEqual(self.league.name_normalized, "primera division")
+        self.real.name = "Réal Bétis"
+        self.real.save(update_fields=["name"])
+        self.real.refresh_from_db()
+        self.assertEqual(self.real.name_normalized, "real betis")
+        user = get_user_model().objects.create_user(username="Señor_Gol", password="pw123456")
+        self.assertEqual(UserSearchName.objects.get(user=user).username_normalized, "senor gol")
+
+    def test_prefix_lookups_scan_the_name_index(self):
+        queryset = normalized_prefix_queryset("teams", "ATLÉ")
+        self.assertEqual(list(queryset), [self.atletico])
+        self.assertIn("team_name_norm_idx", queryset.explain())
+        self.assertFalse(normalized_prefix_queryset("teams", " ").exists())
+
+    def test_suggest_reads_prefixes_from_the_database(self):
+        get_user_model().objects.create_user(username="madridista", password="pw123456")
+        names = [item["name"] for item in suggest("mad", 5)]
+        self.assertEqual(names, ["Madrid CFF", "madridista"])
+        self.assertEqual(suggest("prim", 5, kinds=["leagues"])[0]["hint"], "España")
+
+    def test_importer_matches_folded_team_names(self):
+        team, created, _ = upsert_team_from_api({"id": 86, "name": "ATLETICO MADRID"})
+        self.assertFalse(created)
+        self.assertEqual(team.id, self.atletico.id)
+
+
+class SearchStructureSyncTests(TestCase):
+    def test_structures_follow_the_backend_setting(self):
+        # Migrated with the memory backend: no triggers calling bbx_fold.
+        self.assertFalse(search_structures_exist())
+        with override_settings(SEARCH_BACKEND="database"):
+            call_command("sync_search_structures", stdout=StringIO())
+            self.assertTrue(search_structures_exist())
+            self.assertEqual(db_search_ids("teams", "river"), [])
+            team = Team.objects.create(name="River Plate")
+            self.assertEqual(db_search_ids("teams", "river"), [team.id])
+        out = StringIO()
+        call_command("sync_search_structures", stdout=out)
+        self.assertIn("dropped", out.getvalue())
+        self.assertFalse(search_structures_exist())
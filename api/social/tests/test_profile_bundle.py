@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+
+
+class ProfileBundleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        self.league = Tournament.objects.create(name="Liga A")
+        self.teams = [Team.objects.create(name=f"Team {index}") for index in range(6)]
+        for index, score in enumerate([80, 40, 95, 60, 20, 70]):
+            match = Match.objects.create(
+                tournament=self.league,
+                home_team=self.teams[index],
+                away_team=self.teams[(index + 1) % 6],
+                date_time=f"2026-01-{index + 1:02d}T12:00:00Z",
+            )
+            rating = Rating.objects.create(
+                user=self.user, match=match, score=score, featured_order=None
+            )
+            if index == 0:
+                rating.featured_order = 1
+                rating.save(update_fields=["featured_order"])
+
+    def _get(self, query=""):
+        url = reverse("profile-bundle", kwargs={"username": "alice"})
+        return self.client.get(url + query, **self.auth)
+
+    def test_bundle_sections_match_individual_endpoints(self):
+        response = self._get("?range=all")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            data["sections"], ["stats", "activity", "highlights", "memories"]
+        )
+        for section, name in [
+            ("stats", "profile-stats"),
+            ("activity", "profile-activity"),
+            ("highlights", "profile-highlights"),
+            ("memories", "profile-memories"),
+        ]:
+            url = reverse(name, kwargs={"username": "alice"}) + "?range=all"
+            expected = self.client.get(url, **self.auth).json()
+            self.assertEqual(data[section], expected, section)
+
+    def test_bundle_query_budget(self):
+        self._get("?range=all")
+        # Activity and both highlight lists are separate LIMITed queries.
+        with self.assertNumQueries(9):
+            response = self._get("?range=all")
+        self.assertEqual(response.status_code, 200)
+
+    def test_unknown_section_is_rejected(self):
+        response = self._get("?sections=stats,bogus")
+        self.assertEqual(response.status_code, 400)
+
+    def test_profile_and_teams_sections(self):
+        response = self._get("?sections=profile,teams")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data) - {"user", "range", "sections"}, {"profile", "teams"})
+        self.assertEqual(data["teams"]["count"], 0)
+        self.assertEqual(len(data["profile"]["recent_activity"]), 6)
@@ -0,0 +1,70 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+from social.services.profile_stats import get_profile_aggregates
+
+
+class ProfileStatsAggregationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.league = Tournament.objects.create(name="Liga A")
+        self.cup = Tournament.objects.create(name="Copa B")
+        self.teams = [Team.objects.create(name=f"Team {index}") for index in range(8)]
+        self.day = 0
+
+    def _rate(self, tournament, home, away, score=70, minutes=Rating.MinutesWatched.FULL):
+        self.day += 1
+        match = Match.objects.create(
+            tournament=tournament,
+            home_team=home,
+            away_team=away,
+            date_time=f"2026-01-{self.day:02d}T12:00:00Z",
+        )
+        return Rating.objects.create(
+            user=self.user, match=match, score=score, minutes_watched=minutes
+        )
+
+    def test_aggregates_group_teams_and_leagues(self):
+        first, second = self.teams[0], self.teams[1]
+        self._rate(self.league, first, second, score=80)
+        self._rate(self.league, second, first, score=60)
+        self._rate(self.cup, first, self.teams[2], score=40, minutes="LT_30")
+
+        aggregates = get_profile_aggregates(self.user.id, "all")
+        self.assertEqual(aggregates.total_ratings, 3)
+        self.assertEqual(aggregates.avg_score, 60.0)
+        self.assertEqual(aggregates.fully_watched_pct, 66.67)
+        self.assertEqual(aggregates.top_teams[0], (first.id, 3))
+        self.assertEqual(aggregates.team_mentions, 6)
+        self.assertEqual(aggregates.top_leagues[0], (self.league.id, 2))
+
+    def test_others_bucket_collects_tail_teams(self):
+        for index in range(0, 8, 2):
+            self._rate(self.league, self.teams[index], self.teams[index + 1])
+        response = self.client.get(
+            reverse("profile-stats", kwargs={"username": "alice"}) + "?range=all",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+        self.assertEqual(response.status_code, 200)
+        distribution = response.json()["team_distribution"]
+        self.assertEqual(len(distribution), 6)
+        self.assertEqual(distribution[-1]["label"], "Others")
+        self.assertEqual(distribution[-1]["count"], 3)
+
+    def test_cached_until_rating_write(self):
+        self._rate(self.league, self.teams[0], self.teams[1], score=50)
+        self.assertEqual(get_profile_aggregates(self.user.id, "all").total_ratings, 1)
+        with self.assertNumQueries(0):
+            get_profile_aggregates(self.user.id, "all")
+
+        self._rate(self.league, self.teams[2], self.teams[3], score=90)
+        aggregates = get_profile_aggregates(self.user.id, "unknown")
+        self.assertEqual(aggregates.total_ratings, 2)
+        self.assertEqual(aggregates.avg_score, 70.0)
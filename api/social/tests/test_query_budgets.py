@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from core.testing import QueryBudgetMixin
+from matches.models import Match, Rating, Team, Tournament
+from social.models import Follow
+
+
+class EndpointQueryBudgetTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        self.tournament = Tournament.objects.create(name="Liga")
+        self.teams = [
+            Team.objects.create(name=f"Club {index:02d}") for index in range(30)
+        ]
+        for team in self.teams[::2]:
+            Follow.objects.create(user=self.user, team=team)
+        for index in range(20):
+            match = Match.objects.create(
+                tournament=self.tournament,
+                home_team=self.teams[index],
+                away_team=self.teams[index + 1],
+                date_time=f"2026-01-{index + 1:02d}T12:00:00Z",
+            )
+            if index % 2 == 0:
+                Rating.objects.create(user=self.user, match=match, score=60)
+
+    def _get(self, name, query="", **kwargs):
+        return self.client.get(reverse(name, kwargs=kwargs) + query, **self.auth)
+
+    def test_search_teams_batches_follow_state(self):
+        self._get("search", "?q=club&types=teams&page_size=50")
+        with self.assertMaxQueries(4):
+            response = self._get("search", "?q=club&types=teams&page_size=50")
+        teams = response.json()["results"]["teams"]
+        self.assertEqual(len(teams), 30)
+        following = {team["id"] for team in teams if team["is_following"]}
+        self.assertEqual(following, {team.id for team in self.teams[::2]})
+
+    def test_team_list_and_detail(self):
+        with self.assertMaxQueries(2):
+            response = self._get("teams")
+        self.assertEqual(sum(t["is_following"] for t in response.json()["results"]), 15)
+
+        self._get("team-detail", pk=self.teams[0].id)
+        with self.assertMaxQueries(2):
+            response = self._get("team-detail", pk=self.teams[0].id)
+        self.assertTrue(response.json()["is_following"])
+
+    def test_match_lists(self):
+        self._get("feed")
+        with self.assertMaxQueries(3):
+            self._get("feed")
+        with self.assertMaxQueries(3):
+            self._get("match-list")
+        with self.assertMaxQueries(6):
+            self._get("team-matches", pk=self.teams[0].id)
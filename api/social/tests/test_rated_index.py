@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+from social.services.rated_index import search_rated_ids
+
+
+class RatedMatchesIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.other = User.objects.create_user(username="bob", password="testpass123")
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {Token.objects.create(user=self.user).key}"}
+        self.league = Tournament.objects.create(name="LaLiga")
+        self.atletico = Team.objects.create(name="Atlético Madrid")
+        self.betis = Team.objects.create(name="Real Betis")
+        self.sevilla = Team.objects.create(name="Sevilla")
+        self.derby = self._rate(self.betis, self.sevilla, "2026-01-01T12:00:00Z")
+        self.visit = self._rate(self.atletico, self.betis, "2026-01-08T12:00:00Z")
+
+    def _rate(self, home, away, kickoff, user=None):
+        match = Match.objects.create(
+            tournament=self.league, home_team=home, away_team=away, date_time=kickoff
+        )
+        return Rating.objects.create(
+            user=user or self.user,
+            match=match,
+            score=70,
+            minutes_watched=Rating.MinutesWatched.FULL,
+        )
+
+    def _ids(self, query=""):
+        url = reverse("profile-ratings", kwargs={"username": "alice"}) + query
+        response = self.client.get(url, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        return [item["id"] for item in response.json()["results"]]
+
+    def test_filters_folded_names_newest_first(self):
+        self.assertEqual(self._ids(), [self.visit.id, self.derby.id])
+        self.assertEqual(self._ids("?q=ATLETICO"), [self.visit.id])
+        self.assertEqual(self._ids("?q=betis"), [self.visit.id, self.derby.id])
+        self.assertEqual(self._ids("?q=laliga&page_size=1&page=2"), [self.derby.id])
+        self.assertEqual(self._ids("?q=barcelona"), [])
+
+    def test_index_is_cached_until_the_user_rates_again(self):
+        search_rated_ids(self.user.id, "")
+        with self.assertNumQueries(0):
+            self.assertEqual(search_rated_ids(self.user.id, "sevilla"), [self.derby.id])
+        self._rate(self.sevilla, self.atletico, "2026-01-15T12:00:00Z", user=self.other)
+        with self.assertNumQueries(0):
+            search_rated_ids(self.user.id, "sevilla")
+        latest = self._rate(self.sevilla, self.atletico, "2026-01-22T12:00:00Z")
+        self.assertEqual(
+            search_rated_ids(self.user.id, "sevilla"), [latest.id, self.derby.id]
+        )
+
+    def test_only_name_changes_invalidate_the_index(self):
+        search_rated_ids(self.user.id, "")
+        self.sevilla.logo_url = "https://example.com/sevilla.png"
+        self.sevilla.save(update_fields=["logo_url"])
+        with self.assertNumQueries(0):
+            search_rated_ids(self.user.id, "sevilla")
+        self.sevilla.name = "Sevilla FC"
+        self.sevilla.save(update_fields=["name"])
+        self.assertEqual(search_rated_ids(self.user.id, "sevilla fc"), [self.derby.id])
+
+    def test_other_users_cannot_search(self):
+        url = reverse("profile-ratings", kwargs={"username": "bob"})
+        self.assertEqual(self.client.get(url, **self.auth).status_code, 403)
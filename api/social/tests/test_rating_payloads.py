@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+
+INLINE_PHOTO = "data:image/jpeg;base64," + "A" * 4096
+
+
+class LeanRatingPayloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {self.token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        home = Team.objects.create(name="Home")
+        away = Team.objects.create(name="Away")
+        match = Match.objects.create(
+            tournament=tournament,
+            home_team=home,
+            away_team=away,
+            date_time="2026-01-01T12:00:00Z",
+        )
+        Rating.objects.create(
+            user=self.user,
+            match=match,
+            score=70,
+            stadium_photo_url=INLINE_PHOTO,
+            featured_note="Great night",
+            featured_order=1,
+        )
+
+    def test_activity_omits_photo_columns(self):
+        response = self.client.get(
+            reverse("profile-activity", kwargs={"username": "alice"}) + "?range=all",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 200)
+        item = response.json()["results"][0]
+        self.assertTrue(item["has_photo"])
+        self.assertIsNone(item["thumbnail_url"])
+        self.assertNotIn("stadium_photo_url", item)
+        self.assertNotIn(INLINE_PHOTO, response.content.decode())
+
+    def test_memories_keep_full_photos(self):
+        response = self.client.get(
+            reverse("profile-memories", kwargs={"username": "alice"}), **self.auth
+        )
+        self.assertEqual(response.json()["results"][0]["stadium_photo_url"], INLINE_PHOTO)
+
+    def test_sparse_fieldsets(self):
+        response = self.client.get(
+            reverse("profile-activity", kwargs={"username": "alice"})
+            + "?range=all&fields=score,match",
+            **self.auth,
+        )
+        self.assertEqual(set(response.json()["results"][0]), {"id", "score", "match"})
+
+        response = self.client.get(
+            reverse("profile-activity", kwargs={"username": "alice"}) + "?fields=bogus",
+            **self.auth,
+        )
+        self.assertEqual(response.status_code, 400)
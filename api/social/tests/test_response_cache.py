@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from core.response_cache import local_cache, metrics
+from matches.models import Match, Rating, Team, Tournament
+
+
+class AnonymousResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        metrics.reset()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+        tournament = Tournament.objects.create(name="Liga")
+        self.home = Team.objects.create(name="River")
+        self.away = Team.objects.create(name="Boca")
+        self.match = Match.objects.create(
+            tournament=tournament,
+            home_team=self.home,
+            away_team=self.away,
+            date_time="2026-01-01T12:00:00Z",
+        )
+
+    def test_repeat_request_is_served_from_l1(self):
+        url = reverse("team-detail", args=[self.home.id])
+        first = self.client.get(url)
+        self.assertEqual(first["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second["X-Cache"], "HIT-L1")
+        self.assertEqual(second.json(), first.json())
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["l1_hits"], 1)
+        self.assertEqual(snapshot["misses"], 1)
+        self.assertEqual(snapshot["hit_rate"], 0.5)
+
+    def test_l2_refills_l1_and_query_order_is_normalized(self):
+        url = reverse("search")
+        self.client.get(url + "?q=river&types=teams")
+        local_cache.clear()
+        response = self.client.get(url + "?types=teams&q=river&page=")
+        self.assertEqual(response["X-Cache"], "HIT-L2")
+        self.assertEqual(self.client.get(url + "?q=river&types=teams")["X-Cache"], "HIT-L1")
+
+    def test_writes_invalidate_tagged_entries(self):
+        url = reverse("team-matches", args=[self.home.id])
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)["X-Cache"], "HIT-L1")
+        Rating.objects.create(user=self.user, match=self.match, score=90)
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["results"][0]["rating_count"], 1)
+
+        detail_url = reverse("team-detail", args=[self.away.id])
+        self.client.get(detail_url)
+        self.match.away_score = 1
+        self.match.save(update_fields=["away_score"])
+        self.assertEqual(self.client.get(detail_url)["X-Cache"], "MISS")
+        self.assertEqual(metrics.snapshot()["stale"], 2)
+
+    def test_authenticated_and_error_responses_bypass_cache(self):
+        url = reverse("public-profile", args=["alice"])
+        response = self.client.get(url, **self.auth)
+        self.assertNotIn("X-Cache", response)
+        missing = reverse("team-detail", args=[9999])
+        self.client.get(missing)
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        self.assertEqual(metrics.snapshot()["stores"], 0)
+
+    @override_settings(RESPONSE_CACHE_SECONDS=0)
+    def test_disabled_cache_passes_through(self):
+        response = self.client.get(reverse("team-detail", args=[self.home.id]))
+        self.assertNotIn("X-Cache", response)
@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from matches.models import Team
+from social.models import SearchQueryLog
+from social.services.search_analytics import search_analytics
+from social.services.search_index import reset_search_indexes
+
+
+class SearchAnalyticsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_search_indexes()
+        search_analytics.reset()
+        Team.objects.create(name="Real Madrid")
+
+    def _search(self, query):
+        response = self.client.get(reverse("search") + f"?q={query}&types=teams,leagues")
+        self.assertEqual(response.status_code, 200)
+
+    def test_searches_are_buffered_then_flushed_in_bulk(self):
+        self._search("Réal")
+        self._search("zzz")
+        self.assertEqual(SearchQueryLog.objects.count(), 0)
+        self.assertEqual(search_analytics.flush(), 2)
+        first = SearchQueryLog.objects.get(query="real")
+        self.assertEqual((first.types, first.total), ("leagues,teams", 1))
+        self.assertEqual(set(first.per_type["teams"]), {"count", "ms", "hit"})
+        self.assertEqual(SearchQueryLog.objects.get(query="zzz").total, 0)
+        self.assertEqual(search_analytics.flush(), 0)
+
+    def test_response_cache_hits_are_recorded(self):
+        self._search("real")
+        self._search("real")
+        search_analytics.flush()
+        miss, hit = SearchQueryLog.objects.order_by("id")
+        self.assertEqual((hit.query, hit.types, hit.total), ("real", "leagues,teams", 1))
+        self.assertEqual(set(miss.per_type), {"leagues", "teams"})
+        self.assertEqual(hit.per_type, {})
+        self.assertEqual(hit.request_params, "q=real&types=teams%2Cleagues")
+        self.assertEqual(miss.request_params, hit.request_params)
+
+    @override_settings(SEARCH_ANALYTICS_BUFFER_SIZE=2)
+    def test_buffer_keeps_only_the_newest_entries(self):
+        search_analytics.reset()
+        for query in ("real", "madrid", "zzz"):
+            self._search(query)
+        self.assertEqual(len(search_analytics), 2)
+        search_analytics.flush()
+        self.assertEqual(
+            sorted(SearchQueryLog.objects.values_list("query", flat=True)), ["madrid", "zzz"]
+        )
+
+    @override_settings(SEARCH_ANALYTICS_BUFFER_SIZE=0)
+    def test_disabled_analytics_records_nothing(self):
+        self._search("real")
+        self.assertEqual(len(search_analytics), 0)
+
+    def test_report_lists_top_and_zero_result_queries(self):
+        now = timezone.now()
+        SearchQueryLog.objects.bulk_create(
+            [
+                SearchQueryLog(
+                    query="real", types="teams", total=1, duration_ms=5.0,
+                    per_type={"teams": {"count": 1, "ms": 4.0, "hit": True}}, created_at=now,
+                ),
+                SearchQueryLog(
+                    query="real", types="teams", total=1, duration_ms=9.0,
+                    per_type={"teams": {"count": 1, "ms": 8.0, "hit": False}}, created_at=now,
+                ),
+                SearchQueryLog(
+                    query="zzz", types="teams", total=0, duration_ms=700.0,
+                    per_type={"teams": {"count": 0, "ms": 699.0, "hit": False}}, created_at=now,
+                ),
+                SearchQueryLog(
+                    query="real", types="teams", total=1, duration_ms=1.0,
+                    per_type={}, created_at=now,
+                ),
+            ]
+        )
+        out = StringIO()
+        call_command("search_report", "--limit", "1", stdout=out)
+        report = out.getvalue()
+        self.assertIn("4 searches in the last 7 days", report)
+        self.assertIn("25% from the response cache", report)
+        self.assertIn("cache hits 33%", report)
+        top, zero, slowest = report.split("\n\n")[1:4]
+        self.assertTrue(top.splitlines()[1].endswith("real"))
+        self.assertTrue(zero.splitlines()[1].endswith("zzz"))
+        self.assertTrue(slowest.splitlines()[1].endswith("zzz"))
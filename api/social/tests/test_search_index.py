@@ -0,0 +1,187 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Team, Tournament
+from social.models import SearchChange
+from social.services.search_index import (
+    SEARCH_INDEXES,
+    TrigramIndex,
+    reset_search_indexes,
+    search_ids,
+)
+
+
+class TrigramIndexTests(TestCase):
+    def test_token_and_with_ranking(self):
+        index = TrigramIndex()
+        index.upsert(1, "Atlético Madrid")
+        index.upsert(2, "Club Atlético Tucumán")
+        index.upsert(3, "Atlético")
+        index.upsert(4, "Real Madrid")
+        self.assertEqual(index.search(["atletico"], "atletico"), [3, 1, 2])
+        self.assertEqual(index.search(["madrid", "atl"], "madrid atl"), [1])
+        self.assertEqual(index.search(["zz"], "zz"), [])
+        index.remove(3)
+        self.assertEqual(index.search(["atletico"], "atletico"), [1, 2])
+
+    def test_extra_fields_are_searchable(self):
+        index = TrigramIndex()
+        index.upsert(1, "Primera División", "Argentina")
+        self.assertEqual(index.search(["division", "argentina"], "division"), [1])
+
+
+class SearchIndexViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_search_indexes()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        token = Token.objects.create(user=self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+        self.league = Tournament.objects.create(name="LaLiga", country="España")
+        self.atletico = Team.objects.create(name="Atlético Madrid")
+        self.real = Team.objects.create(name="Real Madrid")
+        self.other = Team.objects.create(name="Madrid CFF")
+        Match.objects.create(
+            tournament=self.league,
+            home_team=self.atletico,
+            away_team=self.real,
+            date_time="2026-01-01T12:00:00Z",
+        )
+
+    def _search(self, query):
+        response = self.client.get(reverse("search") + query, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_accent_folded_queries_match(self):
+        teams = self._search("?q=atletico&types=teams")["teams"]
+        self.assertEqual([team["name"] for team in teams], ["Atlético Madrid"])
+        leagues = self._search("?q=espana&types=leagues")["leagues"]
+        self.assertEqual([league["id"] for league in leagues], [self.league.id])
+
+    def test_ranking_and_league_filter(self):
+        teams = self._search("?q=madrid&types=teams")["teams"]
+        self.assertEqual(
+            [team["id"] for team in teams],
+            [self.other.id, self.atletico.id, self.real.id],
+        )
+        filtered = self._search(f"?q=madrid&types=teams&league_id={self.league.id}")
+        self.assertEqual(
+            [team["id"] for team in filtered["teams"]],
+            [self.atletico.id, self.real.id],
+        )
+
+    def test_page_is_hydrated_with_one_query(self):
+        search_ids("teams", "madrid")
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("search") + "?q=madrid&types=teams")
+        self.assertEqual(len(response.json()["results"]["teams"]), 3)
+
+    def test_writes_refresh_the_index_incrementally(self):
+        search_ids("users", "bob")
+        search_ids("teams", "madrid")
+        get_user_model().objects.create_user(username="bob", password="testpass123")
+        self.real.name = "Real Madrid CF"
+        self.real.save(update_fields=["name"])
+        with self.assertNumQueries(0):
+            self.assertEqual(len(search_ids("users", "bob")), 1)
+            self.assertEqual(search_ids("teams", "real madrid cf"), [self.real.id])
+
+    def test_changes_from_another_process_apply_as_deltas(self):
+        search_ids("teams", "madrid")
+        index = SEARCH_INDEXES["teams"].index
+        Team.objects.filter(pk=self.other.pk).update(name="Sevilla")
+        SearchChange.objects.create(kind="teams", object_id=self.other.pk)
+        self.assertIn(self.other.id, search_ids("teams", "madrid"))
+        with self.settings(SEARCH_SYNC_SECONDS=0):
+            self.assertNotIn(self.other.id, search_ids("teams", "madrid"))
+            self.assertEqual(search_ids("teams", "sevilla"), [self.other.id])
+        self.assertIs(SEARCH_INDEXES["teams"].index, index)
+
+    def test_expired_cache_versions_do_not_rebuild(self):
+        search_ids("teams", "madrid")
+        index = SEARCH_INDEXES["teams"].index
+        cache.clear()
+        with self.assertNumQueries(0):
+            search_ids("teams", "madrid")
+        self.assertIs(SEARCH_INDEXES["teams"].index, index)
+
+    def test_vs_query_resolves_team_ids_with_head_to_head(self):
+        finished = Match.objects.create(
+            tournament=self.league,
+            home_team=self.real,
+            away_team=self.atletico,
+            date_time="2025-10-01T12:00:00Z",
+            status="FINISHED",
+            home_score=1,
+            away_score=3,
+        )
+        response = self.client.get(
+            reverse("search") + "?q=atletico vs real&types=matches", **self.auth
+        )
+        payload = response.json()
+        self.assertEqual(payload["total"], 2)
+        self.assertIn(finished.id, [match["id"] for match in payload["results"]["matches"]])
+        head_to_head = payload["head_to_head"]
+        self.assertEqual(head_to_head["team"]["id"], self.atletico.id)
+        self.assertEqual(head_to_head["opponent"]["id"], self.real.id)
+        self.assertEqual(
+            [head_to_head[key] for key in ("played", "team_wins", "draws", "team_goals")],
+            [1, 1, 0, 3],
+        )
+        self.assertEqual(head_to_head["last_played_at"], "2025-10-01T12:00:00Z")
+        response = self.client.get(reverse("search") + "?q=madrid&types=teams", **self.auth)
+        self.assertIsNone(response.json()["head_to_head"])
+
+    def test_vs_side_over_the_candidate_cap_filters_by_name(self):
+        with mock.patch("social.views.VS_TEAM_CANDIDATES", 1):
+            response = self.client.get(
+                reverse("search") + "?q=madrid vs atletico&types=matches", **self.auth
+            )
+        payload = response.json()
+        self.assertEqual(payload["total"], 1)
+        # "madrid" names three teams, none of them exactly.
+        self.assertIsNone(payload["head_to_head"])
+
+    def test_result_ids_are_reused_across_pages_until_a_write(self):
+        url = reverse("search") + "?q=madrid&types=teams,matches&page_size=1"
+        first = self.client.get(url, **self.auth)
+        self.assertIn('teams;dur=', first["Server-Timing"])
+        self.assertIn('matches;dur=', first["Server-Timing"])
+        self.assertNotIn('"hit"', first["Server-Timing"])
+
+        second = self.client.get(url + "&page=2", **self.auth)
+        self.assertEqual(second["Server-Timing"].count('desc="hit"'), 2)
+        self.assertEqual(second.json()["total"], first.json()["total"])
+        self.assertEqual(
+            [team["id"] for team in second.json()["results"]["teams"]], [self.atletico.id]
+        )
+
+        self.other.name = "Sevilla"
+        self.other.save()
+        third = self.client.get(url + "&page=2", **self.auth)
+        self.assertIn('teams;dur=', third["Server-Timing"])
+        self.assertNotIn('"hit"', third["Server-Timing"])
+        self.assertEqual(third.json()["results"]["teams"][0]["id"], self.real.id)
+
+
+class BackgroundBuildTests(TransactionTestCase):
+    def setUp(self):
+        reset_search_indexes()
+        self.team = Team.objects.create(name="Atlético Madrid")
+
+    def tearDown(self):
+        reset_search_indexes()
+
+    def test_first_search_scans_names_while_the_index_builds(self):
+        managed = SEARCH_INDEXES["teams"]
+        self.assertEqual(search_ids("teams", "atletico"), [self.team.id])
+        managed.builder.join(timeout=5)
+        self.assertEqual(len(managed.index), 1)
+        self.assertEqual(search_ids("teams", "atletico"), [self.team.id])
@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from matches.models import Match, Rating, Team, Tournament
+from social.models import Follow, SearchPopularity
+from social.services.db_search import create_search_structures, db_search_ids
+from social.services.popularity import popularity_scores, refresh_search_popularity
+from social.services.search_index import reset_search_indexes, search_ids
+
+
+@override_settings(SEARCH_POPULARITY_WEIGHT=1.0, CRON_SECRET="test-secret")
+class SearchPopularityTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_search_indexes()
+        popularity_scores.reset()
+        User = get_user_model()
+        self.fan = User.objects.create_user(username="fan", password="testpass123")
+        self.league = Tournament.objects.create(name="LaLiga")
+        self.obscure = Team.objects.create(name="Madrid CFF")
+        self.popular = Team.objects.create(name="Real Madrid")
+        self.rival = Team.objects.create(name="Sevilla")
+        played = Match.objects.create(
+            tournament=self.league,
+            home_team=self.popular,
+            away_team=self.rival,
+            date_time=timezone.now() - timedelta(days=3),
+        )
+        Match.objects.create(
+            tournament=self.league,
+            home_team=self.rival,
+            away_team=self.popular,
+            date_time=timezone.now() + timedelta(days=3),
+        )
+        Rating.objects.create(
+            user=self.fan,
+            match=played,
+            score=90,
+            minutes_watched=Rating.MinutesWatched.FULL,
+        )
+        Follow.objects.create(user=self.fan, team=self.popular)
+
+    def test_refresh_stores_signals(self):
+        written = refresh_search_popularity()
+        self.assertEqual(written, {"teams": 2, "leagues": 1, "users": 1})
+        row = SearchPopularity.objects.get(kind="teams", object_id=self.popular.id)
+        self.assertEqual(
+            (row.followers, row.recent_ratings, row.upcoming_matches), (1, 1, 1)
+        )
+        self.assertFalse(
+            SearchPopularity.objects.filter(kind="teams", object_id=self.obscure.id).exists()
+        )
+
+    def test_popular_team_outranks_obscure_prefix_match(self):
+        self.assertEqual(search_ids("teams", "madrid"), [self.obscure.id, self.popular.id])
+        refresh_search_popularity(["teams"])
+        self.assertEqual(search_ids("teams", "madrid"), [self.popular.id, self.obscure.id])
+        with override_settings(SEARCH_BACKEND="database"):
+            create_search_structures()
+            self.assertEqual(
+                db_search_ids("teams", "madrid", 1.0), [self.popular.id, self.obscure.id]
+            )
+        with override_settings(SEARCH_POPULARITY_WEIGHT=0):
+            self.assertEqual(search_ids("teams", "madrid"), [self.obscure.id, self.popular.id])
+
+    def test_incremental_refresh_only_touches_recent_activity(self):
+        refresh_search_popularity(["teams"])
+        earlier = timezone.now() - timedelta(days=1)
+        Rating.objects.update(created_at=earlier)
+        Follow.objects.update(follow_date=earlier)
+        SearchPopularity.objects.filter(object_id=self.rival.id).update(score=0)
+        Follow.objects.create(user=self.fan, team=self.obscure)
+        written = refresh_search_popularity(
+            ["teams"], since=timezone.now() - timedelta(minutes=5)
+        )
+        self.assertEqual(written, {"teams": 1})
+        self.assertEqual(
+            SearchPopularity.objects.get(object_id=self.rival.id).score, 0
+        )
+        self.assertEqual(
+            SearchPopularity.objects.get(object_id=self.obscure.id).followers, 1
+        )
+
+    @override_settings(SEARCH_POPULARITY_WINDOW_DAYS=30)
+    def test_incremental_refresh_drops_ratings_that_aged_out(self):
+        refresh_search_popularity(["users"])
+        self.assertTrue(SearchPopularity.objects.filter(kind="users").exists())
+        Rating.objects.update(created_at=timezone.now() - timedelta(days=30, minutes=30))
+        refresh_search_popularity(["users"], since=timezone.now() - timedelta(hours=1))
+        self.assertFalse(SearchPopularity.objects.filter(kind="users").exists())
+
+    def test_scores_survive_expired_cache_versions(self):
+        refresh_search_popularity(["teams"])
+        scores = popularity_scores.get("teams")
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertIs(popularity_scores.get("teams"), scores)
+
+    def test_internal_endpoint_requires_token(self):
+        url = reverse("internal-search-popularity")
+        self.assertEqual(self.client.post(url).status_code, 401)
+        response = self.client.post(url, HTTP_X_CRON_TOKEN="test-secret")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["written"]["teams"], 2)
@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from matches.models import Team, Tournament
+from social.models import Follow
+from social.services.suggest import PrefixIndex, Suggestion, suggest, suggest_index
+
+
+class PrefixIndexTests(TestCase):
+    def _index(self):
+        return PrefixIndex(
+            [
+                Suggestion("teams", 1, "Atlético Madrid", "", 1.0),
+                Suggestion("teams", 2, "Real Madrid", "", 5.0),
+                Suggestion("teams", 3, "Madrid CFF", "", 0.0),
+                Suggestion("leagues", 4, "Primera División", "Argentina", 2.0),
+                Suggestion("users", 5, "madridista", "", 0.5),
+            ]
+        )
+
+    def test_word_prefixes_rank_name_starts_then_popularity(self):
+        results = self._index().suggest("mad", 10)
+        self.assertEqual([item.id for item in results], [5, 3, 2, 1])
+
+    def test_accents_short_prefixes_and_kinds(self):
+        index = self._index()
+        self.assertEqual([item.id for item in index.suggest("ATLÉ", 10)], [1])
+        self.assertEqual([item.id for item in index.suggest("m", 2)], [5, 3])
+        self.assertEqual(
+            [item.id for item in index.suggest("m", 10, {"teams"})], [3, 2, 1]
+        )
+        self.assertEqual(index.suggest("  ", 10), [])
+
+
+class SearchSuggestViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        suggest_index.reset()
+        self.user = get_user_model().objects.create_user(
+            username="riverplatefan", password="testpass123"
+        )
+        self.river = Team.objects.create(name="River Plate", country="Argentina")
+        self.rivera = Team.objects.create(name="Rivera FC", country="Uruguay")
+        Tournament.objects.create(name="Copa Libertadores", country="CONMEBOL")
+        Follow.objects.create(user=self.user, team=self.river)
+
+    def _suggest(self, query):
+        response = self.client.get(reverse("search-suggest") + query)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_followed_team_ranks_first_and_limit_applies(self):
+        results = self._suggest("?q=riv&limit=2")
+        self.assertEqual(
+            [(item["type"], item["id"]) for item in results],
+            [("team", self.river.id), ("team", self.rivera.id)],
+        )
+        self.assertEqual(results[0]["hint"], "Argentina")
+        self.assertEqual(
+            [item["type"] for item in self._suggest("?q=riv&types=users")], ["user"]
+        )
+
+    def test_renamed_team_is_suggested_without_waiting_for_refresh(self):
+        self.assertEqual(self._suggest("?q=boca"), [])
+        self.rivera.name = "Boca Juniors"
+        self.rivera.save()
+        self.assertEqual([item["id"] for item in self._suggest("?q=boca")], [self.rivera.id])
+        self.assertEqual(self._suggest("?q="), [])
+
+    def test_expired_cache_versions_do_not_rebuild(self):
+        self._suggest("?q=riv")
+        index = suggest_index.index
+        cache.clear()
+        self._suggest("?q=riv")
+        self.assertIs(suggest_index.index, index)
+
+
+class SuggestBackgroundBuildTests(TransactionTestCase):
+    def setUp(self):
+        suggest_index.reset()
+        self.team = Team.objects.create(name="River Plate", country="Argentina")
+
+    def tearDown(self):
+        suggest_index.reset()
+
+    def test_cold_start_answers_from_the_database_while_building(self):
+        self.assertEqual([item["id"] for item in suggest("riv", 5)], [self.team.id])
+        suggest_index.builder.join(timeout=5)
+        self.assertEqual(len(suggest_index.index.suggestions), 1)
+        self.assertEqual([item["id"] for item in suggest("plate", 5)], [self.team.id])
@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Team
+from social.models import Follow, UserFollow
+from social.services.graph import get_social_graph
+
+
+class SocialGraphTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.other = User.objects.create_user(username="bob", password="testpass123")
+        self.team = Team.objects.create(name="Team A")
+        self.token = Token.objects.create(user=self.user)
+
+    def test_graph_is_cached(self):
+        Follow.objects.create(user=self.user, team=self.team)
+        get_social_graph(self.user.id)
+        with self.assertNumQueries(0):
+            graph = get_social_graph(self.user.id)
+        self.assertEqual(graph.team_ids, frozenset({self.team.id}))
+        self.assertEqual(graph.teams_followed, 1)
+
+    def test_follow_writes_invalidate_both_users(self):
+        self.assertEqual(get_social_graph(self.user.id).following_count, 0)
+        self.assertEqual(get_social_graph(self.other.id).followers_count, 0)
+
+        UserFollow.objects.create(follower=self.user, following=self.other)
+        self.assertEqual(
+            get_social_graph(self.user.id).following_ids, frozenset({self.other.id})
+        )
+        self.assertEqual(get_social_graph(self.other.id).followers_count, 1)
+
+        UserFollow.objects.filter(follower=self.user, following=self.other).delete()
+        self.assertEqual(get_social_graph(self.user.id).following_count, 0)
+        self.assertEqual(get_social_graph(self.other.id).followers_count, 0)
+
+    def test_public_profile_reports_graph_counts(self):
+        UserFollow.objects.create(follower=self.user, following=self.other)
+        Follow.objects.create(user=self.other, team=self.team)
+        url = reverse("public-profile", kwargs={"username": "bob"})
+        response = self.client.get(
+            url, HTTP_AUTHORIZATION=f"Token {self.token.key}"
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data["is_following"])
+        self.assertEqual(data["stats"]["followers"], 1)
+        self.assertEqual(data["stats"]["teams_followed"], 1)
+
+    def test_profile_reports_graph_counts(self):
+        Follow.objects.create(user=self.user, team=self.team)
+        url = reverse("profile", kwargs={"username": "alice"})
+        response = self.client.get(
+            url, HTTP_AUTHORIZATION=f"Token {self.token.key}"
+        )
+        self.assertEqual(response.status_code, 200)
+        stats = response.json()["stats"]
+        self.assertEqual(stats["teams_followed"], 1)
+        self.assertEqual(stats["fully_watched_pct"], 0.0)
@@ -0,0 +1,165 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from matches.models import Match, Rating, Team, Tournament
+from social.models import Follow, UserFollow, UserStats
+from social.services.stats import compute_user_stats, get_user_stats
+
+
+class UserStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="alice", password="testpass123")
+        self.other = User.objects.create_user(username="bob", password="testpass123")
+        self.token = Token.objects.create(user=self.user)
+        tournament = Tournament.objects.create(name="Liga Test")
+        self.home = Team.objects.create(name="Team A")
+        self.away = Team.objects.create(name="Team B")
+        self.matches = [
+            Match.objects.create(
+                tournament=tournament,
+                home_team=self.home,
+                away_team=self.away,
+                date_time=f"2026-01-0{day}T12:00:00Z",
+            )
+            for day in (1, 2)
+        ]
+        get_user_stats(self.user.id)
+        get_user_stats(self.other.id)
+
+    def _stats(self, user):
+        return UserStats.objects.get(user=user)
+
+    def test_rating_writes_update_counters(self):
+        rating = Rating.objects.create(
+            user=self.user,
+            match=self.matches[0],
+            score=80,
+            minutes_watched=Rating.MinutesWatched.FULL,
+        )
+        Rating.objects.create(
+            user=self.user,
+            match=self.matches[1],
+            score=60,
+            minutes_watched=Rating.MinutesWatched.ONE_HALF,
+        )
+        stats = self._stats(self.user)
+        self.assertEqual(stats.total_ratings, 2)
+        self.assertEqual(stats.avg_score, 70.0)
+        self.assertEqual(stats.fully_watched_pct, 50.0)
+
+        rating.score = 40
+        rating.minutes_watched = Rating.MinutesWatched.LT_30
+        rating.save()
+        stats = self._stats(self.user)
+        self.assertEqual(stats.score_sum, 100)
+        self.assertEqual(stats.full_count, 0)
+
+        rating.delete()
+        stats = self._stats(self.user)
+        self.assertEqual(stats.total_ratings, 1)
+        self.assertEqual(stats.score_sum, 60)
+
+    def test_rating_update_and_stats_delta_commit_together(self):
+        rating = Rating.objects.create(
+            user=self.user, match=self.matches[0], score=80, minutes_watched="FULL"
+        )
+        stale = Rating.objects.get(pk=rating.pk)
+        rating.score = 90
+        rating.save()
+        # The delta comes from the stored row, not the stale instance.
+        stale.score = 70
+        stale.save()
+        self.assertEqual(self._stats(self.user).score_sum, 70)
+
+        stale.score = 10
+        with mock.patch(
+            "social.signals.apply_user_stats_delta", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                stale.save()
+        rating.refresh_from_db()
+        self.assertEqual(rating.score, 70)
+        self.assertEqual(self._stats(self.user).score_sum, 70)
+
+    def test_follow_writes_update_counters(self):
+        Follow.objects.create(user=self.user, team=self.home)
+        UserFollow.objects.create(follower=self.user, following=self.other)
+        self.assertEqual(self._stats(self.user).teams_followed, 1)
+        self.assertEqual(self._stats(self.user).following, 1)
+        self.assertEqual(self._stats(self.other).followers, 1)
+
+        UserFollow.objects.filter(follower=self.user).delete()
+        self.assertEqual(self._stats(self.other).followers, 0)
+
+    def test_new_users_start_with_a_stats_row(self):
+        user = get_user_model().objects.create_user(username="carol", password="testpass123")
+        self.assertEqual(self._stats(user).teams_followed, 0)
+
+    def test_delta_on_a_missing_row_counts_from_source(self):
+        UserStats.objects.filter(user=self.user).delete()
+        Follow.objects.create(user=self.user, team=self.home)
+        self.assertEqual(self._stats(self.user).teams_followed, 1)
+
+    def test_delta_is_not_lost_to_a_concurrent_stale_rebuild(self):
+        UserStats.objects.filter(user=self.user).delete()
+
+        def stale_insert(user_id):
+            # A reader counted before this write committed and inserted first.
+            UserStats.objects.create(user_id=user_id)
+            return None
+
+        with mock.patch("social.services.stats.create_user_stats", side_effect=stale_insert):
+            Follow.objects.create(user=self.user, team=self.home)
+        self.assertEqual(self._stats(self.user).teams_followed, 1)
+
+    def test_deleting_a_user_leaves_no_stats_row(self):
+        Follow.objects.create(user=self.user, team=self.home)
+        UserFollow.objects.create(follower=self.user, following=self.other)
+        UserFollow.objects.create(follower=self.other, following=self.user)
+        Rating.objects.create(user=self.user, match=self.matches[0], score=80)
+        self.user.delete()
+        connection.check_constraints()
+        self.assertFalse(UserStats.objects.filter(user_id=self.user.id).exists())
+        self.assertEqual(self._stats(self.other).followers, 0)
+        self.assertEqual(self._stats(self.other).following, 0)
+
+    def test_repair_command_recomputes_from_source(self):
+        Rating.objects.create(
+            user=self.user,
+            match=self.matches[0],
+            score=90,
+            minutes_watched=Rating.MinutesWatched.FULL,
+        )
+        UserStats.objects.filter(user=self.user).update(total_ratings=7, score_sum=3)
+        call_command("rebuild_user_stats", stdout=StringIO())
+        stats = self._stats(self.user)
+        self.assertEqual(stats.total_ratings, 1)
+        self.assertEqual(stats.score_sum, 90)
+        self.assertEqual(
+            compute_user_stats(self.user.id)["full_count"], stats.full_count
+        )
+
+    def test_profile_reads_stats_row(self):
+        Rating.objects.create(
+            user=self.user,
+            match=self.matches[0],
+            score=75,
+            minutes_watched=Rating.MinutesWatched.FULL,
+        )
+        url = reverse("profile", kwargs={"username": "alice"})
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.assertEqual(response.status_code, 200)
+        stats = response.json()["stats"]
+        self.assertEqual(stats["total_ratings"], 1)
+        self.assertEqual(stats["avg_score"], 75.0)
+        self.assertEqual(stats["fully_watched_pct"], 100.0)
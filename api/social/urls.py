@@ -5,6 +5,7 @@ from .views import (
     FriendsFeedView,
     MeView,
     ProfileActivityView,
+    ProfileBundleView,
     ProfileHighlightsView,
     ProfileMemoriesView,
     ProfileMemoryDetailView,
@@ -13,7 +14,9 @@ from .views import (
     ProfileTeamsView,
     ProfileView,
     PublicProfileView,
+    SearchSuggestView,
     SearchView,
+    TeamBatchView,
     TeamDetailView,
     TeamFollowView,
     TeamMatchesView,
@@ -27,6 +30,7 @@ urlpatterns = [
     path("feed/friends/", FriendsFeedView.as_view(), name="friends-feed"),
     path("me/", MeView.as_view(), name="me"),
     path("teams/", TeamsView.as_view(), name="teams"),
+    path("teams/batch/", TeamBatchView.as_view(), name="team-batch"),
     path("teams/<int:pk>/", TeamDetailView.as_view(), name="team-detail"),
     path("teams/<int:pk>/matches/", TeamMatchesView.as_view(), name="team-matches"),
     path("teams/<int:pk>/follow/", TeamFollowView.as_view(), name="team-follow"),
@@ -42,6 +46,11 @@ urlpatterns = [
         name="public-profile",
     ),
     path("profile/<str:username>/", ProfileView.as_view(), name="profile"),
+    path(
+        "profile/<str:username>/bundle/",
+        ProfileBundleView.as_view(),
+        name="profile-bundle",
+    ),
     path("profile/<str:username>/teams/", ProfileTeamsView.as_view(), name="profile-teams"),
     path("profile/<str:username>/stats/", ProfileStatsView.as_view(), name="profile-stats"),
     path(
@@ -70,4 +79,5 @@ urlpatterns = [
         name="profile-memory-detail",
     ),
     path("search/", SearchView.as_view(), name="search"),
+    path("search/suggest/", SearchSuggestView.as_view(), name="search-suggest"),
 ]
@@ -1,31 +1,51 @@
-from collections import defaultdict
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import partial
+import json
 import re
-import unicodedata
-from typing import Optional
+import time
+from urllib.parse import urlencode
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Avg, Case, Count, Exists, F, FloatField, IntegerField, OuterRef, Prefetch, Q, Sum, Value, When
+from django.db.models import Case, Count, F, FloatField, Prefetch, Q, Sum, Value, When
 from django.db.models.functions import TruncDate
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.decorators import method_decorator
 from rest_framework import status
+from rest_framework.exceptions import ParseError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.serializers import UserMiniSerializer
+from core.services.blobs import BlobError, offload_data_url
+from core.services.versions import bump_versions
+from core.batch import keyed_batch_payload, parse_batch_ids
+from core.conditional import conditional_get
+from core.response_cache import cached_anonymous_response, response_cache_params
+from core.negotiation import get_payload_format
+from core.parallel import run_concurrently
+from core.streaming import get_stream_format, streaming_list_response
 from matches.models import Match, Rating, Team, Tournament
+from matches.fast_serializers import (
+    FastFeedMatchSerializer,
+    FastSearchMatchSerializer,
+    normalize_matches,
+)
 from matches.serializers import (
-    FeedMatchSerializer,
     LeagueSerializer,
-    SearchMatchSerializer,
+    RatingListSerializer,
+    RatingWithMatchSerializer,
     TeamDetailSerializer,
     TeamSerializer,
     TeamListSerializer,
+    TeamSummarySerializer,
 )
+from matches.services.head_to_head import get_head_to_head, pair_filter
+from matches.services.ratings import with_photo_summary
 from .models import Follow, UserFollow
 from .serializers import (
     FriendsFeedResponseSerializer,
@@ -37,14 +57,23 @@ from .serializers import (
     ProfileStatsResponseSerializer,
     PublicProfileRatingsResponseSerializer,
 )
+from .services.follow_state import annotate_team_follow_state, follow_state_context
+from .services.graph import get_social_graph
+from .services.popularity import POPULARITY_KINDS, POPULARITY_VERSION_SCOPE
+from .services.profile_stats import get_profile_aggregates, get_range_start
+from .services.rated_index import search_rated_ids
+from .services.search_analytics import record_search
+from .services.search_index import SEARCH_VERSION_SCOPE, search_ids
+from .services.search_results import cached_search_result
+from .services.suggest import SUGGEST_KINDS, suggest
+from .services.text import fold_text, squash_text
+from .services.stats import get_user_stats, user_stats_payload
 
 User = get_user_model()
 
 
 def _normalize_text(value: str) -> str:
-    normalized = unicodedata.normalize("NFKD", value.lower())
-    stripped = "".join(char for char in normalized if not unicodedata.combining(char))
-    return re.sub(r"[^a-z0-9\s]+", " ", stripped).strip()
+    return fold_text(value)
 
 
 def _tokenize_query(value: str):
@@ -79,22 +108,20 @@ def _minutes_weight_case():
     )
 
 
-def _rank_by_query(field: str, query: str):
-    return Case(
-        When(**{f"{field}__iexact": query}, then=Value(0)),
-        When(**{f"{field}__istartswith": query}, then=Value(1)),
-        default=Value(2),
-        output_field=IntegerField(),
-    )
+def _hydrate(queryset, ids):
+    # Keeps the index ranking; ids deleted since indexing are skipped.
+    found = queryset.in_bulk(ids)
+    return [found[item] for item in ids if item in found]
 
 
 class FeedView(APIView):
     permission_classes = [IsAuthenticated]
+    match_serializer_class = FastFeedMatchSerializer
 
     # Returns matches from followed teams with the user's rating if present.
     def get(self, request):
         user = request.user
-        team_ids = Follow.objects.filter(user=user).values_list("team_id", flat=True)
+        team_ids = get_social_graph(user.id).team_ids
 
         matches_qs = Match.objects.filter(
             Q(home_team_id__in=team_ids) | Q(away_team_id__in=team_ids)
@@ -108,12 +135,22 @@ class FeedView(APIView):
             rating_count=Count("ratings"),
         ).order_by("-date_time")
 
-        my_ratings = Rating.objects.filter(user=user)
+        my_ratings = Rating.objects.filter(user=user).select_related("user")
         matches_qs = matches_qs.prefetch_related(
             Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
         )
 
-        serializer = FeedMatchSerializer(matches_qs, many=True)
+        stream_format = get_stream_format(request)
+        if stream_format:
+            return streaming_list_response(
+                matches_qs, self.match_serializer_class, stream_format
+            )
+
+        if get_payload_format(request) == "normalized":
+            payload = normalize_matches(matches_qs)
+            return Response({"count": len(payload["results"]), **payload})
+
+        serializer = self.match_serializer_class(matches_qs, many=True)
         data = serializer.data
         return Response(
             {
@@ -128,9 +165,7 @@ class FriendsFeedView(APIView):
 
     # Returns activity from users the current user follows.
     def get(self, request):
-        following_ids = UserFollow.objects.filter(
-            follower=request.user
-        ).values_list("following_id", flat=True)
+        following_ids = get_social_graph(request.user.id).following_ids
 
         try:
             page = max(int(request.query_params.get("page", 1)), 1)
@@ -189,10 +224,8 @@ class TeamsView(APIView):
 
     # Returns the list of teams, marking the ones followed by the user.
     def get(self, request):
-        teams_qs = Team.objects.annotate(
-            is_following=Exists(
-                Follow.objects.filter(user=request.user, team=OuterRef("pk"))
-            )
+        teams_qs = annotate_team_follow_state(
+            Team.objects.all(), request.user
         ).order_by("name")
 
         serializer = TeamListSerializer(teams_qs, many=True)
@@ -207,38 +240,19 @@ class ProfileView(APIView):
     def get(self, request, username):
         profile_user = get_object_or_404(User, username=username)
 
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
-        )
+        ratings_qs = _profile_rating_list_qs(profile_user)
 
-        stats = ratings_qs.aggregate(
-            total_ratings=Count("id"),
-            avg_score=Avg("score"),
-        )
-        total_ratings = stats["total_ratings"] or 0
-        full_count = ratings_qs.filter(
-            minutes_watched=Rating.MinutesWatched.FULL
-        ).count()
-        fully_watched_pct = (
-            round((full_count / total_ratings) * 100, 2) if total_ratings else 0.0
-        )
+        stats = get_user_stats(profile_user.id)
 
         payload = {
             "user": profile_user,
-            "stats": {
-                "total_ratings": stats["total_ratings"] or 0,
-                "avg_score": float(stats["avg_score"] or 0),
-                "teams_followed": Follow.objects.filter(user=profile_user).count(),
-                "followers": UserFollow.objects.filter(following=profile_user).count(),
-                "following": UserFollow.objects.filter(follower=profile_user).count(),
-            },
+            "stats": user_stats_payload(stats),
             "recent_activity": ratings_qs.order_by("-created_at")[:10],
         }
 
-        serializer = ProfileResponseSerializer(payload)
+        serializer = ProfileResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
 
@@ -248,32 +262,76 @@ class ProfileTeamsView(APIView):
     # Returns teams followed by the profile user.
     def get(self, request, username):
         profile_user = get_object_or_404(User, username=username)
-        team_ids = Follow.objects.filter(user=profile_user).values_list(
-            "team_id", flat=True
-        )
+        team_ids = get_social_graph(profile_user.id).team_ids
         teams_qs = Team.objects.filter(id__in=team_ids).order_by("name")
         serializer = TeamSerializer(teams_qs, many=True)
         return Response({"count": teams_qs.count(), "results": serializer.data})
 
 
+def _profile_versions(request, username):
+    # Profile payloads embed match cards, so match and team edits count too.
+    keys = [("matches", None), ("teams", None)]
+    profile_id = (
+        User.objects.filter(username=username).values_list("id", flat=True).first()
+    )
+    if profile_id is not None:
+        keys.append(("user", profile_id))
+    if request.user.is_authenticated:
+        keys.append(("user", request.user.id))
+    return keys
+
+
+def _profile_stats_versions(request, username):
+    # Ranges are relative to today, so the date rotates the ETag.
+    return [*_profile_versions(request, username), ("day", timezone.localdate())]
+
+
+def _team_matches_versions(request, pk):
+    return [("matches", None), ("ratings", None), ("teams", None)]
+
+
+# Anonymous response-cache tags; see core.response_cache.
+def _team_matches_tags(request, pk):
+    return [("team", pk), ("teams", None), ("ratings", None)]
+
+
+def _team_detail_tags(request, pk):
+    return [("team", pk)]
+
+
+def _search_tags(request):
+    return [
+        ("users", None),
+        ("teams", None),
+        ("tournaments", None),
+        ("matches", None),
+        ("ratings", None),
+        *((POPULARITY_VERSION_SCOPE, kind) for kind in POPULARITY_KINDS),
+    ]
+
+
+def _bump_memory_versions(user_id, match_ids):
+    bump_versions(
+        [
+            ("ratings", None),
+            ("user", user_id),
+            *(("match", match_id) for match_id in match_ids),
+        ]
+    )
+
+
 class PublicProfileView(APIView):
     permission_classes = [AllowAny]
 
     # Returns public profile with stats and recent ratings list.
+    @method_decorator(conditional_get(_profile_versions))
+    @method_decorator(cached_anonymous_response(_profile_versions))
     def get(self, request, username):
         profile_user = get_object_or_404(User, username=username)
 
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
-        )
+        ratings_qs = _profile_rating_list_qs(profile_user)
 
-        stats = ratings_qs.aggregate(
-            total_ratings=Count("id"),
-            avg_score=Avg("score"),
-        )
+        stats = get_user_stats(profile_user.id)
 
         try:
             page = max(int(request.query_params.get("page", 1)), 1)
@@ -285,177 +343,168 @@ class PublicProfileView(APIView):
             page_size = 10
         page_size = min(page_size, 50)
 
-        total = ratings_qs.count()
+        total = stats.total_ratings
         start = (page - 1) * page_size
         end = start + page_size
         ratings_list = ratings_qs.order_by("-created_at")[start:end]
 
         is_following = False
         if request.user.is_authenticated:
-            is_following = UserFollow.objects.filter(
-                follower=request.user, following=profile_user
-            ).exists()
+            is_following = (
+                profile_user.id in get_social_graph(request.user.id).following_ids
+            )
 
         payload = {
             "user": profile_user,
             "is_following": is_following,
-            "stats": {
-                "total_ratings": total_ratings,
-                "avg_score": float(stats["avg_score"] or 0),
-                "teams_followed": Follow.objects.filter(user=profile_user).count(),
-                "followers": UserFollow.objects.filter(following=profile_user).count(),
-                "following": UserFollow.objects.filter(follower=profile_user).count(),
-                "fully_watched_pct": fully_watched_pct,
-            },
+            "stats": user_stats_payload(stats),
             "page": page,
             "page_size": page_size,
             "total": total,
             "ratings": ratings_list,
         }
 
-        serializer = PublicProfileRatingsResponseSerializer(payload)
+        serializer = PublicProfileRatingsResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
 
-# Maps range keys to a datetime lower bound.
-def _get_range_start(range_key: Optional[str]):
-    if not range_key:
-        return None
-    ranges = {
-        "week": 7,
-        "month": 30,
-        "year": 365,
-    }
-    days = ranges.get(range_key)
-    if not days:
+SPARSE_RATING_FIELDS = frozenset(RatingWithMatchSerializer.Meta.fields) | frozenset(
+    RatingListSerializer.Meta.fields
+)
+
+
+# Parses ?fields= into the rating field names kept in profile payloads.
+def _parse_sparse_fields(request):
+    raw = request.query_params.get("fields")
+    if not raw:
         return None
-    return timezone.now() - timedelta(days=days)
+    fields = {item.strip() for item in raw.split(",") if item.strip()}
+    unknown = sorted(fields - SPARSE_RATING_FIELDS)
+    if unknown:
+        raise ParseError(f"Unknown fields: {', '.join(unknown)}.")
+    return fields
+
+
+def _profile_ratings_qs(profile_user):
+    return Rating.objects.filter(user=profile_user).select_related(
+        "user",
+        "match",
+        "match__tournament",
+        "match__home_team",
+        "match__away_team",
+    )
 
 
-class ProfileStatsView(APIView):
-    permission_classes = [IsAuthenticated]
+def _profile_rating_list_qs(profile_user):
+    return with_photo_summary(_profile_ratings_qs(profile_user))
 
-    # Returns aggregated stats for the profile.
-    def get(self, request, username):
-        profile_user = get_object_or_404(User, username=username)
-        range_key = request.query_params.get("range", "month")
-        range_start = _get_range_start(range_key)
 
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
+def _ranged_ratings_qs(profile_user, range_key):
+    ratings_qs = _profile_rating_list_qs(profile_user)
+    range_start = get_range_start(range_key)
+    if range_start:
+        ratings_qs = ratings_qs.filter(created_at__gte=range_start)
+        if not get_profile_aggregates(profile_user.id, range_key).total_ratings:
+            ratings_qs = ratings_qs.none()
+    return ratings_qs
+
+
+def _memories_qs(profile_user):
+    return (
+        _profile_ratings_qs(profile_user)
+        .filter(featured_order__isnull=False)
+        .order_by("featured_order")
+    )
+
+
+# Builds the stats tab payload from cached aggregates and the stats row.
+def _profile_stats_payload(profile_user, range_key):
+    aggregates = get_profile_aggregates(profile_user.id, range_key)
+
+    team_map = Team.objects.in_bulk([team_id for team_id, _ in aggregates.top_teams])
+    total_team_mentions = aggregates.team_mentions
+    team_distribution = []
+    for team_id, count in aggregates.top_teams:
+        team = team_map.get(team_id)
+        label = team.name if team else "Unknown"
+        pct = (
+            round((count / total_team_mentions) * 100, 2)
+            if total_team_mentions
+            else 0.0
         )
-        if range_start:
-            ratings_qs = ratings_qs.filter(created_at__gte=range_start)
-
-        ratings = list(ratings_qs)
-        total_ratings = len(ratings)
-        total_score = sum(rating.score for rating in ratings)
-        avg_score = round(total_score / total_ratings, 2) if total_ratings else 0.0
-        full_count = sum(
-            1
-            for rating in ratings
-            if rating.minutes_watched == Rating.MinutesWatched.FULL
+        team_distribution.append(
+            {
+                "label": label,
+                "team": team,
+                "count": count,
+                "pct": pct,
+            }
         )
-        fully_watched_pct = (
-            round((full_count / total_ratings) * 100, 2) if total_ratings else 0.0
+    if aggregates.others_count:
+        pct = (
+            round((aggregates.others_count / total_team_mentions) * 100, 2)
+            if total_team_mentions
+            else 0.0
+        )
+        team_distribution.append(
+            {
+                "label": "Others",
+                "team": None,
+                "count": aggregates.others_count,
+                "pct": pct,
+            }
         )
 
-        team_counts = defaultdict(int)
-        league_counts = defaultdict(int)
-        for rating in ratings:
-            match = rating.match
-            if not match:
-                continue
-            if match.home_team_id:
-                team_counts[match.home_team_id] += 1
-            if match.away_team_id:
-                team_counts[match.away_team_id] += 1
-            if match.tournament_id:
-                league_counts[match.tournament_id] += 1
-
-        total_team_mentions = sum(team_counts.values())
-        team_map = {
-            team.id: team for team in Team.objects.filter(id__in=team_counts.keys())
-        }
-        sorted_teams = sorted(team_counts.items(), key=lambda item: item[1], reverse=True)
-        max_teams = 5
-        top_teams = sorted_teams[:max_teams]
-        others_count = sum(count for _, count in sorted_teams[max_teams:])
-        team_distribution = []
-        for team_id, count in top_teams:
-            team = team_map.get(team_id)
-            label = team.name if team else "Unknown"
-            pct = (
-                round((count / total_team_mentions) * 100, 2)
-                if total_team_mentions
-                else 0.0
-            )
-            team_distribution.append(
-                {
-                    "label": label,
-                    "team": team,
-                    "count": count,
-                    "pct": pct,
-                }
-            )
-        if others_count:
-            pct = (
-                round((others_count / total_team_mentions) * 100, 2)
-                if total_team_mentions
-                else 0.0
-            )
-            team_distribution.append(
-                {
-                    "label": "Others",
-                    "team": None,
-                    "count": others_count,
-                    "pct": pct,
-                }
-            )
-
-        total_league_mentions = sum(league_counts.values())
-        tournament_map = {
-            tournament.id: tournament
-            for tournament in Tournament.objects.filter(id__in=league_counts.keys())
-        }
-        sorted_leagues = sorted(
-            league_counts.items(), key=lambda item: item[1], reverse=True
+    total_league_mentions = aggregates.league_mentions
+    tournament_map = Tournament.objects.in_bulk(
+        [tournament_id for tournament_id, _ in aggregates.top_leagues]
+    )
+    league_top = []
+    for tournament_id, count in aggregates.top_leagues:
+        tournament = tournament_map.get(tournament_id)
+        if not tournament:
+            continue
+        pct = (
+            round((count / total_league_mentions) * 100, 2)
+            if total_league_mentions
+            else 0.0
+        )
+        league_top.append(
+            {
+                "tournament": tournament,
+                "count": count,
+                "pct": pct,
+            }
         )
-        league_top = []
-        for tournament_id, count in sorted_leagues[:5]:
-            tournament = tournament_map.get(tournament_id)
-            if not tournament:
-                continue
-            pct = (
-                round((count / total_league_mentions) * 100, 2)
-                if total_league_mentions
-                else 0.0
-            )
-            league_top.append(
-                {
-                    "tournament": tournament,
-                    "count": count,
-                    "pct": pct,
-                }
-            )
 
-        payload = {
-            "user": profile_user,
-            "range": range_key,
-            "stats": {
-                "total_ratings": total_ratings,
-                "avg_score": avg_score,
-                "teams_followed": Follow.objects.filter(user=profile_user).count(),
-                "followers": UserFollow.objects.filter(following=profile_user).count(),
-                "following": UserFollow.objects.filter(follower=profile_user).count(),
-                "fully_watched_pct": fully_watched_pct,
-            },
-            "team_distribution": team_distribution,
-            "league_top": league_top,
-        }
+    user_stats = get_user_stats(profile_user.id)
+    return {
+        "user": profile_user,
+        "range": range_key,
+        "stats": {
+            "total_ratings": aggregates.total_ratings,
+            "avg_score": aggregates.avg_score,
+            "teams_followed": user_stats.teams_followed,
+            "followers": user_stats.followers,
+            "following": user_stats.following,
+            "fully_watched_pct": aggregates.fully_watched_pct,
+        },
+        "team_distribution": team_distribution,
+        "league_top": league_top,
+    }
+
+
+class ProfileStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # Returns aggregated stats for the profile.
+    @method_decorator(conditional_get(_profile_stats_versions))
+    def get(self, request, username):
+        profile_user = get_object_or_404(User, username=username)
+        range_key = request.query_params.get("range", "month")
+        payload = _profile_stats_payload(profile_user, range_key)
         serializer = ProfileStatsResponseSerializer(payload)
         return Response(serializer.data)
 
@@ -467,23 +516,16 @@ class ProfileActivityView(APIView):
     def get(self, request, username):
         profile_user = get_object_or_404(User, username=username)
         range_key = request.query_params.get("range", "month")
-        range_start = _get_range_start(range_key)
-
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
-        )
-        if range_start:
-            ratings_qs = ratings_qs.filter(created_at__gte=range_start)
+        ratings_qs = _ranged_ratings_qs(profile_user, range_key)
 
         payload = {
             "user": profile_user,
             "range": range_key,
             "results": ratings_qs.order_by("-created_at")[:10],
         }
-        serializer = ProfileActivityResponseSerializer(payload)
+        serializer = ProfileActivityResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
 
@@ -494,16 +536,7 @@ class ProfileHighlightsView(APIView):
     def get(self, request, username):
         profile_user = get_object_or_404(User, username=username)
         range_key = request.query_params.get("range", "month")
-        range_start = _get_range_start(range_key)
-
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
-        )
-        if range_start:
-            ratings_qs = ratings_qs.filter(created_at__gte=range_start)
+        ratings_qs = _ranged_ratings_qs(profile_user, range_key)
 
         payload = {
             "user": profile_user,
@@ -511,32 +544,129 @@ class ProfileHighlightsView(APIView):
             "top_rated": ratings_qs.order_by("-score", "-created_at")[:5],
             "low_rated": ratings_qs.order_by("score", "-created_at")[:5],
         }
-        serializer = ProfileHighlightsResponseSerializer(payload)
+        serializer = ProfileHighlightsResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
 
-class ProfileMemoriesView(APIView):
+PROFILE_BUNDLE_SECTIONS = ("profile", "stats", "activity", "highlights", "memories", "teams")
+DEFAULT_PROFILE_BUNDLE_SECTIONS = ("stats", "activity", "highlights", "memories")
+
+
+class ProfileBundleView(APIView):
     permission_classes = [IsAuthenticated]
 
+    # Returns several profile sections from one user lookup.
     def get(self, request, username):
+        raw_sections = request.query_params.get("sections")
+        if raw_sections:
+            sections = []
+            for item in raw_sections.split(","):
+                item = item.strip()
+                if item and item not in sections:
+                    sections.append(item)
+            unknown = [item for item in sections if item not in PROFILE_BUNDLE_SECTIONS]
+            if unknown:
+                return Response(
+                    {"detail": f"Unknown sections: {', '.join(unknown)}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            sections = list(DEFAULT_PROFILE_BUNDLE_SECTIONS)
+        context = {"sparse_fields": _parse_sparse_fields(request)}
+
         profile_user = get_object_or_404(User, username=username)
-        ratings_qs = (
-            Rating.objects.filter(user=profile_user, featured_order__isnull=False)
-            .select_related(
-                "match",
-                "match__tournament",
-                "match__home_team",
-                "match__away_team",
+        range_key = request.query_params.get("range", "month")
+        is_all_range = get_range_start(range_key) is None
+
+        # Each section reads only the rows it shows; range=all shares the
+        # recent activity page between the profile and activity sections.
+        ranged_ratings = recent_ranged = None
+        if (
+            "activity" in sections
+            or "highlights" in sections
+            or ("profile" in sections and is_all_range)
+        ):
+            ranged_ratings = _ranged_ratings_qs(profile_user, range_key)
+        if "activity" in sections or ("profile" in sections and is_all_range):
+            recent_ranged = list(ranged_ratings.order_by("-created_at")[:10])
+
+        data = {
+            "user": UserMiniSerializer(profile_user).data,
+            "range": range_key,
+            "sections": sections,
+        }
+        if "profile" in sections:
+            recent = (
+                recent_ranged
+                if is_all_range
+                else _profile_rating_list_qs(profile_user).order_by("-created_at")[:10]
             )
-            .order_by("featured_order")
-        )
+            data["profile"] = ProfileResponseSerializer(
+                {
+                    "user": profile_user,
+                    "stats": user_stats_payload(get_user_stats(profile_user.id)),
+                    "recent_activity": recent,
+                },
+                context=context,
+            ).data
+        if "stats" in sections:
+            data["stats"] = ProfileStatsResponseSerializer(
+                _profile_stats_payload(profile_user, range_key)
+            ).data
+        if "activity" in sections:
+            data["activity"] = ProfileActivityResponseSerializer(
+                {
+                    "user": profile_user,
+                    "range": range_key,
+                    "results": recent_ranged,
+                },
+                context=context,
+            ).data
+        if "highlights" in sections:
+            data["highlights"] = ProfileHighlightsResponseSerializer(
+                {
+                    "user": profile_user,
+                    "range": range_key,
+                    "top_rated": ranged_ratings.order_by("-score", "-created_at")[:5],
+                    "low_rated": ranged_ratings.order_by("score", "-created_at")[:5],
+                },
+                context=context,
+            ).data
+        if "memories" in sections:
+            data["memories"] = ProfileMemoriesResponseSerializer(
+                {
+                    "user": profile_user,
+                    "max_count": 4,
+                    "results": _memories_qs(profile_user),
+                },
+                context=context,
+            ).data
+        if "teams" in sections:
+            team_ids = get_social_graph(profile_user.id).team_ids
+            teams = list(Team.objects.filter(id__in=team_ids).order_by("name"))
+            data["teams"] = {
+                "count": len(teams),
+                "results": TeamSerializer(teams, many=True).data,
+            }
+        return Response(data)
+
+
+class ProfileMemoriesView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, username):
+        profile_user = get_object_or_404(User, username=username)
 
         payload = {
             "user": profile_user,
             "max_count": 4,
-            "results": ratings_qs,
+            "results": _memories_qs(profile_user),
         }
-        serializer = ProfileMemoriesResponseSerializer(payload)
+        serializer = ProfileMemoriesResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
     def post(self, request, username):
@@ -657,6 +787,8 @@ class ProfileMemoriesView(APIView):
                     Rating.objects.filter(
                         user=profile_user, match_id=item
                     ).update(featured_order=index)
+            # Queryset updates skip the Rating signals.
+            _bump_memory_versions(profile_user.id, match_ids)
             return self.get(request, username)
 
         if match_id and str(match_id).isdigit():
@@ -692,6 +824,13 @@ class ProfileMemoriesView(APIView):
                         {"detail": "representative_photo_url must be a string."},
                         status=status.HTTP_400_BAD_REQUEST,
                     )
+                try:
+                    rep_url = offload_data_url(rep_url)
+                except BlobError as exc:
+                    return Response(
+                        {"detail": str(exc)},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
                 rating.representative_photo_url = rep_url
             if "featured_primary_image" in request.data:
                 primary = request.data.get("featured_primary_image")
@@ -725,9 +864,11 @@ class ProfileMemoryDetailView(APIView):
                 {"detail": "You cannot edit this profile."},
                 status=status.HTTP_403_FORBIDDEN,
             )
-        Rating.objects.filter(
+        updated = Rating.objects.filter(
             user=profile_user, match_id=match_id
         ).update(featured_order=None)
+        if updated:
+            _bump_memory_versions(profile_user.id, [match_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -742,47 +883,162 @@ class ProfileRatedMatchesView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
         query = (request.query_params.get("q") or "").strip()
-        ratings_qs = Rating.objects.filter(user=profile_user).select_related(
-            "match",
-            "match__tournament",
-            "match__home_team",
-            "match__away_team",
-        )
-        if query:
-            ratings_qs = ratings_qs.filter(
-                Q(match__home_team__name__icontains=query)
-                | Q(match__away_team__name__icontains=query)
-                | Q(match__tournament__name__icontains=query)
-            )
+        try:
+            page = max(int(request.query_params.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+        try:
+            page_size = max(int(request.query_params.get("page_size", 50)), 1)
+        except ValueError:
+            page_size = 50
+        page_size = min(page_size, 50)
 
+        # Filtered against the cached per-user index; only the page is loaded.
+        rating_ids = search_rated_ids(profile_user.id, query)
+        start = (page - 1) * page_size
         payload = {
             "user": profile_user,
-            "results": ratings_qs.order_by("-created_at")[:50],
+            "results": _hydrate(
+                _profile_rating_list_qs(profile_user), rating_ids[start : start + page_size]
+            ),
         }
-        serializer = ProfileRatedResponseSerializer(payload)
+        serializer = ProfileRatedResponseSerializer(
+            payload, context={"sparse_fields": _parse_sparse_fields(request)}
+        )
         return Response(serializer.data)
 
 
+# Teams considered per side of an "A vs B" query, best name matches first;
+# a side matching more is filtered by name through the team join instead.
+VS_TEAM_CANDIDATES = 20
+
+
+def _vs_candidates(side):
+    ids = search_ids("teams", " ".join(side))
+    return ids if len(ids) <= VS_TEAM_CANDIDATES else None
+
+
+def _vs_side_q(prefix, team_ids, side) -> Q:
+    if team_ids is not None:
+        return Q(**{f"{prefix}_id__in": team_ids})
+    query = Q()
+    for token in side:
+        query &= Q(**{f"{prefix}__name_normalized__contains": token})
+    return query
+
+
+def _vs_team(team_ids, side):
+    # Head-to-head needs the side to name one team: its only candidate, or
+    # the only candidate whose whole name is the side's text.
+    if not team_ids:
+        return None
+    if len(team_ids) == 1:
+        return team_ids[0]
+    exact = list(
+        Team.objects.filter(
+            pk__in=team_ids, name_normalized=squash_text(" ".join(side))
+        ).values_list("id", flat=True)[:2]
+    )
+    return exact[0] if len(exact) == 1 else None
+
+
+def _head_to_head_payload(team_id, opponent_id, matches):
+    teams = Team.objects.in_bulk([team_id, opponent_id])
+    return {
+        "team": TeamSummarySerializer(teams[team_id]).data,
+        "opponent": TeamSummarySerializer(teams[opponent_id]).data,
+        **get_head_to_head(team_id, opponent_id, matches),
+    }
+
+
+SEARCH_TYPES = ("users", "teams", "leagues", "matches")
+# Match ids kept per cached search; deeper pages query the database.
+SEARCH_CACHED_MATCH_IDS = 500
+
+
+@dataclass(frozen=True)
+class _SearchParams:
+    q: str
+    folded: str
+    tokens: list
+    vs_tokens: tuple | None
+    league_id: int | None
+    date_from: str | None
+    date_to: str | None
+    start: int
+    end: int
+
+
+def _filtered_matches(params):
+    matches_qs = Match.objects.all()
+    if params.league_id is not None:
+        matches_qs = matches_qs.filter(tournament_id=params.league_id)
+
+    parsed_from = (
+        parse_datetime(params.date_from) or parse_date(params.date_from)
+        if params.date_from
+        else None
+    )
+    parsed_to = (
+        parse_datetime(params.date_to) or parse_date(params.date_to)
+        if params.date_to
+        else None
+    )
+    if parsed_from:
+        if isinstance(parsed_from, date) and not isinstance(parsed_from, datetime):
+            matches_qs = matches_qs.filter(date_time__date__gte=parsed_from)
+        else:
+            matches_qs = matches_qs.filter(date_time__gte=parsed_from)
+    if parsed_to:
+        if isinstance(parsed_to, date) and not isinstance(parsed_to, datetime):
+            matches_qs = matches_qs.filter(date_time__date__lte=parsed_to)
+        else:
+            matches_qs = matches_qs.filter(date_time__lte=parsed_to)
+    return matches_qs
+
+
+def _search_types(request) -> set:
+    raw_types = request.query_params.get("types")
+    if not raw_types:
+        return set(SEARCH_TYPES)
+    types = {item.strip() for item in raw_types.split(",") if item.strip()}
+    return set(SEARCH_TYPES) if "all" in types else types
+
+
+def _record_cached_search(request, response, seconds):
+    # Cached searches skip the view, so they are logged from the cache hit
+    # with the stored total and no per-type timings.
+    q = (request.GET.get("q") or "").strip()
+    tokens = _tokenize_query(q)
+    if not tokens and not _split_vs_query(q):
+        return
+    total = json.loads(response.content).get("total", 0)
+    types = _search_types(request) & set(SEARCH_TYPES)
+    record_search(
+        " ".join(tokens),
+        {},
+        total,
+        seconds,
+        types=types,
+        request_params=urlencode(response_cache_params(request)),
+    )
+
+
 class SearchView(APIView):
     permission_classes = [AllowAny]
+    match_serializer_class = FastSearchMatchSerializer
 
     # Returns grouped search results for teams, leagues, and matches.
+    @method_decorator(
+        cached_anonymous_response(_search_tags, on_hit=_record_cached_search)
+    )
     def get(self, request):
         q = (request.query_params.get("q") or "").strip()
         if not q:
             return Response({"detail": "q is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        raw_types = request.query_params.get("types")
-        if raw_types:
-            types = {item.strip() for item in raw_types.split(",") if item.strip()}
-            if "all" in types:
-                types = {"users", "teams", "leagues", "matches"}
-        else:
-            types = {"users", "teams", "leagues", "matches"}
-
+        types = _search_types(request)
         league_id = request.query_params.get("league_id")
-        date_from = request.query_params.get("date_from")
-        date_to = request.query_params.get("date_to")
 
         try:
             page = max(int(request.query_params.get("page", 1)), 1)
@@ -794,8 +1050,10 @@ class SearchView(APIView):
             page_size = 20
         page_size = min(page_size, 50)
 
+        started = time.perf_counter()
         tokens = _tokenize_query(q)
         vs_tokens = _split_vs_query(q)
+        results = {kind: [] for kind in SEARCH_TYPES}
 
         if not tokens and not vs_tokens:
             return Response(
@@ -804,162 +1062,269 @@ class SearchView(APIView):
                     "page": page,
                     "page_size": page_size,
                     "total": 0,
-                    "results": {
-                        "users": [],
-                        "teams": [],
-                        "leagues": [],
-                        "matches": [],
-                    },
+                    "results": results,
                 }
             )
 
-        results = {"users": [], "teams": [], "leagues": [], "matches": []}
-        total = 0
-
-        if "users" in types:
-            users_qs = User.objects.all()
-            for token in tokens:
-                users_qs = users_qs.filter(username__icontains=token)
-            users_qs = users_qs.annotate(rank=_rank_by_query("username", q)).order_by(
-                "rank", "username"
-            )
-            total += users_qs.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            results["users"] = UserMiniSerializer(
-                users_qs[start:end], many=True
-            ).data
+        params = _SearchParams(
+            q=q,
+            folded=" ".join(tokens),
+            tokens=tokens,
+            vs_tokens=vs_tokens,
+            league_id=int(league_id) if league_id and str(league_id).isdigit() else None,
+            date_from=request.query_params.get("date_from"),
+            date_to=request.query_params.get("date_to"),
+            start=(page - 1) * page_size,
+            end=page * page_size,
+        )
+        searches = {
+            "users": self._search_users,
+            "teams": self._search_teams,
+            "leagues": self._search_leagues,
+            "matches": self._search_matches,
+        }
+        # Each type resolves ids (cached per normalized query) and hydrates
+        # its page independently, so they run side by side.
+        outcomes = run_concurrently(
+            {
+                kind: partial(search, request, params)
+                for kind, search in searches.items()
+                if kind in types
+            }
+        )
 
-        if "teams" in types:
-            teams_qs = Team.objects.all()
-            for token in tokens:
-                teams_qs = teams_qs.filter(name__icontains=token)
-            if league_id and str(league_id).isdigit():
-                teams_qs = teams_qs.filter(
-                    Q(home_matches__tournament_id=int(league_id))
-                    | Q(away_matches__tournament_id=int(league_id))
-                ).distinct()
-            teams_qs = teams_qs.annotate(rank=_rank_by_query("name", q)).order_by(
-                "rank", "name"
-            )
-            total += teams_qs.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            results["teams"] = TeamDetailSerializer(teams_qs[start:end], many=True).data
-
-        if "leagues" in types:
-            leagues_qs = Tournament.objects.all()
-            for token in tokens:
-                leagues_qs = leagues_qs.filter(
-                    Q(name__icontains=token) | Q(country__icontains=token)
-                )
-            leagues_qs = leagues_qs.annotate(rank=_rank_by_query("name", q)).order_by(
-                "rank", "name"
-            )
-            total += leagues_qs.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            results["leagues"] = LeagueSerializer(leagues_qs[start:end], many=True).data
-
-        if "matches" in types:
-            matches_qs = Match.objects.select_related(
-                "tournament",
-                "home_team",
-                "away_team",
+        total = 0
+        head_to_head = None
+        timings = []
+        per_type = {}
+        for kind, ((count, data, hit, extra), seconds) in outcomes.items():
+            total += count
+            results[kind] = data
+            if kind == "matches":
+                head_to_head = extra
+            timings.append(
+                f'{kind};dur={seconds * 1000:.1f};desc="{"hit" if hit else "miss"}"'
             )
-            if league_id and str(league_id).isdigit():
-                matches_qs = matches_qs.filter(tournament_id=int(league_id))
+            per_type[kind] = {"count": count, "ms": round(seconds * 1000, 2), "hit": hit}
 
-            parsed_from = (
-                parse_datetime(date_from) or parse_date(date_from)
-                if date_from
-                else None
-            )
-            parsed_to = (
-                parse_datetime(date_to) or parse_date(date_to) if date_to else None
-            )
-            if parsed_from:
-                if isinstance(parsed_from, date) and not isinstance(
-                    parsed_from, datetime
-                ):
-                    matches_qs = matches_qs.filter(date_time__date__gte=parsed_from)
-                else:
-                    matches_qs = matches_qs.filter(date_time__gte=parsed_from)
-            if parsed_to:
-                if isinstance(parsed_to, date) and not isinstance(parsed_to, datetime):
-                    matches_qs = matches_qs.filter(date_time__date__lte=parsed_to)
-                else:
-                    matches_qs = matches_qs.filter(date_time__lte=parsed_to)
-
-            if vs_tokens:
-                left_tokens, right_tokens = vs_tokens
-
-                def team_filter(prefix, items):
-                    query = Q()
-                    for token in items:
-                        query &= Q(**{f"{prefix}__name__icontains": token})
-                    return query
-
-                matches_qs = matches_qs.filter(
+        response = Response(
+            {
+                "q": q,
+                "page": page,
+                "page_size": page_size,
+                "total": total,
+                "results": results,
+                "head_to_head": head_to_head,
+            }
+        )
+        response["Server-Timing"] = ", ".join(timings)
+        record_search(
+            params.folded,
+            per_type,
+            total,
+            time.perf_counter() - started,
+            request_params=urlencode(response_cache_params(request)),
+        )
+        return response
+
+    def _search_users(self, request, params):
+        user_ids, hit = cached_search_result(
+            "users",
+            params.folded,
+            (),
+            [(SEARCH_VERSION_SCOPE, "users"), (POPULARITY_VERSION_SCOPE, "users")],
+            lambda: search_ids("users", params.q),
+        )
+        data = UserMiniSerializer(
+            _hydrate(User.objects.all(), user_ids[params.start : params.end]), many=True
+        ).data
+        return len(user_ids), data, hit, None
+
+    def _search_teams(self, request, params):
+        def resolve():
+            team_ids = search_ids("teams", params.q)
+            if params.league_id is not None:
+                league_team_ids = set()
+                for home_id, away_id in Match.objects.filter(
+                    tournament_id=params.league_id
+                ).values_list("home_team_id", "away_team_id"):
+                    league_team_ids.update((home_id, away_id))
+                team_ids = [item for item in team_ids if item in league_team_ids]
+            return team_ids
+
+        tags = [(SEARCH_VERSION_SCOPE, "teams"), (POPULARITY_VERSION_SCOPE, "teams")]
+        if params.league_id is not None:
+            tags.append(("matches", None))
+        team_ids, hit = cached_search_result(
+            "teams", params.folded, [("league", params.league_id)], tags, resolve
+        )
+        data = TeamDetailSerializer(
+            _hydrate(Team.objects.all(), team_ids[params.start : params.end]),
+            many=True,
+            context=follow_state_context(request),
+        ).data
+        return len(team_ids), data, hit, None
+
+    def _search_leagues(self, request, params):
+        league_ids, hit = cached_search_result(
+            "leagues",
+            params.folded,
+            (),
+            [(SEARCH_VERSION_SCOPE, "leagues"), (POPULARITY_VERSION_SCOPE, "leagues")],
+            lambda: search_ids("leagues", params.q),
+        )
+        data = LeagueSerializer(
+            _hydrate(Tournament.objects.all(), league_ids[params.start : params.end]),
+            many=True,
+        ).data
+        return len(league_ids), data, hit, None
+
+    def _search_matches(self, request, params):
+        matches_qs = _filtered_matches(params)
+        filtered = matches_qs
+        candidates = None
+        if params.vs_tokens:
+            # Each side usually resolves to a handful of team ids through the
+            # name index, so the match lookup is an indexed IN on both columns.
+            left, right = params.vs_tokens
+            candidates = (_vs_candidates(left), _vs_candidates(right))
+            left_ids, right_ids = candidates
+            if left_ids is not None and right_ids is not None:
+                filtered = filtered.filter(pair_filter(left_ids, right_ids))
+            else:
+                filtered = filtered.filter(
                     (
-                        team_filter("home_team", left_tokens)
-                        & team_filter("away_team", right_tokens)
+                        _vs_side_q("home_team", left_ids, left)
+                        & _vs_side_q("away_team", right_ids, right)
                     )
                     | (
-                        team_filter("home_team", right_tokens)
-                        & team_filter("away_team", left_tokens)
+                        _vs_side_q("home_team", right_ids, right)
+                        & _vs_side_q("away_team", left_ids, left)
                     )
                 )
-            else:
-                for token in tokens:
-                    matches_qs = matches_qs.filter(
-                        Q(home_team__name__icontains=token)
-                        | Q(away_team__name__icontains=token)
-                    )
-
-            matches_qs = matches_qs.annotate(
-                weighted_score_sum=Sum(F("ratings__score") * _minutes_weight_case()),
-                weight_sum=Sum(_minutes_weight_case()),
-                rating_count=Count("ratings"),
-            ).order_by("-date_time")
+        else:
+            for token in params.tokens:
+                filtered = filtered.filter(
+                    Q(home_team__name_normalized__contains=token)
+                    | Q(away_team__name_normalized__contains=token)
+                )
+        filtered = filtered.order_by("-date_time", "-id")
 
-            if request.user.is_authenticated:
-                my_ratings = Rating.objects.filter(user=request.user)
-                matches_qs = matches_qs.prefetch_related(
-                    Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
+        def resolve():
+            ids = list(
+                filtered.values_list("id", flat=True)[: SEARCH_CACHED_MATCH_IDS + 1]
+            )
+            pair = None
+            if candidates is not None:
+                pair = tuple(
+                    _vs_team(team_ids, side)
+                    for team_ids, side in zip(candidates, params.vs_tokens)
                 )
+                if None in pair or pair[0] == pair[1]:
+                    pair = None
+            return {
+                "ids": ids[:SEARCH_CACHED_MATCH_IDS],
+                "total": len(ids) if len(ids) <= SEARCH_CACHED_MATCH_IDS else filtered.count(),
+                "head_to_head": (
+                    _head_to_head_payload(*pair, matches_qs) if pair else None
+                ),
+            }
 
-            total += matches_qs.count()
-            start = (page - 1) * page_size
-            end = start + page_size
-            results["matches"] = SearchMatchSerializer(
-                matches_qs[start:end], many=True
-            ).data
+        found, hit = cached_search_result(
+            "matches",
+            params.folded,
+            [
+                ("league", params.league_id),
+                ("from", params.date_from),
+                ("to", params.date_to),
+            ],
+            [("matches", None), ("teams", None), (POPULARITY_VERSION_SCOPE, "teams")],
+            resolve,
+        )
+        if params.end <= len(found["ids"]) or found["total"] <= len(found["ids"]):
+            page_ids = found["ids"][params.start : params.end]
+        else:
+            page_ids = list(
+                filtered.values_list("id", flat=True)[params.start : params.end]
+            )
 
-        return Response(
-            {
-                "q": q,
-                "page": page,
-                "page_size": page_size,
-                "total": total,
-                "results": results,
-            }
+        page_qs = Match.objects.select_related(
+            "tournament",
+            "home_team",
+            "away_team",
+        ).annotate(
+            weighted_score_sum=Sum(F("ratings__score") * _minutes_weight_case()),
+            weight_sum=Sum(_minutes_weight_case()),
+            rating_count=Count("ratings"),
         )
+        if request.user.is_authenticated:
+            my_ratings = Rating.objects.filter(user=request.user)
+            page_qs = page_qs.prefetch_related(
+                Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
+            )
+        data = self.match_serializer_class(_hydrate(page_qs, page_ids), many=True).data
+        return found["total"], data, hit, found["head_to_head"]
+
+
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+
+
+class SearchSuggestView(APIView):
+    permission_classes = [AllowAny]
+
+    # Returns prefix suggestions for teams, leagues and users, popular first.
+    def get(self, request):
+        q = (request.query_params.get("q") or "").strip()
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_DEFAULT_LIMIT))
+        except ValueError:
+            limit = SUGGEST_DEFAULT_LIMIT
+        limit = min(max(limit, 1), SUGGEST_MAX_LIMIT)
+
+        kinds = None
+        raw_types = request.query_params.get("types")
+        if raw_types:
+            kinds = {item.strip() for item in raw_types.split(",")} & set(SUGGEST_KINDS)
+
+        results = suggest(q, limit, kinds) if q else []
+        return Response({"q": q, "results": results})
 
 
 class TeamDetailView(APIView):
     permission_classes = [AllowAny]
 
     # Returns team details.
+    @method_decorator(cached_anonymous_response(_team_detail_tags))
     def get(self, request, pk):
         team = get_object_or_404(Team, pk=pk)
-        return Response(TeamDetailSerializer(team, context={"request": request}).data)
+        return Response(
+            TeamDetailSerializer(team, context=follow_state_context(request)).data
+        )
+
+
+class TeamBatchView(APIView):
+    permission_classes = [AllowAny]
+
+    # Returns team details keyed by id, with null for unknown ids.
+    def get(self, request):
+        ids = parse_batch_ids(request)
+        serializer = TeamDetailSerializer(
+            Team.objects.filter(id__in=ids),
+            many=True,
+            context=follow_state_context(request),
+        )
+        found = {item["id"]: item for item in serializer.data}
+        return Response(keyed_batch_payload(ids, found))
 
 
 class TeamMatchesView(APIView):
     permission_classes = [AllowAny]
+    match_serializer_class = FastFeedMatchSerializer
 
     # Returns team matches with optional scope filtering.
+    @method_decorator(conditional_get(_team_matches_versions))
+    @method_decorator(cached_anonymous_response(_team_matches_tags))
     def get(self, request, pk):
         team = get_object_or_404(Team, pk=pk)
         scope = request.query_params.get("scope", "all")
@@ -992,7 +1357,9 @@ class TeamMatchesView(APIView):
         end = start + page_size
 
         if request.user.is_authenticated:
-            my_ratings = Rating.objects.filter(user=request.user)
+            my_ratings = Rating.objects.filter(user=request.user).select_related(
+                "user"
+            )
             base_qs = base_qs.prefetch_related(
                 Prefetch("ratings", queryset=my_ratings, to_attr="my_rating_list")
             )
@@ -1028,7 +1395,17 @@ class TeamMatchesView(APIView):
                 past_end = max(0, end - upcoming_count)
                 results.extend(list(past_qs[past_start:past_end]))
 
-        serializer = FeedMatchSerializer(results, many=True)
+        if get_payload_format(request) == "normalized":
+            return Response(
+                {
+                    "page": page,
+                    "page_size": page_size,
+                    "total": total,
+                    **normalize_matches(results),
+                }
+            )
+
+        serializer = self.match_serializer_class(results, many=True)
         return Response(
             {
                 "page": page,
@@ -1087,11 +1464,12 @@ class UserFollowByUsernameView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         UserFollow.objects.get_or_create(follower=request.user, following=target)
+        graph = get_social_graph(target.id)
         return Response(
             {
                 "is_following": True,
-                "followers": UserFollow.objects.filter(following=target).count(),
-                "following": UserFollow.objects.filter(follower=target).count(),
+                "followers": graph.followers_count,
+                "following": graph.following_count,
             },
             status=status.HTTP_200_OK,
         )
@@ -1105,11 +1483,12 @@ class UserFollowByUsernameView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         UserFollow.objects.filter(follower=request.user, following=target).delete()
+        graph = get_social_graph(target.id)
         return Response(
             {
                 "is_following": False,
-                "followers": UserFollow.objects.filter(following=target).count(),
-                "following": UserFollow.objects.filter(follower=target).count(),
+                "followers": graph.followers_count,
+                "following": graph.following_count,
             },
             status=status.HTTP_200_OK,
         )
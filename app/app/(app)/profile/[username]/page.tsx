@@ -7,10 +7,8 @@ import { useLanguage } from '@/app/components/i18n/LanguageProvider';
 import {
   ApiError,
   fetchMe,
-  fetchProfileActivity,
+  fetchProfileBundle,
   fetchProfileFollowedTeams,
-  fetchProfileHighlights,
-  fetchProfileStats,
 } from '@/app/lib/api';
 import SkeletonBlock from '@/app/components/ui/SkeletonBlock';
 import StateEmpty from '@/app/components/ui/StateEmpty';
@@ -440,16 +438,6 @@ export default function Page() {
     { value: 'year', label: t('profile.range.year') },
   ];
 
-  // Updates the loading flag for a specific tab.
-  const setTabLoading = (tab: TabKey, value: boolean) => {
-    setLoading((prev) => ({ ...prev, [tab]: value }));
-  };
-
-  // Updates the error message for a specific tab.
-  const setTabError = (tab: TabKey, value: ErrorState | null) => {
-    setErrors((prev) => ({ ...prev, [tab]: value }));
-  };
-
   const resolveError = (err: unknown): ErrorState => {
     if (err instanceof ApiError && err.status === 401) {
       return {
@@ -463,45 +451,24 @@ export default function Page() {
     };
   };
 
-  // Loads the stats tab content.
-  const loadStats = async (targetUsername: string, rangeKey: RangeKey) => {
-    setTabLoading('stats', true);
-    setTabError('stats', null);
-    try {
-      const response = await fetchProfileStats(targetUsername, rangeKey);
-      setStatsData(response);
-    } catch (err) {
-      setTabError('stats', resolveError(err));
-    } finally {
-      setTabLoading('stats', false);
-    }
-  };
-
-  // Loads the activity tab content.
-  const loadActivity = async (targetUsername: string, rangeKey: RangeKey) => {
-    setTabLoading('activity', true);
-    setTabError('activity', null);
-    try {
-      const response = await fetchProfileActivity(targetUsername, rangeKey);
-      setActivityData(response);
-    } catch (err) {
-      setTabError('activity', resolveError(err));
-    } finally {
-      setTabLoading('activity', false);
-    }
-  };
-
-  // Loads the highlights tab content.
-  const loadHighlights = async (targetUsername: string, rangeKey: RangeKey) => {
-    setTabLoading('highlights', true);
-    setTabError('highlights', null);
+  // Loads stats, activity and highlights together from the bundle endpoint.
+  const loadBundle = async (targetUsername: string, rangeKey: RangeKey) => {
+    setLoading({ stats: true, activity: true, highlights: true });
+    setErrors({ stats: null, activity: null, highlights: null });
     try {
-      const response = await fetchProfileHighlights(targetUsername, rangeKey);
-      setHighlightsData(response);
+      const response = await fetchProfileBundle(targetUsername, rangeKey, [
+        'stats',
+        'activity',
+        'highlights',
+      ]);
+      setStatsData(response.stats ?? null);
+      setActivityData(response.activity ?? null);
+      setHighlightsData(response.highlights ?? null);
     } catch (err) {
-      setTabError('highlights', resolveError(err));
+      const error = resolveError(err);
+      setErrors({ stats: error, activity: error, highlights: error });
     } finally {
-      setTabLoading('highlights', false);
+      setLoading({ stats: false, activity: false, highlights: false });
     }
   };
 
@@ -539,7 +506,7 @@ export default function Page() {
         statsData.user.username !== username ||
         statsData.range !== range
       ) {
-        loadStats(username, range);
+        loadBundle(username, range);
       }
       return;
     }
@@ -553,7 +520,7 @@ export default function Page() {
         activityData.user.username !== username ||
         activityData.range !== range
       ) {
-        loadActivity(username, range);
+        loadBundle(username, range);
       }
       return;
     }
@@ -567,7 +534,7 @@ export default function Page() {
         highlightsData.user.username !== username ||
         highlightsData.range !== range
       ) {
-        loadHighlights(username, range);
+        loadBundle(username, range);
       }
     }
   };
@@ -582,28 +549,12 @@ export default function Page() {
     setRange(value as RangeKey);
   };
 
-  // Retries loading stats for the current profile.
-  const handleStatsRetry = () => {
-    if (!username) {
-      return;
-    }
-    loadStats(username, range);
-  };
-
-  // Retries loading activity for the current profile.
-  const handleActivityRetry = () => {
-    if (!username) {
-      return;
-    }
-    loadActivity(username, range);
-  };
-
-  // Retries loading highlights for the current profile.
-  const handleHighlightsRetry = () => {
+  // Retries loading the tab bundle for the current profile.
+  const handleBundleRetry = () => {
     if (!username) {
       return;
     }
-    loadHighlights(username, range);
+    loadBundle(username, range);
   };
 
   const handleLogin = () => {
@@ -841,7 +792,7 @@ export default function Page() {
           data={statsData}
           loading={loading.stats}
           error={errors.stats}
-          onRetry={handleStatsRetry}
+          onRetry={handleBundleRetry}
           onLogin={handleLogin}
         />
       )}
@@ -851,7 +802,7 @@ export default function Page() {
           data={activityData}
           loading={loading.activity}
           error={errors.activity}
-          onRetry={handleActivityRetry}
+          onRetry={handleBundleRetry}
           onLogin={handleLogin}
           onExplore={handleExplore}
         />
@@ -862,7 +813,7 @@ export default function Page() {
           data={highlightsData}
           loading={loading.highlights}
           error={errors.highlights}
-          onRetry={handleHighlightsRetry}
+          onRetry={handleBundleRetry}
           onLogin={handleLogin}
         />
       )}
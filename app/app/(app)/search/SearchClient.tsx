@@ -274,6 +274,30 @@ export default function SearchClient() {
               />
             )}
 
+          {(tab === 'all' || tab === 'matches') &&
+            data.head_to_head &&
+            data.head_to_head.played > 0 && (
+              <section className="space-y-4">
+                <h2 className="text-lg font-semibold">{t('search.page.h2h.title')}</h2>
+                <div className="flex items-center justify-between rounded-2xl border border-slate-800 bg-slate-900/60 p-4">
+                  <p className="text-base font-semibold text-white">
+                    {data.head_to_head.team.name} {data.head_to_head.team_wins}
+                  </p>
+                  <p className="text-xs uppercase tracking-[0.2em] text-slate-500">
+                    {t('search.page.h2h.record', {
+                      played: data.head_to_head.played,
+                      draws: data.head_to_head.draws,
+                      teamGoals: data.head_to_head.team_goals,
+                      opponentGoals: data.head_to_head.opponent_goals,
+                    })}
+                  </p>
+                  <p className="text-base font-semibold text-white">
+                    {data.head_to_head.opponent_wins} {data.head_to_head.opponent.name}
+                  </p>
+                </div>
+              </section>
+            )}
+
           {(tab === 'all' || tab === 'matches') &&
             data.results.matches.length > 0 && (
               <SearchSection
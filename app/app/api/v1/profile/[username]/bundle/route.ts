@@ -0,0 +1,87 @@
+import { NextResponse } from 'next/server';
+import type { NextRequest } from 'next/server';
+
+import {
+  getAuthUser,
+  getDemoStore,
+  toUserMini,
+  unauthorized,
+} from '../../../_demo';
+import { GET as getActivity } from '../activity/route';
+import { GET as getHighlights } from '../highlights/route';
+import { GET as getMemories } from '../memories/route';
+import { GET as getProfile } from '../route';
+import { GET as getStats } from '../stats/route';
+import { GET as getTeams } from '../teams/route';
+
+type RouteContext<T> = {
+  params: Promise<T>;
+};
+
+const SECTION_HANDLERS = {
+  profile: getProfile,
+  stats: getStats,
+  activity: getActivity,
+  highlights: getHighlights,
+  memories: getMemories,
+  teams: getTeams,
+};
+
+type SectionKey = keyof typeof SECTION_HANDLERS;
+
+const DEFAULT_SECTIONS: SectionKey[] = [
+  'stats',
+  'activity',
+  'highlights',
+  'memories',
+];
+
+// Returns several profile sections composed from the per-section demo routes.
+export async function GET(
+  request: NextRequest,
+  context: RouteContext<{ username: string }>,
+) {
+  const store = getDemoStore();
+  const user = getAuthUser(request);
+  if (!user) {
+    return unauthorized();
+  }
+
+  const { username } = await context.params;
+  const profileUser = store.users.find((item) => item.username === username);
+  if (!profileUser) {
+    return NextResponse.json({ detail: 'User not found.' }, { status: 404 });
+  }
+
+  const url = new URL(request.url);
+  const range = url.searchParams.get('range') ?? 'month';
+  const rawSections = url.searchParams.get('sections');
+  const sections = rawSections
+    ? Array.from(
+        new Set(
+          rawSections
+            .split(',')
+            .map((item) => item.trim())
+            .filter(Boolean),
+        ),
+      )
+    : DEFAULT_SECTIONS;
+  const unknown = sections.filter((item) => !(item in SECTION_HANDLERS));
+  if (unknown.length) {
+    return NextResponse.json(
+      { detail: `Unknown sections: ${unknown.join(', ')}.` },
+      { status: 400 },
+    );
+  }
+
+  const payload: Record<string, unknown> = {
+    user: toUserMini(profileUser),
+    range,
+    sections,
+  };
+  for (const section of sections as SectionKey[]) {
+    const response = await SECTION_HANDLERS[section](request, context);
+    payload[section] = await response.json();
+  }
+  return NextResponse.json(payload);
+}
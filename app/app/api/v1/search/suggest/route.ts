@@ -0,0 +1,115 @@
+import { NextResponse } from 'next/server';
+
+import { getDemoStore } from '../../_demo';
+
+const FOLLOW_WEIGHT = 5;
+
+const normalizeText = (value: string) =>
+  value
+    .toLowerCase()
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .replace(/[^a-z0-9\s]+/g, ' ')
+    .split(/\s+/)
+    .filter(Boolean)
+    .join(' ');
+
+type Candidate = {
+  type: 'user' | 'team' | 'league';
+  id: number;
+  name: string;
+  hint: string | null;
+  popularity: number;
+};
+
+// Matches the start of any word; name starts rank first, then popularity.
+const matchRank = (name: string, prefix: string) => {
+  const folded = normalizeText(name);
+  if (folded.startsWith(prefix)) {
+    return 0;
+  }
+  return ` ${folded}`.includes(` ${prefix}`) ? 1 : null;
+};
+
+const countBy = <T>(items: T[], key: (item: T) => number) => {
+  const counts = new Map<number, number>();
+  items.forEach((item) => counts.set(key(item), (counts.get(key(item)) ?? 0) + 1));
+  return counts;
+};
+
+export async function GET(request: Request) {
+  const store = getDemoStore();
+  const url = new URL(request.url);
+  const q = url.searchParams.get('q')?.trim() ?? '';
+  const limit = Math.min(
+    Math.max(Number(url.searchParams.get('limit') ?? 8) || 8, 1),
+    20,
+  );
+  const prefix = normalizeText(q);
+  if (!prefix) {
+    return NextResponse.json({ q, results: [] });
+  }
+
+  const matchById = new Map(store.matches.map((match) => [match.id, match]));
+  const teamRatings = new Map<number, number>();
+  const leagueRatings = new Map<number, number>();
+  store.ratings.forEach((rating) => {
+    const match = matchById.get(rating.matchId);
+    if (!match) {
+      return;
+    }
+    [match.homeTeamId, match.awayTeamId].forEach((teamId) =>
+      teamRatings.set(teamId, (teamRatings.get(teamId) ?? 0) + 1),
+    );
+    leagueRatings.set(match.tournamentId, (leagueRatings.get(match.tournamentId) ?? 0) + 1);
+  });
+  const teamFollows = countBy(store.teamFollows, (item) => item.teamId);
+  const userFollowers = countBy(store.userFollows, (item) => item.followingId);
+  const userRatings = countBy(store.ratings, (item) => item.userId);
+
+  const candidates: Candidate[] = [
+    ...store.teams.map((team) => ({
+      type: 'team' as const,
+      id: team.id,
+      name: team.name,
+      hint: team.country || null,
+      popularity:
+        (teamFollows.get(team.id) ?? 0) * FOLLOW_WEIGHT + (teamRatings.get(team.id) ?? 0),
+    })),
+    ...store.tournaments.map((league) => ({
+      type: 'league' as const,
+      id: league.id,
+      name: league.name,
+      hint: league.country || null,
+      popularity: leagueRatings.get(league.id) ?? 0,
+    })),
+    ...store.users.map((user) => ({
+      type: 'user' as const,
+      id: user.id,
+      name: user.username,
+      hint: null,
+      popularity:
+        (userFollowers.get(user.id) ?? 0) * FOLLOW_WEIGHT + (userRatings.get(user.id) ?? 0),
+    })),
+  ];
+
+  const results = candidates
+    .map((candidate) => ({ candidate, rank: matchRank(candidate.name, prefix) }))
+    .filter((item): item is { candidate: Candidate; rank: number } => item.rank !== null)
+    .sort(
+      (a, b) =>
+        a.rank - b.rank ||
+        b.candidate.popularity - a.candidate.popularity ||
+        a.candidate.name.length - b.candidate.name.length ||
+        a.candidate.name.localeCompare(b.candidate.name),
+    )
+    .slice(0, limit)
+    .map(({ candidate }) => ({
+      type: candidate.type,
+      id: candidate.id,
+      name: candidate.name,
+      hint: candidate.hint,
+    }));
+
+  return NextResponse.json({ q, results });
+}
@@ -4,14 +4,11 @@ import { useEffect, useMemo, useRef, useState, type KeyboardEvent } from 'react'
 import { useRouter } from 'next/navigation';
 
 import { useLanguage } from '@/app/components/i18n/LanguageProvider';
-import { fetchSearch } from '@/app/lib/api';
-import { getLocale } from '@/app/lib/i18n';
+import { fetchSearchSuggest } from '@/app/lib/api';
 import type {
-  MatchResult,
-  SearchResponse,
-  Team,
-  League,
-  UserMini,
+  SearchSuggestResponse,
+  SearchSuggestion,
+  SearchSuggestionType,
 } from '@/app/lib/types';
 
 type SearchItem = {
@@ -21,17 +18,23 @@ type SearchItem = {
   href: string;
 };
 
-const buildMatchLabel = (match: MatchResult) =>
-  `${match.home.name} vs ${match.away.name}`;
-
-const buildMatchHint = (match: MatchResult, locale: string) =>
-  `${match.league.name} · ${new Date(match.kickoff_at).toLocaleDateString(
-    locale,
-    {
-      month: 'short',
-      day: 'numeric',
-    },
-  )}`;
+const SUGGESTION_TYPES: SearchSuggestionType[] = ['user', 'team', 'league'];
+
+const GROUP_TITLES = {
+  user: 'search.group.users',
+  team: 'search.group.teams',
+  league: 'search.group.leagues',
+} as const;
+
+const suggestionHref = (item: SearchSuggestion) => {
+  if (item.type === 'user') {
+    return `/u/${item.name}`;
+  }
+  if (item.type === 'team') {
+    return `/teams/${item.id}`;
+  }
+  return `/matches?tournament=${item.id}`;
+};
 
 // Global search input with grouped typeahead results.
 export default function GlobalSearch({
@@ -40,14 +43,13 @@ export default function GlobalSearch({
   autoFocus?: boolean;
 }) {
   const router = useRouter();
-  const { t, language } = useLanguage();
-  const locale = getLocale(language);
+  const { t } = useLanguage();
   const containerRef = useRef<HTMLDivElement | null>(null);
   const [query, setQuery] = useState('');
   const [open, setOpen] = useState(false);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
-  const [results, setResults] = useState<SearchResponse | null>(null);
+  const [results, setResults] = useState<SearchSuggestResponse | null>(null);
   const [activeIndex, setActiveIndex] = useState(0);
 
   useEffect(() => {
@@ -65,7 +67,8 @@ export default function GlobalSearch({
 
     const handle = window.setTimeout(async () => {
       try {
-        const response = await fetchSearch({ q: query, page_size: 5, page: 1 });
+        // Typeahead uses the prefix index; full results live on /search.
+        const response = await fetchSearchSuggest(query);
         setResults(response);
       } catch (err) {
         setError(err instanceof Error ? err.message : t('search.error'));
@@ -73,7 +76,7 @@ export default function GlobalSearch({
         setLoading(false);
         setActiveIndex(0);
       }
-    }, 250);
+    }, 120);
 
     return () => {
       window.clearTimeout(handle);
@@ -93,45 +96,26 @@ export default function GlobalSearch({
     return () => window.removeEventListener('mousedown', handleClick);
   }, []);
 
-  const items = useMemo(() => {
-    if (!results) {
-      return [] as SearchItem[];
-    }
-    const list: SearchItem[] = [];
-    results.results.users.forEach((user: UserMini) => {
-      list.push({
-        id: `user-${user.id}`,
-        label: `@${user.username}`,
-        hint: t('search.hint.user'),
-        href: `/u/${user.username}`,
-      });
-    });
-    results.results.teams.forEach((team: Team) => {
-      list.push({
-        id: `team-${team.id}`,
-        label: team.name,
-        hint: team.country,
-        href: `/teams/${team.id}`,
-      });
-    });
-    results.results.leagues.forEach((league: League) => {
+  // Suggestions come ranked by popularity; keep that order within each group.
+  const groups = useMemo(() => {
+    const byType = new Map<SearchSuggestionType, SearchItem[]>();
+    results?.results.forEach((item) => {
+      const list = byType.get(item.type) ?? [];
       list.push({
-        id: `league-${league.id}`,
-        label: league.name,
-        hint: league.country,
-        href: `/matches?tournament=${league.id}`,
+        id: `${item.type}-${item.id}`,
+        label: item.type === 'user' ? `@${item.name}` : item.name,
+        hint: item.type === 'user' ? t('search.hint.profile') : item.hint ?? undefined,
+        href: suggestionHref(item),
       });
+      byType.set(item.type, list);
     });
-    results.results.matches.forEach((match: MatchResult) => {
-      list.push({
-        id: `match-${match.id}`,
-        label: buildMatchLabel(match),
-        hint: buildMatchHint(match, locale),
-        href: `/matches/${match.id}`,
-      });
-    });
-    return list;
-  }, [locale, results, t]);
+    return SUGGESTION_TYPES.filter((type) => byType.has(type)).map((type) => ({
+      type,
+      items: byType.get(type) ?? [],
+    }));
+  }, [results, t]);
+
+  const items = useMemo(() => groups.flatMap((group) => group.items), [groups]);
 
   const handleKeyDown = (event: KeyboardEvent<HTMLInputElement>) => {
     if (!open || items.length === 0) {
@@ -194,70 +178,18 @@ export default function GlobalSearch({
 
           {!loading && !error && results && items.length > 0 && (
             <div className="space-y-4">
-              {results.results.users.length > 0 && (
+              {groups.map((group) => (
                 <SearchGroup
-                  title={t('search.group.users')}
-                  items={results.results.users.map((user) => ({
-                    id: `user-${user.id}`,
-                    label: `@${user.username}`,
-                    hint: t('search.hint.profile'),
-                    href: `/u/${user.username}`,
-                  }))}
+                  key={group.type}
+                  title={t(GROUP_TITLES[group.type])}
+                  items={group.items}
                   activeId={items[activeIndex]?.id}
                   onSelect={(href) => {
                     setOpen(false);
                     router.push(href);
                   }}
                 />
-              )}
-              {results.results.teams.length > 0 && (
-                <SearchGroup
-                  title={t('search.group.teams')}
-                  items={results.results.teams.map((team) => ({
-                    id: `team-${team.id}`,
-                    label: team.name,
-                    hint: team.country,
-                    href: `/teams/${team.id}`,
-                  }))}
-                  activeId={items[activeIndex]?.id}
-                  onSelect={(href) => {
-                    setOpen(false);
-                    router.push(href);
-                  }}
-                />
-              )}
-              {results.results.leagues.length > 0 && (
-                <SearchGroup
-                  title={t('search.group.leagues')}
-                  items={results.results.leagues.map((league) => ({
-                    id: `league-${league.id}`,
-                    label: league.name,
-                    hint: league.country,
-                    href: `/matches?tournament=${league.id}`,
-                  }))}
-                  activeId={items[activeIndex]?.id}
-                  onSelect={(href) => {
-                    setOpen(false);
-                    router.push(href);
-                  }}
-                />
-              )}
-              {results.results.matches.length > 0 && (
-                <SearchGroup
-                  title={t('search.group.matches')}
-                  items={results.results.matches.map((match) => ({
-                    id: `match-${match.id}`,
-                    label: buildMatchLabel(match),
-                    hint: buildMatchHint(match, locale),
-                    href: `/matches/${match.id}`,
-                  }))}
-                  activeId={items[activeIndex]?.id}
-                  onSelect={(href) => {
-                    setOpen(false);
-                    router.push(href);
-                  }}
-                />
-              )}
+              ))}
               <button
                 className="w-full rounded-full border border-slate-700/80 px-4 py-2 text-xs font-semibold uppercase tracking-[0.2em] text-slate-200 transition hover:border-slate-500"
                 type="button"
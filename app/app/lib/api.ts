@@ -1,23 +1,30 @@
 // API helper: typed fetch wrapper with token auth, error handling, and core endpoints.
 import type {
+  BatchResponse,
   FeedResponse,
   FeaturedPrimaryImage,
   FollowStateResponse,
   FriendsFeedResponse,
+  Match,
   MatchDetailResponse,
+  NormalizedFeedResponse,
   PublicProfileRatingsResponse,
   ProfileActivityResponse,
+  ProfileBundleResponse,
+  ProfileBundleSection,
   ProfileHighlightsResponse,
   ProfileMemoriesResponse,
   ProfileResponse,
   ProfileRatedResponse,
   ProfileStatsResponse,
   SearchResponse,
+  SearchSuggestResponse,
   Team,
   TeamMatchesResponse,
   TeamsResponse,
   UserMini,
 } from './types';
+import { toFeedResponse } from './normalized';
 
 const DEMO_MODE = process.env.NEXT_PUBLIC_DEMO_MODE === 'true';
 const API_BASE_URL = DEMO_MODE
@@ -216,9 +223,12 @@ export function register(username: string, email: string, password: string) {
 
 // Feed endpoint for matches from followed teams.
 export function fetchFeed() {
-  return authRequest<FeedResponse>('/feed', {
-    method: 'GET',
-  });
+  return authRequest<FeedResponse | NormalizedFeedResponse>(
+    '/feed?format=normalized',
+    {
+      method: 'GET',
+    },
+  ).then(toFeedResponse);
 }
 
 // Friends activity feed endpoint.
@@ -256,11 +266,25 @@ export function fetchMatches(filters: MatchesQuery = {}) {
   if (filters.search) {
     params.set('search', filters.search);
   }
-  const query = params.toString();
-  const path = query ? `/matches?${query}` : '/matches';
-  return authRequest<FeedResponse>(path, {
-    method: 'GET',
-  });
+  params.set('format', 'normalized');
+  return authRequest<FeedResponse | NormalizedFeedResponse>(
+    `/matches?${params.toString()}`,
+    {
+      method: 'GET',
+    },
+  ).then(toFeedResponse);
+}
+
+// Match multi-get endpoint (list-shaped matches keyed by id).
+export function fetchMatchesBatch(ids: number[]) {
+  const params = new URLSearchParams();
+  params.set('ids', ids.join(','));
+  return authRequest<BatchResponse<Match>>(
+    `/matches/batch?${params.toString()}`,
+    {
+      method: 'GET',
+    },
+  );
 }
 
 // Match detail endpoint with stats and reviews.
@@ -329,6 +353,23 @@ export function fetchProfileHighlights(username: string, range: string) {
   );
 }
 
+// Profile bundle endpoint: several profile sections in one request.
+export function fetchProfileBundle(
+  username: string,
+  range: string,
+  sections: ProfileBundleSection[],
+) {
+  const params = new URLSearchParams();
+  params.set('range', range);
+  params.set('sections', sections.join(','));
+  return authRequest<ProfileBundleResponse>(
+    `/profile/${username}/bundle?${params.toString()}`,
+    {
+      method: 'GET',
+    },
+  );
+}
+
 // Profile memories (Mis partidos) endpoint.
 export function fetchProfileMemories(username: string) {
   return authRequest<ProfileMemoriesResponse>(`/profile/${username}/memories`, {
@@ -391,6 +432,14 @@ export function fetchSearch(query: SearchQuery) {
   });
 }
 
+// Prefix autocomplete for users, teams, and leagues (popular first).
+export function fetchSearchSuggest(q: string, limit = 8) {
+  const params = new URLSearchParams({ q, limit: String(limit) });
+  return authRequest<SearchSuggestResponse>(`/search/suggest?${params.toString()}`, {
+    method: 'GET',
+  });
+}
+
 // Team detail endpoint.
 export function fetchTeamDetail(teamId: number) {
   return authRequest<Team>(`/teams/${teamId}`, {
@@ -398,6 +447,15 @@ export function fetchTeamDetail(teamId: number) {
   });
 }
 
+// Team multi-get endpoint with follow state.
+export function fetchTeamsBatch(ids: number[]) {
+  const params = new URLSearchParams();
+  params.set('ids', ids.join(','));
+  return authRequest<BatchResponse<Team>>(`/teams/batch?${params.toString()}`, {
+    method: 'GET',
+  });
+}
+
 // Team matches endpoint.
 export function fetchTeamMatches(teamId: number, query: TeamMatchesQuery = {}) {
   const params = new URLSearchParams();
@@ -283,6 +283,8 @@ const translations: Record<Language, Record<string, string>> = {
     'search.page.empty': 'No results yet.',
     'search.page.resultsFor': 'Results for "{query}"',
     'search.page.searchPrompt': 'Search something',
+    'search.page.h2h.title': 'Head to head',
+    'search.page.h2h.record': '{played} played · {draws} draws · goals {teamGoals}-{opponentGoals}',
     'matchDetail.score': 'Score',
     'matchDetail.avgRating': 'Average rating',
     'matchDetail.noRatings': 'No ratings yet.',
@@ -638,6 +640,8 @@ const translations: Record<Language, Record<string, string>> = {
     'search.page.empty': 'Sin resultados.',
     'search.page.resultsFor': 'Resultados para "{query}"',
     'search.page.searchPrompt': 'Busca algo',
+    'search.page.h2h.title': 'Cara a cara',
+    'search.page.h2h.record': '{played} jugados · {draws} empates · goles {teamGoals}-{opponentGoals}',
     'matchDetail.score': 'Resultado',
     'matchDetail.avgRating': 'Rating promedio',
     'matchDetail.noRatings': 'Todavia no hay ratings.',
@@ -0,0 +1,34 @@
+// Helpers for `?format=normalized` match lists (ids + side-loaded entities).
+import type {
+  FeedResponse,
+  Match,
+  NormalizedEntities,
+  NormalizedFeedResponse,
+  NormalizedMatch,
+} from './types';
+
+// Rebuilds nested Match objects from normalized rows.
+export const denormalizeMatches = (
+  rows: NormalizedMatch[],
+  entities: NormalizedEntities,
+): Match[] => {
+  return rows.map(({ tournament_id, home_team_id, away_team_id, ...rest }) => ({
+    ...rest,
+    tournament: entities.tournaments[String(tournament_id)],
+    home_team: entities.teams[String(home_team_id)],
+    away_team: entities.teams[String(away_team_id)],
+  }));
+};
+
+// Accepts either payload shape (the demo API ignores the format flag).
+export const toFeedResponse = (
+  response: FeedResponse | NormalizedFeedResponse,
+): FeedResponse => {
+  if (!('teams' in response)) {
+    return response;
+  }
+  return {
+    count: response.count,
+    results: denormalizeMatches(response.results, response),
+  };
+};
@@ -44,6 +44,8 @@ export type Rating = {
   featured_note?: string;
   featured_order?: number | null;
   featured_primary_image?: FeaturedPrimaryImage;
+  has_photo?: boolean;
+  thumbnail_url?: string | null;
   created_at: string;
 };
 
@@ -99,12 +101,39 @@ export type SearchResults = {
   matches: MatchResult[];
 };
 
+export type HeadToHead = {
+  team: TeamSummary;
+  opponent: TeamSummary;
+  played: number;
+  team_wins: number;
+  opponent_wins: number;
+  draws: number;
+  team_goals: number;
+  opponent_goals: number;
+  last_played_at: string | null;
+};
+
 export type SearchResponse = {
   q: string;
   page: number;
   page_size: number;
   total: number;
   results: SearchResults;
+  head_to_head?: HeadToHead | null;
+};
+
+export type SearchSuggestionType = 'user' | 'team' | 'league';
+
+export type SearchSuggestion = {
+  type: SearchSuggestionType;
+  id: number;
+  name: string;
+  hint: string | null;
+};
+
+export type SearchSuggestResponse = {
+  q: string;
+  results: SearchSuggestion[];
 };
 
 export type FriendsFeedMatch = {
@@ -159,6 +188,39 @@ export type FeedResponse = {
   results: Match[];
 };
 
+// Multi-get responses: requested ids map to the item or null when missing.
+export type BatchResponse<T> = {
+  results: Record<string, T | null>;
+  not_found: number[];
+};
+
+export type NormalizedMatch = Omit<
+  Match,
+  'tournament' | 'home_team' | 'away_team'
+> & {
+  tournament_id: number;
+  home_team_id: number;
+  away_team_id: number;
+};
+
+// Side-loaded entities returned with `?format=normalized`.
+export type NormalizedEntities = {
+  teams: Record<string, Team>;
+  tournaments: Record<string, Tournament>;
+};
+
+export type NormalizedFeedResponse = NormalizedEntities & {
+  count: number;
+  results: NormalizedMatch[];
+};
+
+export type NormalizedTeamMatchesResponse = NormalizedEntities & {
+  page: number;
+  page_size: number;
+  total: number;
+  results: NormalizedMatch[];
+};
+
 export type TeamsResponse = {
   count: number;
   results: Team[];
@@ -229,6 +291,26 @@ export type ProfileMemoriesResponse = {
   results: RatingWithMatch[];
 };
 
+export type ProfileBundleSection =
+  | 'profile'
+  | 'stats'
+  | 'activity'
+  | 'highlights'
+  | 'memories'
+  | 'teams';
+
+export type ProfileBundleResponse = {
+  user: UserMini;
+  range: string;
+  sections: ProfileBundleSection[];
+  profile?: ProfileResponse;
+  stats?: ProfileStatsResponse;
+  activity?: ProfileActivityResponse;
+  highlights?: ProfileHighlightsResponse;
+  memories?: ProfileMemoriesResponse;
+  teams?: TeamsResponse;
+};
+
 export type ProfileRatedResponse = {
   user: UserMini;
   results: RatingWithMatch[];